@@ -0,0 +1,360 @@
+from __future__ import print_function
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from io import BytesIO
+from optparse import OptionParser
+
+from compat import *
+
+# Builds the module at several multiples of its size and records the time
+# and memory of each export stage, for the working tree and for any git
+# revisions given, so that two versions of the compiler can be compared on
+# the same data.
+#
+# A scaled module is a copy of the module system in which module_strings,
+# module_troops, module_items, module_scripts and module_dialogs append
+# renamed copies of their own objects. Copied statement blocks use renamed
+# global variables and quick strings, so the variable and quick string tables
+# grow with the module too.
+
+module_system_dir = os.path.dirname(os.path.abspath(__file__))
+
+worktree_revision = "WORKTREE"
+
+# Exporters in build order. Every revision of the module system can run
+# them one at a time.
+stages = [
+  "process_init",
+  "process_global_variables",
+  "process_strings",
+  "process_skills",
+  "process_music",
+  "process_animations",
+  "process_meshes",
+  "process_sounds",
+  "process_skins",
+  "process_map_icons",
+  "process_factions",
+  "process_items",
+  "process_scenes",
+  "process_troops",
+  "process_particle_sys",
+  "process_scene_props",
+  "process_tableau_materials",
+  "process_presentations",
+  "process_party_tmps",
+  "process_parties",
+  "process_quests",
+  "process_info_pages",
+  "process_scripts",
+  "process_mission_tmps",
+  "process_game_menus",
+  "process_simple_triggers",
+  "process_dialogs",
+  "process_global_variables_unused",
+  "process_postfx",
+]
+
+# (module file, object list, helper that copies it)
+scaled_lists = [
+  ("module_strings.py",  "strings",  "copy_strings"),
+  ("module_troops.py",   "troops",   "copy_troops"),
+  ("module_items.py",    "items",    "copy_items"),
+  ("module_scripts.py",  "scripts",  "copy_scripts"),
+  ("module_dialogs.py",  "dialogs",  "copy_dialogs"),
+]
+
+helper_module = "benchmark_scale_helpers"
+
+helper_source = '''# Written by benchmark_module_scale.py.
+
+def copy_operand(operand, suffix):
+  if isinstance(operand, str) and operand:
+    if operand[0] == "$":
+      return operand + "_" + suffix
+    if operand[0] == "@":
+      return operand + " " + suffix
+  return operand
+
+def copy_block(block, suffix):
+  result = []
+  for statement in block:
+    if isinstance(statement, (list, tuple)):
+      statement = type(statement)([statement[0]] + [copy_operand(operand, suffix) for operand in statement[1:]])
+    result.append(statement)
+  return result
+
+def rename(entry, suffix):
+  entry = list(entry)
+  entry[0] = entry[0] + "_" + suffix
+  return entry
+
+def copy_strings(strings, suffix):
+  return [tuple(rename(string, suffix)) for string in strings]
+
+def copy_troops(troops, suffix):
+  return [type(troop)(rename(troop, suffix)) for troop in troops]
+
+def copy_items(items, suffix):
+  return [type(item)(rename(item, suffix)) for item in items]
+
+def copy_scripts(scripts, suffix):
+  result = []
+  for script in scripts:
+    script = rename(script, suffix)
+    script[-1] = copy_block(script[-1], suffix)
+    result.append(tuple(script))
+  return result
+
+def copy_dialogs(dialogs, suffix):
+  result = []
+  for dialog in dialogs:
+    dialog = list(dialog)
+    dialog[2] = copy_block(dialog[2], suffix)
+    dialog[3] = dialog[3] + " " + suffix
+    dialog[5] = copy_block(dialog[5], suffix)
+    result.append(tuple(dialog))
+  return result
+
+def scale_objects(objects, copy, scale):
+  copies = []
+  for i in range(1, scale):
+    copies.extend(copy(objects, "bench%d" % i))
+  objects.extend(copies)
+'''
+
+
+def extract_tree(revision, tree_dir):
+  """Put the module system of revision into tree_dir/Module_system."""
+  target = os.path.join(tree_dir, "Module_system")
+  if revision == worktree_revision:
+    shutil.copytree(module_system_dir, target, ignore = shutil.ignore_patterns("*.pyc", "__pycache__", "snapshots", "build_state.dat"))
+  else:
+    top_dir = subprocess.check_output(["git", "rev-parse", "--show-toplevel"], cwd = module_system_dir).decode("utf-8").strip()
+    prefix = subprocess.check_output(["git", "rev-parse", "--show-prefix"], cwd = module_system_dir).decode("utf-8").strip().rstrip("/")
+    archive = subprocess.check_output(["git", "archive", "--format=tar", "%s:%s" % (revision, prefix)], cwd = top_dir)
+    tar = tarfile.open(fileobj = BytesIO(archive))
+    tar.extractall(target)
+    tar.close()
+  os.mkdir(os.path.join(tree_dir, "out"))
+  info_path = os.path.join(target, "module_info.py")
+  file = open(info_path, "r")
+  source = file.read()
+  file.close()
+  file = open(info_path, "w")
+  file.write(re.sub(r"(?m)^export_dir *=.*$", 'export_dir = "../out/"', source))
+  file.close()
+  return target
+
+
+def scale_tree(target, scale):
+  if scale == 1:
+    return
+  file = open(os.path.join(target, helper_module + ".py"), "w")
+  file.write(helper_source)
+  file.close()
+  for (file_name, list_name, copy_function) in scaled_lists:
+    file = open(os.path.join(target, file_name), "a")
+    file.write("\n\nimport %s\n%s.scale_objects(%s, %s.%s, %d)\n" % (helper_module, helper_module, list_name, helper_module, copy_function, scale))
+    file.close()
+
+
+def run_process(args, cwd, log):
+  """Run args and return (exit code, seconds, peak memory in KB or None)."""
+  start_time = time.time()
+  process = subprocess.Popen(args, cwd = cwd, stdout = log, stderr = subprocess.STDOUT)
+  if hasattr(os, "wait4"):
+    (pid, status, usage) = os.wait4(process.pid, 0)
+    process.returncode = os.WEXITSTATUS(status)
+    peak_memory = usage.ru_maxrss
+    if sys.platform == "darwin":
+      peak_memory = peak_memory // 1024
+  else:
+    process.wait()
+    peak_memory = None
+  return (process.returncode, time.time() - start_time, peak_memory)
+
+
+def run_batch(python, target, log):
+  """Return (stage results, total seconds, peak memory in KB or None)."""
+  results = []
+  for stage in stages:
+    (exit_code, seconds, peak_memory) = run_process([python, stage + ".py"], target, log)
+    results.append({"stage": stage, "time": seconds, "peak_memory_kb": peak_memory})
+    if exit_code != 0:
+      raise RuntimeError("%s failed with exit code %d" % (stage, exit_code))
+  peak_memories = [result["peak_memory_kb"] for result in results if result["peak_memory_kb"] is not None]
+  peak_memory = None
+  if peak_memories:
+    peak_memory = max(peak_memories)
+  return (results, sum([result["time"] for result in results]), peak_memory)
+
+
+def run_driver(python, target, log):
+  """Return (stage results, total seconds, peak memory in KB or None)."""
+  profile_path = os.path.join(target, "benchmark_profile.json")
+  (exit_code, seconds, peak_memory) = run_process([python, "build_module.py", "--profile", profile_path], target, log)
+  if exit_code != 0:
+    raise RuntimeError("build_module.py failed with exit code %d" % exit_code)
+  file = open(profile_path, "r")
+  report = json.load(file)
+  file.close()
+  results = []
+  for entry in report["steps"]:
+    results.append({"stage": entry["step"], "time": entry["wall_time"]})
+  # The total includes starting up and saving the tables.
+  return (results, seconds, peak_memory)
+
+
+def benchmark_build(python, revision, scale, mode, work_dir, repeats):
+  """Return the stage results of the fastest of repeats builds."""
+  best = None
+  for i in xrange(repeats):
+    tree_dir = tempfile.mkdtemp(prefix = "scale%d_" % scale, dir = work_dir)
+    target = extract_tree(revision, tree_dir)
+    scale_tree(target, scale)
+    log = open(os.path.join(tree_dir, "build.log"), "w")
+    try:
+      try:
+        if mode == "driver":
+          (results, total_time, peak_memory) = run_driver(python, target, log)
+        else:
+          (results, total_time, peak_memory) = run_batch(python, target, log)
+      except RuntimeError as error:
+        raise RuntimeError("%s at %dx: %s (see %s)" % (revision, scale, error, log.name))
+    finally:
+      log.close()
+    if (best is None) or (total_time < best["total_time"]):
+      best = {"total_time": total_time, "peak_memory_kb": peak_memory, "stages": results}
+  return best
+
+
+def format_memory(kilobytes):
+  if kilobytes is None:
+    return "-"
+  return "%.1f" % (kilobytes / 1024.0)
+
+
+def get_stage_times(result):
+  times = {}
+  for stage in result["stages"]:
+    times[stage["stage"]] = stage["time"]
+  return times
+
+
+def print_scaling(revision, results, scales):
+  print("Revision %s (seconds per stage)" % revision)
+  header = "%-34s" % "Stage"
+  for scale in scales:
+    header += " %9s" % ("%dx" % scale)
+  if len(scales) > 1:
+    header += " %9s" % ("%dx/%dx" % (scales[-1], scales[0]))
+  print(header)
+  stage_times = [get_stage_times(results[scale]) for scale in scales]
+  for stage in [entry["stage"] for entry in results[scales[0]]["stages"]]:
+    line = "%-34s" % stage
+    for times in stage_times:
+      line += " %9.3f" % times.get(stage, 0.0)
+    if (len(scales) > 1) and (stage_times[0].get(stage, 0.0) > 0.0):
+      line += " %9.1f" % (stage_times[-1].get(stage, 0.0) / stage_times[0][stage])
+    print(line)
+  line = "%-34s" % "Total"
+  for scale in scales:
+    line += " %9.3f" % results[scale]["total_time"]
+  if len(scales) > 1:
+    line += " %9.1f" % (results[scales[-1]]["total_time"] / results[scales[0]]["total_time"])
+  print(line)
+  line = "%-34s" % "Peak MB"
+  for scale in scales:
+    line += " %9s" % format_memory(results[scale]["peak_memory_kb"])
+  print(line)
+  print()
+
+
+def print_comparison(base_revision, revision, all_results, scales):
+  print("%s against %s (seconds, ratio below 1 is faster)" % (revision, base_revision))
+  for scale in scales:
+    base = all_results[base_revision][scale]
+    other = all_results[revision][scale]
+    base_times = get_stage_times(base)
+    other_times = get_stage_times(other)
+    print("%-34s %9s %9s %7s" % ("Stage at %dx" % scale, base_revision[:9], revision[:9], "ratio"))
+    for stage in [entry["stage"] for entry in base["stages"]]:
+      if stage not in other_times:
+        continue
+      ratio = "-"
+      if base_times[stage] > 0.0:
+        ratio = "%.2f" % (other_times[stage] / base_times[stage])
+      print("%-34s %9.3f %9.3f %7s" % (stage, base_times[stage], other_times[stage], ratio))
+    print("%-34s %9.3f %9.3f %7.2f" % ("Total", base["total_time"], other["total_time"], other["total_time"] / base["total_time"]))
+    print("%-34s %9s %9s" % ("Peak MB", format_memory(base["peak_memory_kb"]), format_memory(other["peak_memory_kb"])))
+    print()
+
+
+def main():
+  parser = OptionParser(usage = "usage: %prog [options] [revision ...]",
+                        description = "Benchmark the export stages on scaled copies of the module. Each revision is a git revision "
+                                      "or " + worktree_revision + " for the working tree, which is the default. The first revision "
+                                      "is the baseline the others are compared with.")
+  parser.add_option("-s", "--scales", dest = "scales", default = "1,4,16",
+                    help = "comma separated multiples of the module size [default: %default]")
+  parser.add_option("-m", "--mode", dest = "mode", default = "batch", choices = ["batch", "driver"],
+                    help = "batch runs every exporter in its own process, driver runs build_module.py --profile [default: %default]")
+  parser.add_option("-n", "--repeats", type = "int", dest = "repeats", default = 1,
+                    help = "builds per revision and scale; the fastest is reported [default: %default]")
+  parser.add_option("-p", "--python", dest = "python", default = sys.executable,
+                    help = "interpreter to build with [default: %default]")
+  parser.add_option("-o", "--output", dest = "output", metavar = "FILE",
+                    help = "write all results to FILE as JSON")
+  parser.add_option("-w", "--work-dir", dest = "work_dir",
+                    help = "directory for the scaled trees, kept after the run [default: a temporary directory]")
+  (options, revisions) = parser.parse_args()
+  if not revisions:
+    revisions = [worktree_revision]
+  scales = [int(scale) for scale in options.scales.split(",")]
+  work_dir = options.work_dir
+  if work_dir is None:
+    work_dir = tempfile.mkdtemp(prefix = "module_scale_")
+  elif not os.path.isdir(work_dir):
+    os.makedirs(work_dir)
+
+  all_results = {}
+  try:
+    for revision in revisions:
+      all_results[revision] = {}
+      for scale in scales:
+        print("Building %s at %dx..." % (revision, scale))
+        sys.stdout.flush()
+        all_results[revision][scale] = benchmark_build(options.python, revision, scale, options.mode, work_dir, options.repeats)
+  finally:
+    if options.work_dir is None:
+      shutil.rmtree(work_dir, True)
+  print()
+
+  for revision in revisions:
+    print_scaling(revision, all_results[revision], scales)
+  for revision in revisions[1:]:
+    print_comparison(revisions[0], revision, all_results, scales)
+
+  if options.output:
+    output = {"python": options.python, "mode": options.mode, "scales": scales, "revisions": revisions, "results": {}}
+    for revision in revisions:
+      output["results"][revision] = {}
+      for scale in scales:
+        output["results"][revision][str(scale)] = all_results[revision][scale]
+    file = open(options.output, "w")
+    json.dump(output, file, indent = 2, separators = (",", ": "), sort_keys = True)
+    file.write("\n")
+    file.close()
+
+
+if __name__ == "__main__":
+  main()
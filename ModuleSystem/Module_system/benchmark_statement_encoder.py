@@ -0,0 +1,172 @@
+from __future__ import print_function
+
+import sys
+import tempfile
+import time
+from optparse import OptionParser
+
+from module_info import *
+from module_triggers import *
+from module_dialogs import *
+from module_game_menus import *
+from module_mission_templates import *
+from module_scripts import *
+from module_simple_triggers import *
+
+from process_common import *
+from process_operations import *
+from process_global_variables import compile_all_global_vars
+from process_mission_tmps import mission_template_triggers_pos
+
+# Compares save_statement_block with the encoder it replaced, which wrote
+# every opcode, operand and length field with its own ofile.write() call.
+# Both are run over every statement block of the module and must produce
+# the same bytes.
+
+
+def unbuffered_save_statement(ofile,opcode,no_variables,statement,variables,local_vars,tag_uses,quick_strings):
+  if no_variables == 0:
+    lenstatement = len(statement) - 1
+    if (is_lhs_operation(opcode) == 1):
+      if (lenstatement > 0):
+        param = statement[1]
+        if (type(param) == str):
+          if (param[0] == ':'):
+            local_vars.add_variable(param[1:])
+  else:
+    lenstatement = 0
+  ofile.write("%d %d "%(opcode, lenstatement))
+  for i in xrange(lenstatement):
+    operand = process_param(statement[i + 1],variables,local_vars,tag_uses,quick_strings)
+    ofile.write("%d "%operand)
+
+def unbuffered_save_statement_block(ofile,statement_name,can_fail_statement,statement_block,variables,tag_uses,quick_strings):
+  local_vars = VariableTable()
+  ofile.write(" %d "%(len(statement_block)))
+  store_script_param_1_uses = 0
+  store_script_param_2_uses = 0
+  current_depth = 0
+  can_fail = 0
+  for i in xrange(len(statement_block)):
+    statement = statement_block[i]
+    if ((type(statement) != list) and (type(statement) != tuple)):
+      opcode = statement
+      no_variables = 1
+    else:
+      opcode = statement[0]
+      no_variables = 0
+    if (opcode in [try_begin,
+                   try_for_range,
+                   try_for_range_backwards,
+                   try_for_parties,
+                   try_for_agents]):
+      current_depth = current_depth + 1
+    elif (opcode == try_end):
+      current_depth = current_depth - 1
+    elif (opcode == store_script_param_1 or (opcode == store_script_param and statement[2] == 1)):
+      store_script_param_1_uses = store_script_param_1_uses + 1
+    elif (opcode == store_script_param_2 or (opcode == store_script_param and statement[2] == 2)):
+      store_script_param_2_uses = store_script_param_2_uses + 1
+    elif (can_fail_statement == 0 and current_depth == 0
+          and (is_can_fail_operation(opcode)
+               or ((opcode == call_script) and (statement[1].startswith("cf_", 7))))
+          and (not statement_name.startswith("cf_"))):
+      print("WARNING: Script can fail at operation #" + str(i) + ". Use cf_ at the beginning of its name: " + statement_name)
+    unbuffered_save_statement(ofile,opcode,no_variables,statement,variables,local_vars,tag_uses,quick_strings)
+  if (store_script_param_1_uses > 1):
+    print("WARNING: store_script_param_1 is used more than once:" + statement_name)
+  if (store_script_param_2_uses > 1):
+    print("WARNING: store_script_param_2 is used more than once:" + statement_name)
+  i = 0
+  while (i < len(local_vars)):
+    if (local_vars.uses[i] == 0 and not(local_vars.names[i].startswith("unused"))):
+      print("WARNING: Local variable never used: " + local_vars.names[i] + ", at: " + str(statement_name))
+    i = i + 1
+  if (len(local_vars) > 128):
+    print("WARNING: Script uses more than 128 local wariables: " + str(statement_name) + "variables count:" + str(len(local_vars)))
+
+
+def get_statement_blocks():
+  """(statement name, can fail, statement block) for every block of the module."""
+  blocks = []
+  for func in scripts:
+    blocks.append((convert_to_identifier(func[0]), 0, func[-1]))
+  for trigger in triggers:
+    blocks.append((0, 1, trigger[trigger_conditions_pos]))
+    blocks.append((0, 1, trigger[trigger_consequences_pos]))
+  for simple_trigger in simple_triggers:
+    blocks.append((0, 1, simple_trigger[1]))
+  for dialog in dialogs:
+    blocks.append((0, 1, dialog[sentence_conditions_pos]))
+    blocks.append((0, 1, dialog[sentence_consequences_pos]))
+  for game_menu in game_menus:
+    blocks.append((0, 1, game_menu[4]))
+    for menu_item in game_menu[5]:
+      blocks.append((0, 1, menu_item[1]))
+      blocks.append((0, 1, menu_item[3]))
+  for mission_template in mission_templates:
+    for trigger in mission_template[mission_template_triggers_pos]:
+      blocks.append((0, 1, trigger[trigger_conditions_pos]))
+      blocks.append((0, 1, trigger[trigger_consequences_pos]))
+  return blocks
+
+
+def new_tables():
+  variables = VariableTable()
+  compile_all_global_vars(variables, triggers, dialogs, game_menus, mission_templates, scripts, simple_triggers)
+  return (variables, TagUseTable(), QuickStringTable())
+
+
+def encode_blocks(save_block, blocks, ofile):
+  (variables, tag_uses, quick_strings) = new_tables()
+  start_time = time.time()
+  for (statement_name, can_fail, block) in blocks:
+    save_block(ofile, statement_name, can_fail, block, variables, tag_uses, quick_strings)
+  ofile.flush()
+  return time.time() - start_time
+
+
+def time_encoder(save_block, blocks, repeats):
+  best_time = None
+  for i in xrange(repeats):
+    ofile = tempfile.TemporaryFile("w+")
+    elapsed = encode_blocks(save_block, blocks, ofile)
+    ofile.close()
+    if (best_time is None) or (elapsed < best_time):
+      best_time = elapsed
+  return best_time
+
+
+def benchmark(repeats):
+  blocks = get_statement_blocks()
+  num_statements = 0
+  for block in blocks:
+    num_statements += len(block[2])
+  stdout = sys.stdout
+  # Both encoders print the same warnings on every pass.
+  sys.stdout = StringIO()
+  try:
+    unbuffered_output = StringIO()
+    encode_blocks(unbuffered_save_statement_block, blocks, unbuffered_output)
+    buffered_output = StringIO()
+    encode_blocks(save_statement_block, blocks, buffered_output)
+    unbuffered_time = time_encoder(unbuffered_save_statement_block, blocks, repeats)
+    buffered_time = time_encoder(save_statement_block, blocks, repeats)
+  finally:
+    sys.stdout = stdout
+  if unbuffered_output.getvalue() != buffered_output.getvalue():
+    print("ERROR: Buffered and unbuffered encoders produced different output.")
+    return 1
+  print("%d statement blocks, %d statements, %d bytes" % (len(blocks), num_statements, len(buffered_output.getvalue())))
+  print("unbuffered: %.3f s" % unbuffered_time)
+  print("buffered:   %.3f s" % buffered_time)
+  print("speedup:    %.2fx" % (unbuffered_time / buffered_time))
+  return 0
+
+
+if __name__ == "__main__":
+  parser = OptionParser(usage = "usage: %prog [options]")
+  parser.add_option("-n", "--repeats", type = "int", dest = "repeats", default = 5,
+                    help = "number of timed passes for each encoder; the best one is reported")
+  (options, args) = parser.parse_args()
+  sys.exit(benchmark(options.repeats))
@@ -0,0 +1,215 @@
+import hashlib
+import os
+import re
+import sys
+
+from compat import open_text, to_bytes
+
+# What the exporters run by build_module.py read and write.
+#
+# Inputs are found by following the import statements of an exporter through
+# the module system directory. process_operations imports the module_* files
+# with an object list (process_operations.object_lists) when it resolves
+# "itm_", "trp_" ... operands, but it only needs the ids in those lists.
+# Module files reached only through it are therefore id inputs: a change to
+# them matters only if it changes get_id_signature().
+
+module_system_dir = os.path.dirname(os.path.abspath(__file__))
+
+id_resolver_module = "process_operations"
+
+# Files written by each exporter: text files in export_dir and ID_*.py
+# headers in the module system directory.
+exporter_outputs = {
+  "process_init":                     ([], []),
+  "process_global_variables":         ([], []),
+  "process_strings":                  (["strings.txt"], ["ID_strings.py"]),
+  "process_skills":                   (["skills.txt"], ["ID_skills.py"]),
+  "process_music":                    (["music.txt"], ["ID_music.py"]),
+  "process_animations":               (["actions.txt"], ["ID_animations.py"]),
+  "process_meshes":                   (["meshes.txt"], ["ID_meshes.py"]),
+  "process_sounds":                   (["sounds.txt"], ["ID_sounds.py"]),
+  "process_skins":                    (["skins.txt"], []),
+  "process_map_icons":                (["map_icons.txt"], ["ID_map_icons.py"]),
+  "process_factions":                 (["factions.txt"], ["ID_factions.py"]),
+  "process_items":                    (["item_kinds1.txt"], ["ID_items.py"]),
+  "process_scenes":                   (["scenes.txt"], ["ID_scenes.py"]),
+  "process_troops":                   (["troops.txt"], ["ID_troops.py"]),
+  "process_particle_sys":             (["particle_systems.txt"], ["ID_particle_systems.py"]),
+  "process_scene_props":              (["scene_props.txt"], ["ID_scene_props.py"]),
+  "process_tableau_materials":        (["tableau_materials.txt"], ["ID_tableau_materials.py"]),
+  "process_presentations":            (["presentations.txt"], ["ID_presentations.py"]),
+  "process_party_tmps":               (["party_templates.txt"], ["ID_party_templates.py"]),
+  "process_parties":                  (["parties.txt"], ["ID_parties.py"]),
+  "process_quests":                   (["quests.txt"], ["ID_quests.py"]),
+  "process_info_pages":               (["info_pages.txt"], ["ID_info_pages.py"]),
+  "process_scripts":                  (["scripts.txt"], ["ID_scripts.py"]),
+  "process_mission_tmps":             (["mission_templates.txt"], ["ID_mission_templates.py"]),
+  "process_game_menus":               (["menus.txt"], ["ID_menus.py"]),
+  "process_simple_triggers":          (["simple_triggers.txt"], []),
+  "process_dialogs":                  (["triggers.txt", "conversation.txt", "dialog_states.txt"], []),
+  "process_global_variables_unused":  ([], []),
+  "process_postfx":                   (["postfx.txt"], ["ID_postfx_params.py"]),
+}
+
+# Files in export_dir written by process_operations.BuildTables.save().
+table_outputs = ["variables.txt", "variable_uses.txt", "tag_uses.dat", "quick_strings.txt"]
+
+# Exporters that use the variables, tag uses or quick strings shared through
+# process_operations.BuildTables. They have to run in build order.
+table_exporters = [
+  "process_init",
+  "process_global_variables",
+  "process_map_icons",
+  "process_items",
+  "process_scenes",
+  "process_scene_props",
+  "process_tableau_materials",
+  "process_presentations",
+  "process_parties",
+  "process_scripts",
+  "process_mission_tmps",
+  "process_game_menus",
+  "process_simple_triggers",
+  "process_dialogs",
+  "process_global_variables_unused",
+]
+
+import_pattern = re.compile(r"^[ \t]*(?:from[ \t]+(\w+)[ \t]+import|import[ \t]+(\w+(?:[ \t]*,[ \t]*\w+)*))", re.M)
+
+# module name -> (modification time, imported module system modules)
+direct_imports = {}
+
+# Module files process_operations loads object lists from.
+id_resolver_imports = None
+
+# path -> (modification time, size, md5 of the contents)
+file_hashes = {}
+
+
+def get_module_path(module_name):
+  return os.path.join(module_system_dir, module_name + ".py")
+
+
+def get_direct_imports(module_name):
+  path = get_module_path(module_name)
+  mtime = os.path.getmtime(path)
+  entry = direct_imports.get(module_name)
+  if (entry is not None) and (entry[0] == mtime):
+    return entry[1]
+  file = open_text(path, "r")
+  source = file.read()
+  file.close()
+  imports = []
+  for match in import_pattern.finditer(source):
+    if match.group(1):
+      names = [match.group(1)]
+    else:
+      names = [name.strip() for name in match.group(2).split(",")]
+    for name in names:
+      if (name not in imports) and os.path.exists(get_module_path(name)):
+        imports.append(name)
+  direct_imports[module_name] = (mtime, imports)
+  return imports
+
+
+def get_id_resolver_imports():
+  global id_resolver_imports
+  if id_resolver_imports is None:
+    __import__(id_resolver_module)
+    id_resolver_imports = sys.modules[id_resolver_module].get_object_modules()
+  return id_resolver_imports
+
+
+def get_exporter_inputs(step, content_modules = ()):
+  """Return (content inputs, id inputs, uses id resolver) for an exporter.
+
+  Both input lists are sorted .py file names of the module system directory.
+  The modules of content_modules are content inputs wherever they are
+  reached, with everything they import.
+  """
+  reached = {}
+  stack = [(step, 0)]
+  while stack:
+    (module_name, id_only) = stack.pop()
+    if (module_name in reached) and (reached[module_name] <= id_only):
+      continue
+    reached[module_name] = id_only
+    imports = get_direct_imports(module_name)
+    if module_name == id_resolver_module:
+      imports = imports + get_id_resolver_imports()
+    for imported in imports:
+      if imported in content_modules:
+        stack.append((imported, 0))
+      else:
+        stack.append((imported, id_only or ((module_name == id_resolver_module) and imported.startswith("module_"))))
+  content_inputs = []
+  id_inputs = []
+  for module_name in reached:
+    if reached[module_name] and module_name.startswith("module_"):
+      id_inputs.append(module_name + ".py")
+    else:
+      content_inputs.append(module_name + ".py")
+  content_inputs.sort()
+  id_inputs.sort()
+  return (content_inputs, id_inputs, id_resolver_module in reached)
+
+
+def get_exporter_output_paths(step, export_dir):
+  (export_files, id_headers) = exporter_outputs[step]
+  paths = [export_dir + file_name for file_name in export_files]
+  paths.extend([os.path.join(module_system_dir, file_name) for file_name in id_headers])
+  return paths
+
+
+def get_export_file_names(steps):
+  """Names of the files in export_dir that a build of steps writes."""
+  file_names = list(table_outputs)
+  for step in steps:
+    file_names.extend(exporter_outputs[step][0])
+  return file_names
+
+
+def get_file_hash(path):
+  """md5 of a file's contents, or None if it does not exist."""
+  try:
+    stat = os.stat(path)
+  except OSError:
+    return None
+  entry = file_hashes.get(path)
+  if (entry is not None) and (entry[0] == stat.st_mtime) and (entry[1] == stat.st_size):
+    return entry[2]
+  file = open(path, "rb")
+  digest = hashlib.md5(file.read()).hexdigest()
+  file.close()
+  file_hashes[path] = (stat.st_mtime, stat.st_size, digest)
+  return digest
+
+
+def get_file_hashes(file_names):
+  hashes = {}
+  for file_name in file_names:
+    hashes[file_name] = get_file_hash(os.path.join(module_system_dir, file_name))
+  return hashes
+
+
+# (process_operations module, signature) of the last get_id_signature call.
+# The object lists only change when process_operations is imported again.
+id_signature = (None, None)
+
+
+def get_id_signature():
+  """Hash of the ids of every object list process_operations resolves."""
+  global id_signature
+  __import__(id_resolver_module)
+  module = sys.modules[id_resolver_module]
+  if id_signature[0] is module:
+    return id_signature[1]
+  object_tags = module.load_object_tags()
+  h = hashlib.md5()
+  for tag in sorted(object_tags.keys()):
+    h.update(to_bytes(tag + ":"))
+    for object in object_tags[tag][1]:
+      h.update(to_bytes(object[0] + "\n"))
+  id_signature = (module, h.hexdigest())
+  return id_signature[1]
@@ -0,0 +1,700 @@
+from __future__ import print_function
+
+import marshal
+import os
+import sys
+import time
+import traceback
+from optparse import OptionParser
+
+from module_info import *
+
+import build_graph
+import build_optimize
+import build_profile
+import build_release
+import build_snapshot
+from compat import *
+
+# Exporters in the order build_module.bat used to run them.
+build_steps = [
+  "process_init",
+  "process_global_variables",
+  "process_strings",
+  "process_skills",
+  "process_music",
+  "process_animations",
+  "process_meshes",
+  "process_sounds",
+  "process_skins",
+  "process_map_icons",
+  "process_factions",
+  "process_items",
+  "process_scenes",
+  "process_troops",
+  "process_particle_sys",
+  "process_scene_props",
+  "process_tableau_materials",
+  "process_presentations",
+  "process_party_tmps",
+  "process_parties",
+  "process_quests",
+  "process_info_pages",
+  "process_scripts",
+  "process_mission_tmps",
+  "process_game_menus",
+  "process_simple_triggers",
+  "process_dialogs",
+  "process_global_variables_unused",
+  "process_postfx",
+]
+
+module_system_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Hashes recorded by the last build, used by incremental builds.
+build_state_file = os.path.join(module_system_dir, "build_state.dat")
+build_state_version = 1
+
+# Modules dropped by unload_module_data. Python 2 clears the globals of a
+# module once nothing refers to it, and the shared tables still call into
+# the process_operations they were created from.
+unloaded_modules = []
+
+# Objects left out by a release build (build_release.make_plan), or None.
+release_plan = None
+
+# Passes of build_optimize.py run on the module data, in order.
+optimize_passes = []
+
+
+def read_id_headers():
+  headers = {}
+  for file_name in os.listdir(module_system_dir):
+    if file_name.startswith("ID_") and file_name.endswith(".py"):
+      file = open(os.path.join(module_system_dir, file_name), "rb")
+      headers[file_name] = file.read()
+      file.close()
+  return headers
+
+
+def remove_compiled(file_name):
+  """Delete the compiled code of a module system file that was just rewritten.
+
+  The interpreter checks compiled code against the modification time of the
+  source in whole seconds only.
+  """
+  path = os.path.join(module_system_dir, file_name)
+  compiled_paths = [path + "c"]
+  if PY3:
+    import importlib
+    import importlib.util
+    compiled_paths.append(importlib.util.cache_from_source(path))
+    importlib.invalidate_caches()
+  for compiled_path in compiled_paths:
+    try:
+      os.remove(compiled_path)
+    except OSError:
+      pass
+
+
+def unload_module_data(changed_headers):
+  # A step renumbered some objects. Every later step of the batch file ran in
+  # a fresh interpreter and saw the new ID_*.py files, so drop everything that
+  # was imported from the module system and let the next step import it again.
+  for file_name in changed_headers:
+    remove_compiled(file_name)
+  for name, module in list(sys.modules.items()):
+    if name in ("__main__", "build_module", "build_graph", "build_optimize", "build_profile", "build_release", "build_snapshot") or module is None:
+      continue
+    file_name = getattr(module, "__file__", None)
+    if file_name and os.path.dirname(os.path.abspath(file_name)) == module_system_dir:
+      unloaded_modules.append(module)
+      del sys.modules[name]
+
+
+def restore_id_headers(id_headers):
+  """Write back the headers of id_headers a build changed and unload the module data that used them."""
+  changed_headers = []
+  new_id_headers = read_id_headers()
+  for file_name in sorted(id_headers.keys()):
+    if new_id_headers.get(file_name) != id_headers[file_name]:
+      file = open(os.path.join(module_system_dir, file_name), "wb")
+      file.write(id_headers[file_name])
+      file.close()
+      changed_headers.append(file_name)
+  if changed_headers:
+    unload_module_data(changed_headers)
+
+
+def refresh_module_data(id_headers):
+  """Unload module data if an ID_*.py file changed since id_headers was read.
+
+  Returns the current ID headers.
+  """
+  new_id_headers = read_id_headers()
+  changed_headers = [file_name for file_name in new_id_headers if new_id_headers[file_name] != id_headers.get(file_name)]
+  if changed_headers:
+    unload_module_data(changed_headers)
+  return new_id_headers
+
+
+def get_profile_digest():
+  parts = []
+  if release_plan is not None:
+    parts.append(build_release.get_plan_digest(release_plan))
+  if optimize_passes:
+    parts.append(build_optimize.get_settings_digest(optimize_passes))
+  if not parts:
+    return None
+  return " ".join(parts)
+
+
+def load_build_state():
+  try:
+    file = open(build_state_file, "rb")
+  except IOError:
+    return {}
+  try:
+    try:
+      state = marshal.load(file)
+    except (EOFError, ValueError, TypeError):
+      return {}
+  finally:
+    file.close()
+  if (type(state) != type({})) or (state.get("version") != build_state_version) or (state.get("python") != sys.version) or (state.get("export_dir") != export_dir):
+    return {}
+  # Records of a build with other objects stripped do not apply.
+  if state.get("profile") != get_profile_digest():
+    return {}
+  return state.get("steps", {})
+
+
+def save_build_state(step_records):
+  state = {
+    "version": build_state_version,
+    "python": sys.version,
+    "export_dir": export_dir,
+    "profile": get_profile_digest(),
+    "steps": step_records,
+  }
+  file = open(build_state_file, "wb")
+  marshal.dump(state, file)
+  file.close()
+
+
+def get_output_hashes(step):
+  hashes = {}
+  for path in build_graph.get_exporter_output_paths(step, export_dir):
+    hashes[path] = build_graph.get_file_hash(path)
+  return hashes
+
+
+def get_step_inputs(step):
+  """Return build_graph.get_exporter_inputs() for step.
+
+  The module files the optimizer passes copy statements from are content
+  inputs of every step that reaches them.
+  """
+  return build_graph.get_exporter_inputs(step, build_optimize.get_content_modules(optimize_passes))
+
+
+def can_reuse_step(step, record, tables):
+  """Check whether the outputs the last build left for step are still valid."""
+  (content_inputs, id_inputs, uses_id_resolver) = get_step_inputs(step)
+  if build_graph.get_file_hashes(content_inputs) != record["inputs"]:
+    return 0
+  if get_output_hashes(step) != record["outputs"]:
+    return 0
+  if (record["tables_in"] is not None) and (tables.get_state_hash() != record["tables_in"]):
+    return 0
+  id_input_hashes = build_graph.get_file_hashes(id_inputs)
+  if id_input_hashes != record["id_inputs"]:
+    # Only the ids of those modules matter to this exporter.
+    if (not uses_id_resolver) or (build_graph.get_id_signature() != record["id_signature"]):
+      return 0
+    record["id_inputs"] = id_input_hashes
+  return 1
+
+
+def run_step(step, tables, on_imported = None, step_profile = None):
+  if step_profile is not None:
+    step_profile.start()
+  module = __import__(step)
+  if release_plan is not None:
+    build_release.strip_module_data(release_plan)
+  if optimize_passes and (step not in build_optimize.unoptimized_steps):
+    build_optimize.optimize_module_data(optimize_passes)
+  if step_profile is not None:
+    step_profile.imported(module)
+  if on_imported is not None:
+    on_imported(step)
+  try:
+    module.export(tables)
+  except:
+    from process_common import discard_open_outputs
+    discard_open_outputs()
+    raise
+  if step_profile is not None:
+    step_profile.finish()
+
+
+def run_recorded_step(step, tables, on_imported = None, step_profile = None):
+  """Run step and return what an incremental build needs to skip it later."""
+  (content_inputs, id_inputs, uses_id_resolver) = get_step_inputs(step)
+  record = {
+    "inputs": build_graph.get_file_hashes(content_inputs),
+    "id_inputs": build_graph.get_file_hashes(id_inputs),
+    "id_signature": None,
+  }
+  if (tables is None) or (step == "process_init"):
+    # process_init starts the tables over and is never reused.
+    run_step(step, tables, on_imported, step_profile)
+    record["tables_in"] = None
+    record["changes"] = ([], [], [], [])
+    record["outputs"] = get_output_hashes(step)
+    return record
+  tables_in = tables.get_state_hash()
+  snapshot = tables.snapshot()
+  tables.used = 0
+  run_step(step, tables, on_imported, step_profile)
+  if tables.used:
+    record["tables_in"] = tables_in
+    record["changes"] = tables.get_changes(snapshot)
+  else:
+    record["tables_in"] = None
+    record["changes"] = ([], [], [], [])
+  record["outputs"] = get_output_hashes(step)
+  return record
+
+
+def reuse_step(step, record, tables):
+  """Take over the record of step from the last build if it is still valid."""
+  if (step == "process_init") or (record is None) or not can_reuse_step(step, record, tables):
+    return None
+  print("Skipping " + step[len("process_"):] + " (unchanged).")
+  if tables is not None:
+    tables.apply_changes(record["changes"])
+  return record
+
+
+def add_id_signatures(step_records):
+  """Fill in the id signature of the steps this build ran that resolve ids.
+
+  The signature imports every object list, so it is taken once, in the
+  parent process after all steps ran, and only if a step needs it. A step
+  that reads a few module files, or a -j worker, does not load all module
+  data for it. Reused records keep the signature they were saved with.
+  """
+  for step in step_records:
+    record = step_records[step]
+    if (record["id_signature"] is None) and get_step_inputs(step)[2]:
+      record["id_signature"] = build_graph.get_id_signature()
+
+
+def new_step_profile(step, step_profiles):
+  if step_profiles is None:
+    return None
+  return build_profile.StepProfile(step, export_dir)
+
+
+def run_steps(steps, tables, old_records, step_profiles = None):
+  step_records = {}
+  id_headers = read_id_headers()
+  for step in steps:
+    record = reuse_step(step, old_records.get(step), tables)
+    if record is None:
+      step_profile = new_step_profile(step, step_profiles)
+      record = run_recorded_step(step, tables, None, step_profile)
+      if step_profile is not None:
+        step_profiles[step] = step_profile.result
+      id_headers = refresh_module_data(id_headers)
+    step_records[step] = record
+  return step_records
+
+
+def get_step_dependencies(steps):
+  """Return the earlier steps each step has to wait for.
+
+  For each step the result holds two lists: steps that have to finish first
+  and steps that only have to import their modules first. A step waits for
+  an earlier one to finish if it reads or writes a file the earlier one
+  writes, or if both use the shared tables. If it only writes a file the
+  earlier one reads, the earlier one just has to import it: exporters read
+  the module system while they are imported.
+  """
+  step_files = []
+  for step in steps:
+    (content_inputs, id_inputs, uses_id_resolver) = get_step_inputs(step)
+    (export_files, id_headers) = build_graph.exporter_outputs[step]
+    outputs = set(id_headers + [export_dir + file_name for file_name in export_files])
+    step_files.append((step, set(content_inputs + id_inputs), outputs))
+  dependencies = {}
+  for i in xrange(len(step_files)):
+    (step, inputs, outputs) = step_files[i]
+    wait_for_finish = []
+    wait_for_import = []
+    for (earlier_step, earlier_inputs, earlier_outputs) in step_files[:i]:
+      if (earlier_outputs & (inputs | outputs)) or ((step in build_graph.table_exporters) and (earlier_step in build_graph.table_exporters)):
+        wait_for_finish.append(earlier_step)
+      elif earlier_inputs & outputs:
+        wait_for_import.append(earlier_step)
+    dependencies[step] = (wait_for_finish, wait_for_import)
+  return dependencies
+
+
+# Set in each pool process by init_worker.
+worker_events = None
+worker_id_headers = None
+worker_step_profiles = None
+
+
+def init_worker(events, id_headers, snapshots, profile, trace_memory, plan, passes):
+  global release_plan
+  global optimize_passes
+  global worker_events
+  global worker_id_headers
+  global worker_step_profiles
+  worker_events = events
+  worker_id_headers = id_headers
+  release_plan = plan
+  optimize_passes = passes
+  if profile:
+    worker_step_profiles = {}
+    build_profile.trace_memory = trace_memory
+  if snapshots:
+    build_snapshot.install()
+
+
+def notify_imported(step):
+  worker_events.put(("imported", step))
+
+
+def run_worker_step(step, old_record):
+  """Run a step that does not use the shared tables in a pool process."""
+  global worker_id_headers
+  stdout = sys.stdout
+  sys.stdout = StringIO()
+  try:
+    try:
+      worker_id_headers = refresh_module_data(worker_id_headers)
+      record = reuse_step(step, old_record, None)
+      step_profile = None
+      if record is None:
+        step_profile = new_step_profile(step, worker_step_profiles)
+        record = run_recorded_step(step, None, notify_imported, step_profile)
+      if step_profile is not None:
+        worker_events.put(("finished", step, record, sys.stdout.getvalue(), step_profile.result))
+      else:
+        worker_events.put(("finished", step, record, sys.stdout.getvalue(), None))
+    except:
+      worker_events.put(("failed", step, sys.stdout.getvalue() + traceback.format_exc()))
+  finally:
+    sys.stdout = stdout
+
+
+class ParallelBuild(object):
+  """Runs the build steps on a pool of processes.
+
+  Steps that use the shared tables run in this process one after another, in
+  build order, so variables, tag uses and quick strings come out exactly as
+  in a serial build. The other steps go to the pool as soon as the steps they
+  depend on allow it. Their output is printed once they finish.
+  """
+
+  def __init__(self, steps, tables, old_records, jobs, snapshots, step_profiles = None):
+    self.steps = steps
+    self.tables = tables
+    self.old_records = old_records
+    self.jobs = jobs
+    self.snapshots = snapshots
+    self.step_profiles = step_profiles
+    self.dependencies = get_step_dependencies(steps)
+    self.waiting = list(steps)
+    self.imported = set()
+    self.finished = set()
+    self.num_running = 0
+    self.step_records = {}
+
+  def is_ready(self, step):
+    (wait_for_finish, wait_for_import) = self.dependencies[step]
+    return self.finished.issuperset(wait_for_finish) and self.imported.issuperset(wait_for_import)
+
+  def finish(self, step, record):
+    self.step_records[step] = record
+    self.imported.add(step)
+    self.finished.add(step)
+
+  def start_pool_steps(self):
+    for step in self.waiting[:]:
+      if (step not in build_graph.table_exporters) and self.is_ready(step):
+        self.waiting.remove(step)
+        self.pool.apply_async(run_worker_step, (step, self.old_records.get(step)))
+        self.num_running += 1
+
+  def on_local_step_imported(self, step):
+    self.imported.add(step)
+    self.start_pool_steps()
+
+  def run_local_step(self, step):
+    self.waiting.remove(step)
+    self.id_headers = refresh_module_data(self.id_headers)
+    record = reuse_step(step, self.old_records.get(step), self.tables)
+    if record is None:
+      step_profile = new_step_profile(step, self.step_profiles)
+      record = run_recorded_step(step, self.tables, self.on_local_step_imported, step_profile)
+      if step_profile is not None:
+        self.step_profiles[step] = step_profile.result
+    self.finish(step, record)
+
+  def handle_event(self, event):
+    if event[0] == "imported":
+      self.imported.add(event[1])
+    elif event[0] == "finished":
+      (step, record, output, profile) = event[1:]
+      sys.stdout.write(output)
+      if profile is not None:
+        self.step_profiles[step] = profile
+      self.num_running -= 1
+      self.finish(step, record)
+    else:
+      (step, output) = event[1:]
+      sys.stdout.write(output)
+      raise RuntimeError("Error while running " + step + ".")
+
+  def run(self):
+    import multiprocessing
+    self.events = multiprocessing.Queue()
+    self.id_headers = read_id_headers()
+    self.pool = multiprocessing.Pool(self.jobs, init_worker, (self.events, self.id_headers, self.snapshots, self.step_profiles is not None,
+                                                                  build_profile.trace_memory, release_plan, optimize_passes))
+    try:
+      while self.waiting or self.num_running:
+        self.start_pool_steps()
+        local_steps = [step for step in self.waiting if (step in build_graph.table_exporters) and self.is_ready(step)]
+        if local_steps:
+          self.run_local_step(local_steps[0])
+        elif self.num_running:
+          self.handle_event(self.events.get())
+    finally:
+      self.pool.terminate()
+      self.pool.join()
+    return self.step_records
+
+
+def build_module(steps = build_steps, incremental = 0, jobs = 1, snapshots = 1, profile_file = None, encode_jobs = 1, release = 0,
+                 optimize = [], profile_memory = 0):
+  global release_plan
+  global optimize_passes
+  start_time = time.time()
+  if snapshots:
+    build_snapshot.install()
+  # A watch build plans and optimizes the module data as it was loaded.
+  build_optimize.restore_module_data()
+  optimize_passes = optimize
+  release_plan = None
+  # The headers of the objects a release build strips, as they were before
+  # it numbered the remaining objects anew. They are put back afterwards, so
+  # that the next build does not import the ids of the release build.
+  release_headers = {}
+  if release:
+    release_plan = build_release.make_plan()
+    build_release.print_plan(release_plan)
+    id_headers = read_id_headers()
+    for module_name in build_release.id_headers.values():
+      if module_name + ".py" in id_headers:
+        release_headers[module_name + ".py"] = id_headers[module_name + ".py"]
+  from process_common import save_output_manifest
+  from process_operations import BuildTables
+  try:
+    tables = BuildTables(export_dir, encode_jobs)
+    if incremental:
+      old_records = load_build_state()
+    else:
+      old_records = {}
+    step_profiles = None
+    if profile_file is not None:
+      step_profiles = {}
+      build_profile.trace_memory = profile_memory
+    setup_time = time.time() - start_time
+    if jobs > 1:
+      step_records = ParallelBuild(steps, tables, old_records, jobs, snapshots, step_profiles).run()
+    else:
+      step_records = run_steps(steps, tables, old_records, step_profiles)
+    tables.save()
+    add_id_signatures(step_records)
+    save_build_state(step_records)
+    save_output_manifest(export_dir, build_graph.get_export_file_names(steps))
+  finally:
+    build_profile.stop_tracing_memory()
+    restore_id_headers(release_headers)
+  if optimize_passes:
+    build_optimize.print_report()
+  if profile_file is not None:
+    report = build_profile.make_report(steps, step_profiles, setup_time, time.time() - start_time, jobs)
+    build_profile.save_report(report, profile_file)
+    build_profile.print_summary(report)
+
+
+# Watch mode keeps the module data loaded between builds and rebuilds when a
+# source file of the module system changes. The files are polled, every
+# poll_interval seconds.
+watched_prefixes = ("module_", "header_", "ID_", "process_")
+poll_interval = 0.2
+
+
+def get_source_state():
+  state = {}
+  for file_name in os.listdir(module_system_dir):
+    if file_name.endswith(".py") and file_name.startswith(watched_prefixes):
+      try:
+        stat = os.stat(os.path.join(module_system_dir, file_name))
+      except OSError:
+        continue
+      state[file_name] = (stat.st_mtime, stat.st_size)
+  return state
+
+
+def wait_for_changes(state):
+  """Wait until some watched file changes and return (new state, changed file names)."""
+  while 1:
+    time.sleep(poll_interval)
+    new_state = get_source_state()
+    if new_state != state:
+      break
+  # Editors often write a file in several steps: wait for them to finish.
+  while 1:
+    time.sleep(poll_interval)
+    settled_state = get_source_state()
+    if settled_state == new_state:
+      break
+    new_state = settled_state
+  changed = []
+  for file_name in set(state) | set(new_state):
+    if state.get(file_name) != new_state.get(file_name):
+      changed.append(file_name)
+  changed.sort()
+  return (new_state, changed)
+
+
+def imports_any(module_name, changed_modules):
+  reached = set()
+  stack = [module_name]
+  while stack:
+    name = stack.pop()
+    if name in changed_modules:
+      return 1
+    if name not in reached:
+      reached.add(name)
+      try:
+        stack.extend(build_graph.get_direct_imports(name))
+      except OSError:
+        return 1
+  return 0
+
+
+def unload_changed_modules(changed_files):
+  """Drop the changed modules, the modules that import them and all exporters.
+
+  The exporters are cheap to import again once the module data is loaded,
+  and importing them again gives every rebuilt step fresh module globals.
+  """
+  changed_modules = set()
+  for file_name in changed_files:
+    changed_modules.add(file_name[:-len(".py")])
+    remove_compiled(file_name)
+  for name, module in list(sys.modules.items()):
+    if name in ("__main__", "build_module", "build_graph", "build_optimize", "build_profile", "build_release", "build_snapshot") or module is None:
+      continue
+    file_name = getattr(module, "__file__", None)
+    if not file_name or os.path.dirname(os.path.abspath(file_name)) != module_system_dir:
+      continue
+    if name.startswith("process_") or imports_any(name, changed_modules):
+      unloaded_modules.append(module)
+      del sys.modules[name]
+
+
+def take_written_headers(state, steps):
+  """Update state with the ID_*.py headers a build of steps just wrote."""
+  new_state = get_source_state()
+  for step in steps:
+    for file_name in build_graph.exporter_outputs[step][1]:
+      if file_name in new_state:
+        state[file_name] = new_state[file_name]
+
+
+def load_module_data(steps):
+  """Import the module system files the exporters read, other than the exporters."""
+  for step in steps:
+    (content_inputs, id_inputs, uses_id_resolver) = get_step_inputs(step)
+    for file_name in content_inputs + id_inputs:
+      if not file_name.startswith("process_"):
+        __import__(file_name[:-len(".py")])
+
+
+def watch(steps = build_steps, jobs = 1, snapshots = 1, profile_file = None, encode_jobs = 1, release = 0, optimize = [],
+          profile_memory = 0):
+  state = get_source_state()
+  build_module(steps, 1, jobs, snapshots, profile_file, encode_jobs, release, optimize, profile_memory)
+  take_written_headers(state, steps)
+  # An incremental build imports only what the steps it runs need.
+  load_module_data(steps)
+  print("Watching %s for changes. Press Ctrl+C to stop." % module_system_dir)
+  while 1:
+    (state, changed_files) = wait_for_changes(state)
+    if "module_info.py" in changed_files:
+      print("module_info.py changed: restart build_module.py to use the new export_dir.")
+    print("Changed: " + ", ".join(changed_files))
+    start_time = time.time()
+    unload_changed_modules(changed_files)
+    try:
+      build_module(steps, 1, jobs, snapshots, profile_file, encode_jobs, release, optimize, profile_memory)
+      print("Rebuilt in %.2f s." % (time.time() - start_time))
+      load_module_data(steps)
+    except Exception:
+      traceback.print_exc()
+      print("Build failed. Waiting for the next change.")
+    take_written_headers(state, steps)
+    # Nothing loaded refers to the modules dropped before this build anymore.
+    del unloaded_modules[:]
+
+
+if __name__ == "__main__":
+  parser = OptionParser(usage = "usage: %prog [options]")
+  parser.add_option("-i", "--incremental", action = "store_true", dest = "incremental", default = False,
+                    help = "skip exporters whose inputs did not change since the last build")
+  parser.add_option("-j", "--jobs", type = "int", dest = "jobs", default = 1,
+                    help = "number of processes to run independent exporters on")
+  parser.add_option("--encode-jobs", type = "int", dest = "encode_jobs", default = 1,
+                    help = "number of processes to encode scripts, dialogs and mission template triggers on")
+  parser.add_option("-w", "--watch", action = "store_true", dest = "watch", default = False,
+                    help = "keep the module data loaded and rebuild incrementally whenever a module file changes")
+  parser.add_option("--release", action = "store_true", dest = "release", default = False,
+                    help = "leave out the scripts, strings and presentations nothing in the module refers to")
+  parser.add_option("--optimize", dest = "optimize", metavar = "PASSES", default = "",
+                    help = "run the optimizer passes in the comma-separated list PASSES on the module data: %s, or all"
+                           % ", ".join(build_optimize.passes))
+  parser.add_option("--no-snapshots", action = "store_false", dest = "snapshots", default = True,
+                    help = "execute the module files instead of loading their snapshots")
+  parser.add_option("--profile", dest = "profile_file", metavar = "FILE",
+                    help = "write timings and other metrics of each exporter to FILE as JSON and print a summary")
+  parser.add_option("--profile-memory", action = "store_true", dest = "profile_memory", default = False,
+                    help = "with --profile, trace the memory each exporter allocates, which slows the build down")
+  (options, args) = parser.parse_args()
+  if options.profile_memory:
+    if options.profile_file is None:
+      parser.error("--profile-memory requires --profile")
+    if build_profile.tracemalloc is None:
+      parser.error("--profile-memory requires tracemalloc, which is not available in Python %d.%d" % sys.version_info[:2])
+  try:
+    optimize = build_optimize.parse_passes(options.optimize)
+  except ValueError as e:
+    parser.error(str(e))
+  if options.watch:
+    try:
+      watch(jobs = options.jobs, snapshots = options.snapshots, profile_file = options.profile_file, encode_jobs = options.encode_jobs,
+            release = options.release, optimize = optimize, profile_memory = options.profile_memory)
+    except KeyboardInterrupt:
+      pass
+    sys.exit(0)
+  build_module(incremental = options.incremental, jobs = options.jobs, snapshots = options.snapshots, profile_file = options.profile_file,
+               encode_jobs = options.encode_jobs, release = options.release, optimize = optimize, profile_memory = options.profile_memory)
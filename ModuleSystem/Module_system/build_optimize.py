@@ -0,0 +1,1567 @@
+from __future__ import print_function
+
+import sys
+
+from compat import *
+
+# Optimizer passes of build_module.py (--optimize).
+#
+# The passes rewrite the statement blocks of the loaded module data before an
+# exporter encodes them, the same way build_release.py strips the objects a
+# release build leaves out. The blocks are lists changed in place, so every
+# module that imported them sees the optimized data, and the lists as they
+# were loaded are kept so that a watch build can start over from them.
+# check_optimizer.py runs blocks before and after the passes and compares
+# what they do.
+#
+# The steps of unoptimized_steps, which run first, see the module data as it
+# was loaded. process_global_variables numbers the global variables in the
+# order the module data first uses them, and savegames store them by number.
+# The passes move and remove uses, so variables.txt would come out in another
+# order, and the savegames of the module would not load properly anymore.
+# A global variable whose uses the passes all removed keeps its number and
+# is reported as never used.
+#
+# peephole
+#   Removes operations that provably do nothing, without changing what a
+#   block does:
+#   - (val_add, x, 0), (val_sub, x, 0), (val_or, x, 0), (val_mul, x, 1),
+#     (val_div, x, 1) and (assign, x, x),
+#   - an (assign, x, ...) or (store_add, x, ...) whose result the next
+#     operation overwrites without reading it,
+#   - comparisons of two constants that always succeed,
+#   - whatever follows, up to the end of its try block, a comparison of
+#     constants that always fails: (eq, 1, 0) is a common way to switch
+#     code off,
+#   - the else_try branches after a branch that cannot fail,
+#   - try_begin ... try_end blocks that are empty, and the try_begin and
+#     try_end around a single branch that cannot fail,
+#   - the stores of dead_store_operation_names to a local variable that the
+#     block read only in operations removed above. The game would otherwise
+#     warn that the local is never used. A local the block never read keeps
+#     its stores, and with them the warning.
+#   An operation can fail if it is one of can_fail_operations, has the neg
+#   or this_or_next flag, or calls a script. A failure only leaves the
+#   innermost try block or loop, so those never fail themselves. Nothing is
+#   removed that changes a global variable, or a local variable that is used
+#   outside of the removed code, and blocks whose try_begin and try_end do
+#   not match are left alone. The operations of global_lhs_operations and
+#   in_place_operation_names change their first operand.
+#
+# dispatch
+#   Turns a try block whose branches start with (eq, ":x", <constant>), for
+#   at least min_dispatch_cases distinct constants, into a binary search on
+#   ":x": (lt, ":x", <pivot>) picks one half of the cases until at most
+#   max_leaf_cases are left, which are tested one after the other as before.
+#   game_receive_network_message looks for the event type of every network
+#   message this way. Branches after the cases, if any, run when ":x" is
+#   none of the constants: each run of consecutive constants is then tested
+#   first with is_between.
+#   A case whose other operations fail goes on with the branches after it.
+#   The remaining cases cannot match, so the rewrite is only made when no
+#   case sets ":x" and the branches after the cases do nothing for the
+#   constants of cases that can fail. Chains are rewritten only if that
+#   makes fewer comparisons on average.
+#
+# inline
+#   Replaces (call_script, "script_x", ...) with the operations of script_x
+#   if it has at most inline_max_operations operations (module_info.py,
+#   default_inline_max_operations if it is not set) and calls no scripts
+#   itself. store_script_param_1, store_script_param_2 and store_script_param
+#   become assignments of the arguments of the call, and the local variables
+#   of the script get names of their own in the calling block, ":x.name" for
+#   ":name" of script_x. A condition that fails at the top level of script_x
+#   made call_script fail, and inlined it fails the same try block of the
+#   caller, so cf_ scripts keep working. Calls are left alone
+#   - if the call has the neg or this_or_next flag or follows a this_or_next
+#     condition,
+#   - if the script reads a local variable that it may not have assigned,
+#     as the calling block keeps the value of the last inlined call,
+#   - if it reads more parameters than the call passes, or ignores an
+#     argument that is the only read of a local variable of the caller,
+#   - if an argument is a global variable or a register and the script
+#     changes something before it reads all of its parameters, or stores an
+#     earlier parameter in it,
+#   - if a script whose name does not start with cf_ can fail at the top
+#     level,
+#   - if the calling block would have more than max_local_variables locals.
+#   The inlined operations are then peephole optimized with the rest of the
+#   block, if that pass is on.
+#
+# hoist
+#   Moves operations at the top level of a try_for_* loop body that compute
+#   the same value in every iteration to just before the loop. These are the
+#   pure stores of peephole, store_div and store_mod by a constant other
+#   than 0, and the getters of state_getter_operation_names if the loop
+#   neither calls a script nor one of their setters. Their operands have
+#   to be constants, locals the loop does not change, or global variables
+#   the loop does not change and that no script it calls can change. The
+#   operations of global_lhs_operations and in_place_operation_names change
+#   their first operand.
+#   Registers never count as invariant: many operations store their results
+#   in them. The operation also has to be the only assignment in the loop of
+#   its destination, a local that is not used outside of the loop and not
+#   read before it is assigned. Nothing moves that can fail or has side
+#   effects. The game reports an error if the object of a getter does not
+#   exist, so a getter with variable operands only moves if the loop surely
+#   runs it: try_for_range with constant bounds, before anything that can
+#   fail. Inner loops go first, so an operation can move out of several
+#   loops.
+#
+# coalesce
+#   Merges consecutive triggers of a mission template with the same check
+#   interval, delay and rearm interval into one, so the game checks one
+#   trigger where it checked several. The game checks such triggers at the
+#   same time and in the order of the template, so the merged trigger runs
+#   the blocks of the triggers one after the other in the same order:
+#   - with no delay, it has no conditions, and its consequences are the
+#     conditions and then the consequences of each trigger, in a try block
+#     of their own if they can fail. The game rearms each trigger whose
+#     conditions held on its own, so a trigger with a rearm interval is
+#     only merged if its conditions cannot fail,
+#   - with a delay, its conditions are those of all the triggers, and its
+#     consequences theirs, each in a try block of its own if it can fail.
+#     The conditions of none of the triggers may fail.
+#   The blocks of a trigger do not share local variables, so a local that
+#   appears in several of the merged blocks gets a name of its own in each,
+#   ":name.2" and so on, as long as the merged blocks have at most
+#   max_local_variables of them. Triggers that set a trigger result, check
+#   an event that passes values in registers (register_event_names), end a
+#   block with a this_or_next condition or have unbalanced blocks are not
+#   merged. The merged blocks go through the other passes as well.
+
+passes = ["coalesce", "inline", "hoist", "peephole", "dispatch"]
+
+# Exporters that run on the module data before the passes change it.
+unoptimized_steps = ["process_init", "process_global_variables"]
+
+# Operations whose first operand x is unchanged when the second one is:
+# (val_add, x, 0) ...
+identity_operands = {
+  "val_add": 0,
+  "val_sub": 0,
+  "val_or":  0,
+  "val_mul": 1,
+  "val_div": 1,
+}
+
+# Operations that only compute their destination from their other operands.
+# They are dropped when the next operation overwrites their result.
+pure_store_operation_names = ["assign", "store_add", "store_sub", "store_mul", "store_or", "store_and"]
+
+# Operations that only store a value in a local and cannot fail. They are
+# dropped when nothing reads the local anymore.
+dead_store_operation_names = pure_store_operation_names + ["store_script_param_1", "store_script_param_2", "store_script_param",
+                                                           "store_repeat_object"]
+
+# Operations that set their destination without reading it and cannot fail.
+overwriting_operation_names = pure_store_operation_names + ["store_div", "store_mod", "store_random_in_range"]
+
+# Operations that change their first operand in place but are not in the
+# global_lhs_operations of header_operations.
+in_place_operation_names = ["val_or", "val_and", "val_abs", "val_clamp", "convert_to_fixed_point", "convert_from_fixed_point"]
+
+# neq, lt and le are eq, ge and gt with the neg flag.
+comparison_operation_names = ["eq", "gt", "ge", "is_between"]
+
+# Operations that store something of the game state that only the
+# operations listed with them change, or a script.
+state_getter_operation_names = [
+  ("troop_get_slot",          ["troop_set_slot"]),
+  ("party_get_slot",          ["party_set_slot"]),
+  ("faction_get_slot",        ["faction_set_slot"]),
+  ("scene_get_slot",          ["scene_set_slot"]),
+  ("party_template_get_slot", ["party_template_set_slot"]),
+  ("agent_get_slot",          ["agent_set_slot"]),
+  ("quest_get_slot",          ["quest_set_slot"]),
+  ("item_get_slot",           ["item_set_slot"]),
+  ("player_get_slot",         ["player_set_slot"]),
+  ("team_get_slot",           ["team_set_slot"]),
+  ("scene_prop_get_slot",     ["scene_prop_set_slot"]),
+  ("store_troop_faction",     ["troop_set_faction"]),
+  ("store_faction_of_party",  ["party_set_faction"]),
+  ("team_get_faction",        ["team_set_faction"]),
+  ("store_relation",          ["set_relation"]),
+  ("faction_get_color",       ["faction_set_color"]),
+]
+
+# Events of mission template triggers that pass values in registers. A
+# trigger before them in a merged trigger could change them.
+register_event_names = ["ti_on_agent_hit"]
+
+loop_operation_names = ["try_for_range", "try_for_range_backwards", "try_for_parties", "try_for_agents", "try_for_prop_instances",
+                        "try_for_players"]
+
+# Operands below this are numbers. Registers, variables and the like have a
+# tag above op_num_value_bits.
+constant_limit = 1 << (24 + 32)
+
+min_dispatch_cases = 8
+max_leaf_cases = 3
+
+default_inline_max_operations = 6
+
+# The game only has room for this many local variables in a block.
+max_local_variables = 128
+
+# module name -> (module, [(block, statements before optimize_module_data)])
+original_blocks = {}
+
+# module name -> [(pass, kind, name, details)] for the blocks
+# optimize_module_data changed, where details are
+#   (operations before, operations after) for peephole,
+#   (variable, number of cases, average comparisons before, after) for each
+#   chain dispatch rewrote,
+#   (operations before, operations after, {script: inlined calls}) for inline,
+#   (operations moved, loops) for hoist,
+#   (check interval, [positions of the merged triggers]) for each trigger
+#   coalesce made.
+results = {}
+
+# (module_scripts module, inline_max_operations, {script name: InlineScript})
+# of the scripts the inline pass copies, taken before any pass changed them.
+inline_scripts = (None, None, {})
+
+
+class UnbalancedBlock(Exception):
+  pass
+
+
+def get_script_blocks(scripts):
+  for script in scripts:
+    if type(script[1]) == list:
+      yield ("script", script[0], script[1])
+    else:
+      yield ("script", script[0], script[2])
+
+
+def get_trigger_blocks(triggers, name):
+  for i_trigger in xrange(len(triggers)):
+    label = "%s#%d" % (name, i_trigger)
+    yield ("trigger", label, triggers[i_trigger][3])
+    yield ("trigger", label, triggers[i_trigger][4])
+
+
+def get_simple_trigger_blocks(kind, name, triggers):
+  for i_trigger in xrange(len(triggers)):
+    yield (kind, "%s#%d" % (name, i_trigger), triggers[i_trigger][1])
+
+
+def get_mission_template_blocks(mission_templates):
+  for mission_template in mission_templates:
+    for (kind, name, block) in get_trigger_blocks(mission_template[5], mission_template[0]):
+      yield ("mission template trigger", name, block)
+
+
+def get_dialog_blocks(dialogs):
+  for i_dialog in xrange(len(dialogs)):
+    name = "%s#%d" % (dialogs[i_dialog][1], i_dialog)
+    yield ("dialog", name, dialogs[i_dialog][2])
+    yield ("dialog", name, dialogs[i_dialog][5])
+
+
+def get_game_menu_blocks(game_menus):
+  for game_menu in game_menus:
+    yield ("game menu", game_menu[0], game_menu[4])
+    for menu_item in game_menu[5]:
+      name = "%s.%s" % (game_menu[0], menu_item[0])
+      yield ("game menu", name, menu_item[1])
+      yield ("game menu", name, menu_item[3])
+
+
+def get_presentation_blocks(presentations):
+  for presentation in presentations:
+    for block in get_simple_trigger_blocks("presentation", presentation[0], presentation[3]):
+      yield block
+
+
+def get_scene_prop_blocks(scene_props):
+  for scene_prop in scene_props:
+    for block in get_simple_trigger_blocks("scene prop", scene_prop[0], scene_prop[4]):
+      yield block
+
+
+def get_item_blocks(items):
+  for item in items:
+    if len(item) > 8:
+      for block in get_simple_trigger_blocks("item", item[0], item[8]):
+        yield block
+
+
+def get_tableau_blocks(tableaus):
+  for tableau in tableaus:
+    yield ("tableau material", tableau[0], tableau[9])
+
+
+# (module, object list, function listing (kind, name, statement block) for
+# each block of the list) of the module data with statement blocks.
+block_lists = [
+  ("module_scripts",            "scripts",           get_script_blocks),
+  ("module_mission_templates",  "mission_templates", get_mission_template_blocks),
+  ("module_triggers",           "triggers",          lambda triggers: get_trigger_blocks(triggers, "")),
+  ("module_simple_triggers",    "simple_triggers",   lambda triggers: get_simple_trigger_blocks("simple trigger", "", triggers)),
+  ("module_dialogs",            "dialogs",           get_dialog_blocks),
+  ("module_game_menus",         "game_menus",        get_game_menu_blocks),
+  ("module_presentations",      "presentations",     get_presentation_blocks),
+  ("module_scene_props",        "scene_props",       get_scene_prop_blocks),
+  ("module_items",              "items",             get_item_blocks),
+  ("module_tableau_materials",  "tableaus",          get_tableau_blocks),
+]
+
+
+def parse_passes(value):
+  """The passes named in a comma-separated --optimize value, in build order."""
+  names = [name.strip() for name in value.split(",") if name.strip()]
+  if "all" in names:
+    return list(passes)
+  for name in names:
+    if name not in passes:
+      raise ValueError("Unknown optimizer pass: " + name + ". Known passes: " + ", ".join(passes) + ", all.")
+  return [name for name in passes if name in names]
+
+
+class Operations(object):
+  """The opcodes of header_operations the passes look for."""
+
+  def __init__(self):
+    import header_operations
+    self.try_begin = header_operations.try_begin
+    self.else_try = header_operations.else_try
+    self.try_end = header_operations.try_end
+    self.call_script = header_operations.call_script
+    self.flags = header_operations.neg | header_operations.this_or_next
+    self.neg = header_operations.neg
+    self.this_or_next = header_operations.this_or_next
+    self.mask = ~self.flags
+    self.loops = set([getattr(header_operations, name) for name in loop_operation_names])
+    self.lhs = frozenset(header_operations.lhs_operations)
+    self.global_lhs = self.lhs | frozenset(header_operations.global_lhs_operations)
+    # Operations that change their first operand.
+    self.writes = self.global_lhs | frozenset([getattr(header_operations, name) for name in in_place_operation_names])
+    self.can_fail = frozenset(header_operations.can_fail_operations)
+    self.identity_operands = {}
+    for name in identity_operands:
+      self.identity_operands[getattr(header_operations, name)] = identity_operands[name]
+    self.assign = header_operations.assign
+    self.eq = header_operations.eq
+    self.lt = header_operations.lt
+    self.is_between = header_operations.is_between
+    self.pure_stores = set([getattr(header_operations, name) for name in pure_store_operation_names])
+    self.overwriting = set([getattr(header_operations, name) for name in overwriting_operation_names])
+    self.dead_stores = set([getattr(header_operations, name) for name in dead_store_operation_names])
+    self.comparisons = {}
+    for name in comparison_operation_names:
+      self.comparisons[getattr(header_operations, name)] = name
+    self.divisions = set([header_operations.store_div, header_operations.store_mod])
+    self.getters = {}
+    for (name, setter_names) in state_getter_operation_names:
+      self.getters[getattr(header_operations, name)] = frozenset([getattr(header_operations, setter_name) for setter_name in setter_names])
+    self.try_for_range = header_operations.try_for_range
+    self.try_for_range_backwards = header_operations.try_for_range_backwards
+    self.store_script_param_1 = header_operations.store_script_param_1
+    self.store_script_param_2 = header_operations.store_script_param_2
+    self.store_script_param = header_operations.store_script_param
+    self.set_trigger_result = header_operations.set_trigger_result
+
+
+def get_opcode(statement):
+  if (type(statement) != list) and (type(statement) != tuple):
+    return statement
+  return statement[0]
+
+
+# A statement block is parsed into a list of nodes:
+#   ("op", index) for an operation,
+#   ("try", index of try_begin, [(index of try_begin or else_try, nodes)], index of try_end),
+#   ("loop", index of try_for_*, nodes, index of try_end),
+# where the indices are positions in the block. A pass adds operations as
+# ("new", statement), and try blocks of its own with None for the indices.
+
+def parse_nodes(block, i, ops):
+  """Parse block from i up to an else_try, a try_end or its end.
+
+  Returns (nodes, index of the statement that ended them or len(block)).
+  """
+  nodes = []
+  while i < len(block):
+    opcode = get_opcode(block[i])
+    if opcode == ops.try_begin:
+      branches = []
+      start = i
+      while 1:
+        (branch, end) = parse_nodes(block, i + 1, ops)
+        branches.append((i, branch))
+        if end >= len(block):
+          raise UnbalancedBlock()
+        i = end
+        if get_opcode(block[i]) == ops.try_end:
+          break
+      nodes.append(("try", start, branches, i))
+    elif opcode in ops.loops:
+      (body, end) = parse_nodes(block, i + 1, ops)
+      if (end >= len(block)) or (get_opcode(block[end]) != ops.try_end):
+        raise UnbalancedBlock()
+      nodes.append(("loop", i, body, end))
+      i = end
+    elif (opcode == ops.else_try) or (opcode == ops.try_end):
+      return (nodes, i)
+    else:
+      nodes.append(("op", i))
+    i += 1
+  return (nodes, i)
+
+
+def parse_block(block, ops):
+  (nodes, end) = parse_nodes(block, 0, ops)
+  if end < len(block):
+    raise UnbalancedBlock()
+  return nodes
+
+
+def flatten_nodes(nodes, indices):
+  """Add the positions in the block of the statements of nodes to indices."""
+  for node in nodes:
+    if node[0] == "op":
+      indices.append(node[1])
+    elif node[0] == "try":
+      for (start, branch) in node[2]:
+        if start is not None:
+          indices.append(start)
+        flatten_nodes(branch, indices)
+      if node[3] is not None:
+        indices.append(node[3])
+    elif node[0] == "loop":
+      indices.append(node[1])
+      flatten_nodes(node[2], indices)
+      indices.append(node[3])
+  return indices
+
+
+def get_statements(nodes, block, ops, statements):
+  """Add the statements of nodes to the list statements."""
+  for node in nodes:
+    if node[0] == "op":
+      statements.append(block[node[1]])
+    elif node[0] == "new":
+      statements.append(node[1])
+    elif node[0] == "try":
+      for (start, branch) in node[2]:
+        if start is not None:
+          statements.append(block[start])
+        elif branch is node[2][0][1]:
+          statements.append(ops.try_begin)
+        else:
+          statements.append(ops.else_try)
+        get_statements(branch, block, ops, statements)
+      if node[3] is not None:
+        statements.append(block[node[3]])
+      else:
+        statements.append(ops.try_end)
+    else:
+      statements.append(block[node[1]])
+      get_statements(node[2], block, ops, statements)
+      statements.append(block[node[3]])
+  return statements
+
+
+def get_node_statement(node, block):
+  if node[0] == "op":
+    return block[node[1]]
+  return node[1]
+
+
+class BlockInfo(object):
+  """Statements of a block and the positions each local variable appears at."""
+
+  def __init__(self, block, ops):
+    self.block = block
+    self.ops = ops
+    self.local_positions = {}
+    for i in xrange(len(block)):
+      statement = block[i]
+      if (type(statement) == list) or (type(statement) == tuple):
+        for operand in statement[1:]:
+          if (type(operand) == str) and operand.startswith(":"):
+            self.local_positions.setdefault(operand, []).append(i)
+
+  def count_reads(self, local):
+    """How often the statements of the block read local."""
+    num_reads = 0
+    for i in set(self.local_positions[local]):
+      statement = self.block[i]
+      num_reads += list(statement[1:]).count(local)
+      if (statement[0] in self.ops.lhs) and (statement[1] == local):
+        num_reads -= 1
+    return num_reads
+
+  def can_fail(self, statement):
+    opcode = get_opcode(statement)
+    if opcode & self.ops.flags:
+      return 1
+    return (opcode in self.ops.can_fail) or (opcode == self.ops.call_script)
+
+  def is_condition(self, statement):
+    """Whether statement only tests something."""
+    opcode = get_opcode(statement) & self.ops.mask
+    return (opcode in self.ops.can_fail) and (opcode not in self.ops.lhs)
+
+  def is_removable(self, nodes):
+    """Whether the statements of nodes can go without other statements noticing."""
+    indices = flatten_nodes(nodes, [])
+    index_set = set(indices)
+    for i in indices:
+      statement = self.block[i]
+      if (type(statement) != list) and (type(statement) != tuple):
+        continue
+      opcode = statement[0]
+      if (len(statement) < 2) or (type(statement[1]) != str):
+        continue
+      destination = statement[1]
+      if (opcode in self.ops.writes) and destination.startswith("$"):
+        return 0
+      if (opcode in self.ops.lhs) and destination.startswith(":"):
+        for position in self.local_positions[destination]:
+          if position not in index_set:
+            return 0
+    return 1
+
+
+def can_nodes_fail(nodes, info):
+  for node in nodes:
+    if ((node[0] == "op") or (node[0] == "new")) and info.can_fail(get_node_statement(node, info.block)):
+      return 1
+  return 0
+
+
+def is_constant(operand):
+  return (type(operand) in integer_types) and (0 <= operand < constant_limit)
+
+
+def evaluate_comparison(statement, ops):
+  """1 or 0 if statement compares constants and always succeeds or fails, else None."""
+  if (type(statement) != list) and (type(statement) != tuple):
+    return None
+  opcode = statement[0]
+  if opcode & ops.this_or_next:
+    return None
+  name = ops.comparisons.get(opcode & ops.mask)
+  if name is None:
+    return None
+  operands = statement[1:]
+  for operand in operands:
+    if not is_constant(operand):
+      return None
+  if name == "is_between":
+    if len(operands) != 3:
+      return None
+    result = operands[1] <= operands[0] < operands[2]
+  else:
+    if len(operands) != 2:
+      return None
+    (a, b) = operands
+    result = {"eq": a == b, "gt": a > b, "ge": a >= b}[name]
+  if opcode & ops.neg:
+    result = not result
+  if result:
+    return 1
+  return 0
+
+
+def is_noop(statement, ops):
+  if (type(statement) != list) and (type(statement) != tuple):
+    return 0
+  if len(statement) != 3:
+    return 0
+  opcode = statement[0]
+  if opcode == ops.assign:
+    # An assignment may be the first one of a local variable.
+    return (statement[1] == statement[2]) and not (type(statement[1]) == str and statement[1].startswith(":"))
+  identity = ops.identity_operands.get(opcode)
+  return (identity is not None) and (type(statement[2]) in integer_types) and (statement[2] == identity)
+
+
+def is_overwritten(statement, next_statement, ops):
+  """Whether next_statement replaces the result of statement without reading it."""
+  if (type(statement) != tuple) and (type(statement) != list):
+    return 0
+  if (type(next_statement) != tuple) and (type(next_statement) != list):
+    return 0
+  if (statement[0] not in ops.pure_stores) or (next_statement[0] not in ops.overwriting):
+    return 0
+  if (len(statement) < 2) or (len(next_statement) < 2):
+    return 0
+  destination = statement[1]
+  return (next_statement[1] == destination) and (destination not in next_statement[2:])
+
+
+def optimize_nodes(nodes, info):
+  """Peephole optimize a sequence of nodes that run one after the other."""
+  ops = info.ops
+  block = info.block
+  result = []
+  i_node = 0
+  while i_node < len(nodes):
+    node = nodes[i_node]
+    i_node += 1
+    if node[0] == "loop":
+      result.append(("loop", node[1], optimize_nodes(node[2], info), node[3]))
+      continue
+    if node[0] == "try":
+      result.extend(optimize_try(node, info))
+      continue
+    statement = block[node[1]]
+    # An operation after a this_or_next condition is part of the condition.
+    if result and (result[-1][0] == "op") and (get_opcode(block[result[-1][1]]) & ops.this_or_next):
+      result.append(node)
+      continue
+    if is_noop(statement, ops):
+      continue
+    if (i_node < len(nodes)) and (nodes[i_node][0] == "op") and is_overwritten(statement, block[nodes[i_node][1]], ops):
+      continue
+    value = evaluate_comparison(statement, ops)
+    if value == 1:
+      continue
+    result.append(node)
+    if (value == 0) and (i_node < len(nodes)) and info.is_removable(nodes[i_node:]):
+      break
+  return result
+
+
+def optimize_try(node, info):
+  """Peephole optimize a try_begin block and return the nodes that replace it."""
+  branches = [(start, optimize_nodes(branch, info)) for (start, branch) in node[2]]
+  # A branch that cannot fail ends the block: the branches after it never run.
+  for i_branch in xrange(len(branches)):
+    if not can_nodes_fail(branches[i_branch][1], info):
+      if (i_branch + 1 < len(branches)) and info.is_removable([("try", node[1], branches[i_branch + 1:], node[3])]):
+        branches = branches[:i_branch + 1]
+      break
+  # The last branch may as well not be there if it is empty.
+  while (len(branches) > 1) and not branches[-1][1]:
+    branches.pop()
+  if len(branches) == 1:
+    if not branches[0][1]:
+      return []
+    if not can_nodes_fail(branches[0][1], info):
+      return branches[0][1]
+  return [("try", node[1], branches, node[3])]
+
+
+def remove_dead_stores(block, read_locals, ops):
+  """Drop the stores to the locals of read_locals that block does not read."""
+  info = BlockInfo(block, ops)
+  dead_locals = set([local for local in info.local_positions if (local in read_locals) and not info.count_reads(local)])
+  if not dead_locals:
+    return block
+  new_block = []
+  for i in xrange(len(block)):
+    statement = block[i]
+    # An operation after a this_or_next condition is part of the condition.
+    if ((get_opcode(statement) in ops.dead_stores) and (len(statement) > 1) and (statement[1] in dead_locals)
+        and not ((i > 0) and (get_opcode(block[i - 1]) & ops.this_or_next))):
+      continue
+    new_block.append(statement)
+  return new_block
+
+
+def peephole_optimize_block(block, ops):
+  """Return the peephole optimized statements of block."""
+  info = BlockInfo(block, ops)
+  read_locals = set([local for local in info.local_positions if info.count_reads(local)])
+  while 1:
+    try:
+      nodes = parse_block(block, ops)
+    except UnbalancedBlock:
+      return block
+    info = BlockInfo(block, ops)
+    new_block = get_statements(optimize_nodes(nodes, info), block, ops, [])
+    new_block = remove_dead_stores(new_block, read_locals, ops)
+    if len(new_block) == len(block):
+      return block
+    block = new_block
+
+
+def is_local(operand):
+  return (type(operand) == str) and operand.startswith(":")
+
+
+def get_case(statement, ops):
+  """(local, constant) if statement is (eq, local, constant) or (eq, constant, local)."""
+  if ((type(statement) != list) and (type(statement) != tuple)) or (len(statement) != 3) or (statement[0] != ops.eq):
+    return None
+  (a, b) = statement[1:]
+  if is_local(a) and is_constant(b):
+    return (a, b)
+  if is_local(b) and is_constant(a):
+    return (b, a)
+  return None
+
+
+def get_cases(branches, info):
+  """Return (local, [(constant, branch)]) for the branches at the start of a
+  try block that compare the same local with distinct constants first.
+  """
+  variable = None
+  cases = []
+  constants = set()
+  for (start, branch) in branches:
+    if (not branch) or (branch[0][0] != "op"):
+      break
+    case = get_case(info.block[branch[0][1]], info.ops)
+    if case is None:
+      break
+    if variable is None:
+      variable = case[0]
+    if (case[0] != variable) or (case[1] in constants):
+      break
+    constants.add(case[1])
+    cases.append((case[1], branch))
+  return (variable, cases)
+
+
+def sets_variable(nodes, variable, info):
+  for node in nodes:
+    if node[0] == "try":
+      for (start, branch) in node[2]:
+        if sets_variable(branch, variable, info):
+          return 1
+      continue
+    if node[0] == "loop":
+      statement = info.block[node[1]]
+      if sets_variable(node[2], variable, info):
+        return 1
+    else:
+      statement = get_node_statement(node, info.block)
+    if ((type(statement) == list) or (type(statement) == tuple)) and (len(statement) > 1) and (statement[1] == variable):
+      if not info.is_condition(statement):
+        return 1
+  return 0
+
+
+def does_nothing_for(nodes, variable, constants, info):
+  """Whether nodes only test things while variable is one of constants."""
+  after_this_or_next = 0
+  for node in nodes:
+    if node[0] == "try":
+      for (start, branch) in node[2]:
+        if not does_nothing_for(branch, variable, constants, info):
+          return 0
+      after_this_or_next = 0
+      continue
+    if node[0] == "loop":
+      return 0
+    statement = get_node_statement(node, info.block)
+    case = get_case(statement, info.ops)
+    if (case is not None) and (case[0] == variable) and (case[1] not in constants) and not after_this_or_next:
+      # The rest of the branch never runs.
+      return 1
+    if not info.is_condition(statement):
+      return 0
+    after_this_or_next = get_opcode(statement) & info.ops.this_or_next
+  return 1
+
+
+def build_search(variable, cases, ops):
+  """Return (nodes, {constant: comparisons}) of a binary search for variable in cases."""
+  if len(cases) <= max_leaf_cases:
+    comparisons = {}
+    for i_case in xrange(len(cases)):
+      comparisons[cases[i_case][0]] = i_case + 1
+    return ([("try", None, [(None, branch) for (constant, branch) in cases], None)], comparisons)
+  middle = len(cases) // 2
+  (lower_nodes, lower_comparisons) = build_search(variable, cases[:middle], ops)
+  (upper_nodes, upper_comparisons) = build_search(variable, cases[middle:], ops)
+  comparisons = {}
+  for part in (lower_comparisons, upper_comparisons):
+    for constant in part:
+      comparisons[constant] = part[constant] + 1
+  lower_branch = [("new", (ops.lt, variable, cases[middle][0]))] + lower_nodes
+  # The upper half goes on as else_try branches of the same try block.
+  return ([("try", None, [(None, lower_branch)] + upper_nodes[0][2], None)], comparisons)
+
+
+def dispatch_try(node, info, chains):
+  """Return the node replacing the try block node, rewritten as a binary search if possible."""
+  ops = info.ops
+  branches = [(start, dispatch_nodes(branch, info, chains)) for (start, branch) in node[2]]
+  unchanged = ("try", node[1], branches, node[3])
+  (variable, cases) = get_cases(branches, info)
+  if len(cases) < min_dispatch_cases:
+    return unchanged
+  for (constant, branch) in cases:
+    if sets_variable(branch, variable, info):
+      return unchanged
+  # After a case fails, the branches after the cases run.
+  other_branches = branches[len(cases):]
+  failing = set([constant for (constant, branch) in cases if can_nodes_fail(branch[1:], info)])
+  if other_branches and failing:
+    for (start, branch) in other_branches:
+      if not does_nothing_for(branch, variable, failing, info):
+        return unchanged
+  cases = sorted(cases, key = lambda case: case[0])
+  if other_branches:
+    # Runs of consecutive constants, tested with is_between before the
+    # search, so that the other branches run for any other value.
+    runs = [[cases[0]]]
+    for case in cases[1:]:
+      if case[0] == runs[-1][-1][0] + 1:
+        runs[-1].append(case)
+      else:
+        runs.append([case])
+    runs.sort(key = lambda run: -len(run))
+    new_branches = []
+    comparisons = {}
+    for run in runs:
+      if len(run) == 1:
+        new_branches.append((None, run[0][1]))
+        comparisons[run[0][0]] = len(new_branches)
+      else:
+        (search_nodes, run_comparisons) = build_search(variable, run, ops)
+        new_branches.append((None, [("new", (ops.is_between, variable, run[0][0], run[-1][0] + 1))] + search_nodes))
+        for constant in run_comparisons:
+          comparisons[constant] = run_comparisons[constant] + len(new_branches)
+    new_node = ("try", None, new_branches + other_branches, None)
+  else:
+    (search_nodes, comparisons) = build_search(variable, cases, ops)
+    new_node = search_nodes[0]
+  comparisons_before = (len(cases) + 1) / 2.0
+  comparisons_after = sum(comparisons.values()) / float(len(cases))
+  if comparisons_after >= comparisons_before:
+    return unchanged
+  chains.append((variable, len(cases), comparisons_before, comparisons_after))
+  return new_node
+
+
+def dispatch_nodes(nodes, info, chains):
+  result = []
+  for node in nodes:
+    if node[0] == "loop":
+      result.append(("loop", node[1], dispatch_nodes(node[2], info, chains), node[3]))
+    elif node[0] == "try":
+      result.append(dispatch_try(node, info, chains))
+    else:
+      result.append(node)
+  return result
+
+
+def dispatch_block(block, ops, chains):
+  """Return block with its else_try chains on a local rewritten as binary searches.
+
+  (local, cases, average comparisons before, after) of each rewritten chain
+  is added to chains.
+  """
+  try:
+    nodes = parse_block(block, ops)
+  except UnbalancedBlock:
+    return block
+  num_chains = len(chains)
+  nodes = dispatch_nodes(nodes, BlockInfo(block, ops), chains)
+  if len(chains) == num_chains:
+    return block
+  return get_statements(nodes, block, ops, [])
+
+
+def get_inline_max_operations():
+  import module_info
+  return getattr(module_info, "inline_max_operations", default_inline_max_operations)
+
+
+def get_settings_digest(pass_names):
+  """What a build with the passes of pass_names depends on, as a string."""
+  digest = "optimize:" + ",".join(pass_names)
+  if "inline" in pass_names:
+    digest += " inline_max_operations:%d" % get_inline_max_operations()
+  return digest
+
+
+def get_content_modules(pass_names):
+  """Modules the passes of pass_names copy statements from into other module data."""
+  if "inline" in pass_names:
+    return ["module_scripts"]
+  return []
+
+
+def get_param_number(statement, ops):
+  """The number of the parameter statement stores, or None if it stores none."""
+  opcode = get_opcode(statement)
+  if opcode == ops.store_script_param_1:
+    return 1
+  if opcode == ops.store_script_param_2:
+    return 2
+  if (opcode == ops.store_script_param) and (len(statement) == 3) and is_constant(statement[2]) and (statement[2] > 0):
+    return statement[2]
+  return None
+
+
+class InlineScript(object):
+  """The statements of a script that can be inlined and what a call needs to pass."""
+
+  def __init__(self, name, block, num_params, params_first, dropped, local_names, ops):
+    self.name = name
+    self.block = block
+    self.num_params = num_params
+    # Numbers of the parameters the inlined statements read.
+    self.read_params = set()
+    # (parameter, destination) of the statements storing parameters in
+    # global variables or registers, in order.
+    self.global_params = []
+    for i in xrange(len(block)):
+      param = get_param_number(block[i], ops)
+      if (param is not None) and (i not in dropped):
+        self.read_params.add(param)
+        if not is_local(block[i][1]):
+          self.global_params.append((param, block[i][1]))
+    # Whether the parameters are stored before anything else happens.
+    self.params_first = params_first
+    # Positions of store_script_param* whose local is never read.
+    self.dropped = dropped
+    self.local_names = local_names
+
+
+def get_inline_script(name, block, ops):
+  """Return an InlineScript for the statements block of script name, or None if it cannot be inlined."""
+  try:
+    nodes = parse_block(block, ops)
+  except UnbalancedBlock:
+    return None
+  info = BlockInfo(block, ops)
+  # Positions of the top level statements, and for each the last position
+  # its destination may be read at: the try_end of a loop for its variable.
+  top_level = {}
+  for node in nodes:
+    if node[0] == "op":
+      top_level[node[1]] = len(block)
+      if (not name.startswith("cf_")) and info.can_fail(block[node[1]]):
+        return None
+    elif node[0] == "loop":
+      top_level[node[1]] = node[3]
+  # A this_or_next condition at the end would go on in the caller.
+  if block and (get_opcode(block[-1]) & ops.this_or_next):
+    return None
+  num_params = 0
+  params_first = 1
+  after_params = 0
+  for statement in block:
+    if (get_opcode(statement) & ops.mask) == ops.call_script:
+      return None
+    param = get_param_number(statement, ops)
+    if param is None:
+      if get_opcode(statement) in (ops.store_script_param, ops.store_script_param_1, ops.store_script_param_2):
+        return None
+      after_params = 1
+    else:
+      num_params = max(num_params, param)
+      if after_params:
+        params_first = 0
+  dropped = set()
+  local_names = []
+  for local in info.local_positions:
+    positions = info.local_positions[local]
+    first = positions[0]
+    statement = block[first]
+    if (statement[0] not in ops.lhs) or (statement[1] != local) or (local in statement[2:]) or (first not in top_level):
+      return None
+    if positions[-1] > top_level[first]:
+      return None
+    if not info.count_reads(local):
+      # The game warns about a local that is never read. Only a parameter
+      # nobody reads can simply go.
+      if (len(positions) > 1) or (get_param_number(statement, ops) is None):
+        return None
+      dropped.add(first)
+    else:
+      local_names.append(local)
+  local_names.sort()
+  return InlineScript(name, list(block), num_params, params_first, dropped, local_names, ops)
+
+
+def get_inline_scripts(ops):
+  """The scripts the inline pass copies, by name."""
+  global inline_scripts
+  __import__("module_scripts")
+  module = sys.modules["module_scripts"]
+  max_operations = get_inline_max_operations()
+  if (inline_scripts[0] is module) and (inline_scripts[1] == max_operations):
+    return inline_scripts[2]
+  scripts = {}
+  for (kind, name, block) in get_script_blocks(module.scripts):
+    if len(block) <= max_operations:
+      script = get_inline_script(name, block, ops)
+      if script is not None:
+        scripts[name] = script
+  inline_scripts = (module, max_operations, scripts)
+  return scripts
+
+
+def is_changing_argument(operand):
+  """Whether operand is a global variable or register a script can change."""
+  if type(operand) == str:
+    return operand.startswith("$")
+  return not is_constant(operand)
+
+
+def inline_block(block, scripts, ops, calls):
+  """Return block with its calls of scripts inlined, counting them by script in calls."""
+  info = BlockInfo(block, ops)
+  block_locals = set(info.local_positions.keys())
+  # How often the block reads each local. The game warns about a local that
+  # is never read, so an argument the script ignores must be read somewhere
+  # else.
+  reads = {}
+  for local in block_locals:
+    reads[local] = info.count_reads(local)
+  new_names = {}
+  new_block = []
+  for i in xrange(len(block)):
+    statement = block[i]
+    script = None
+    if ((type(statement) == list) or (type(statement) == tuple)) and (statement[0] == ops.call_script) and (len(statement) > 1):
+      if (type(statement[1]) == str) and statement[1].startswith("script_"):
+        script = scripts.get(statement[1][len("script_"):])
+      if (i > 0) and (get_opcode(block[i - 1]) & ops.this_or_next):
+        script = None
+    if script is not None:
+      arguments = statement[2:]
+      ignored = [arguments[i_argument] for i_argument in xrange(len(arguments))
+                 if is_local(arguments[i_argument]) and (i_argument + 1 not in script.read_params)]
+      if script.num_params > len(arguments):
+        script = None
+      elif not script.params_first:
+        for argument in arguments:
+          if is_changing_argument(argument):
+            script = None
+      else:
+        # The parameters become assignments one after the other, so none
+        # may overwrite an argument that a later one reads.
+        stored = []
+        for (param, destination) in script.global_params:
+          if arguments[param - 1] in stored:
+            script = None
+          stored.append(destination)
+      for argument in ignored:
+        if reads[argument] <= ignored.count(argument):
+          script = None
+    if script is not None:
+      names = new_names.get(script.name)
+      if names is None:
+        if len(block_locals) + len(script.local_names) > max_local_variables:
+          script = None
+        else:
+          names = {}
+          for local in script.local_names:
+            new_name = ":%s.%s" % (script.name, local[1:])
+            suffix = 1
+            while new_name in block_locals:
+              suffix += 1
+              new_name = ":%s.%s%d" % (script.name, local[1:], suffix)
+            block_locals.add(new_name)
+            names[local] = new_name
+          new_names[script.name] = names
+    if script is None:
+      new_block.append(statement)
+      continue
+    for i_statement in xrange(len(script.block)):
+      if i_statement in script.dropped:
+        continue
+      script_statement = script.block[i_statement]
+      if (type(script_statement) != list) and (type(script_statement) != tuple):
+        new_block.append(script_statement)
+        continue
+      operands = [names.get(operand, operand) if is_local(operand) else operand for operand in script_statement[1:]]
+      param = get_param_number(script_statement, ops)
+      if param is not None:
+        new_block.append((ops.assign, operands[0], arguments[param - 1]))
+      else:
+        new_block.append(tuple([script_statement[0]] + operands))
+    for argument in ignored:
+      reads[argument] -= 1
+    calls[script.name] = calls.get(script.name, 0) + 1
+  if not calls:
+    return block
+  return new_block
+
+
+def is_sure_to_loop(statement, ops):
+  """Whether the loop statement runs its body at least once."""
+  if (statement[0] != ops.try_for_range) and (statement[0] != ops.try_for_range_backwards):
+    return 0
+  return (len(statement) == 4) and is_constant(statement[2]) and is_constant(statement[3]) and (statement[2] < statement[3])
+
+
+class LoopInfo(object):
+  """What the statements of a loop change."""
+
+  def __init__(self, indices, info):
+    ops = info.ops
+    # local, global or register -> number of statements assigning it
+    self.assignments = {}
+    self.opcodes = set()
+    self.calls_script = 0
+    for i in indices:
+      statement = info.block[i]
+      if (type(statement) != list) and (type(statement) != tuple):
+        continue
+      opcode = statement[0]
+      self.opcodes.add(opcode)
+      if (opcode & ops.mask) == ops.call_script:
+        self.calls_script = 1
+      elif (opcode in ops.writes) and (len(statement) > 1):
+        self.assignments[statement[1]] = self.assignments.get(statement[1], 0) + 1
+
+  def is_invariant(self, operand):
+    """Whether operand has the same value in every iteration."""
+    if is_local(operand):
+      return not self.assignments.get(operand)
+    if (type(operand) == str) and operand.startswith("$"):
+      # Scripts may change any global variable.
+      return (not self.calls_script) and (not self.assignments.get(operand))
+    # Many operations store their results in registers without saying so,
+    # e.g. spawn_around_party in reg0.
+    return (type(operand) not in integer_types) or (operand < constant_limit)
+
+
+def is_variable(operand):
+  return ((type(operand) == str) and (operand[:1] in (":", "$"))) or ((type(operand) in integer_types) and (operand >= constant_limit))
+
+
+def can_hoist(i, loop, info, ranks, may_have_failed, sure_to_loop):
+  """Whether statement i of a loop body can run once before the loop instead."""
+  ops = info.ops
+  statement = info.block[i]
+  if ((type(statement) != list) and (type(statement) != tuple)) or (len(statement) < 3):
+    return 0
+  opcode = statement[0]
+  if opcode in ops.getters:
+    # The game reports an error if the object of a getter does not exist,
+    # so it may only run earlier if the loop would run it anyway or its
+    # operands are constants.
+    if loop.calls_script or (ops.getters[opcode] & loop.opcodes):
+      return 0
+    if may_have_failed or not sure_to_loop:
+      for operand in statement[2:]:
+        if is_variable(operand):
+          return 0
+  elif opcode in ops.divisions:
+    if (len(statement) != 4) or (not is_constant(statement[3])) or (statement[3] == 0):
+      return 0
+  elif opcode not in ops.pure_stores:
+    return 0
+  destination = statement[1]
+  if (not is_local(destination)) or (loop.assignments.get(destination) != 1) or (destination in statement[2:]):
+    return 0
+  # The destination must not be used outside of the loop, nor read before
+  # it is assigned.
+  for position in info.local_positions[destination]:
+    if (position not in ranks) or (ranks[position] < ranks[i]):
+      return 0
+  for operand in statement[2:]:
+    if not loop.is_invariant(operand):
+      return 0
+  return 1
+
+
+def hoist_loop(node, info, counts):
+  """Return the nodes replacing the loop node, with the invariant operations of its body before it."""
+  ops = info.ops
+  body = hoist_nodes(node[2], info, counts)
+  indices = flatten_nodes(body, [])
+  ranks = {}
+  for i_rank in xrange(len(indices)):
+    ranks[indices[i_rank]] = i_rank
+  loop = LoopInfo([node[1]] + indices, info)
+  sure_to_loop = is_sure_to_loop(info.block[node[1]], ops)
+  may_have_failed = 0
+  hoisted = []
+  new_body = []
+  for body_node in body:
+    if body_node[0] == "op":
+      # An operation after a this_or_next condition is part of the condition.
+      after_this_or_next = new_body and (new_body[-1][0] == "op") and (get_opcode(info.block[new_body[-1][1]]) & ops.this_or_next)
+      if (not after_this_or_next) and can_hoist(body_node[1], loop, info, ranks, may_have_failed, sure_to_loop):
+        hoisted.append(body_node)
+        loop.assignments[info.block[body_node[1]][1]] = 0
+        continue
+      if info.can_fail(info.block[body_node[1]]):
+        may_have_failed = 1
+    new_body.append(body_node)
+  if hoisted:
+    counts[0] += len(hoisted)
+    counts[1] += 1
+  return hoisted + [("loop", node[1], new_body, node[3])]
+
+
+def hoist_nodes(nodes, info, counts):
+  result = []
+  for node in nodes:
+    if node[0] == "loop":
+      result.extend(hoist_loop(node, info, counts))
+    elif node[0] == "try":
+      result.append(("try", node[1], [(start, hoist_nodes(branch, info, counts)) for (start, branch) in node[2]], node[3]))
+    else:
+      result.append(node)
+  return result
+
+
+def hoist_block(block, ops, counts):
+  """Return block with the loop invariant operations of its loops moved out of them.
+
+  counts gets the number of operations moved and of loops they were moved
+  out of added.
+  """
+  try:
+    nodes = parse_block(block, ops)
+  except UnbalancedBlock:
+    return block
+  num_hoisted = counts[0]
+  nodes = hoist_nodes(nodes, BlockInfo(block, ops), counts)
+  if counts[0] == num_hoisted:
+    return block
+  return get_statements(nodes, block, ops, [])
+
+
+def can_block_fail(block, ops):
+  """Whether a statement at the top level of block can fail, or None if block cannot be merged."""
+  if (type(block) != list) and (type(block) != tuple):
+    return None
+  try:
+    nodes = parse_block(block, ops)
+  except UnbalancedBlock:
+    return None
+  if block and (get_opcode(block[-1]) & ops.this_or_next):
+    return None
+  for statement in block:
+    if get_opcode(statement) == ops.set_trigger_result:
+      return None
+  return can_nodes_fail(nodes, BlockInfo(block, ops))
+
+
+def get_trigger_merge(trigger, ops, register_events):
+  """Return (conditions can fail, consequences can fail) of trigger, or None if it cannot be merged."""
+  if (len(trigger) != 5) or (trigger[0] in register_events):
+    return None
+  conditions_can_fail = can_block_fail(trigger[3], ops)
+  consequences_can_fail = can_block_fail(trigger[4], ops)
+  if (conditions_can_fail is None) or (consequences_can_fail is None):
+    return None
+  # The game delays and rearms each trigger whose conditions held on its own.
+  if conditions_can_fail and (trigger[1] or trigger[2]):
+    return None
+  return (conditions_can_fail, consequences_can_fail)
+
+
+def get_block_locals(block):
+  local_names = set()
+  for statement in block:
+    if (type(statement) == list) or (type(statement) == tuple):
+      for operand in statement[1:]:
+        if is_local(operand):
+          local_names.add(operand)
+  return local_names
+
+
+def rename_locals(block, block_locals, used_locals):
+  """Return block with its locals that are in used_locals renamed, adding the new names to used_locals."""
+  names = {}
+  for local in sorted(block_locals):
+    if local in used_locals:
+      suffix = 2
+      new_name = ":%s.%d" % (local[1:], suffix)
+      while (new_name in used_locals) or (new_name in block_locals):
+        suffix += 1
+        new_name = ":%s.%d" % (local[1:], suffix)
+      used_locals.add(new_name)
+      names[local] = new_name
+  used_locals.update([local for local in block_locals if local not in names])
+  if not names:
+    return list(block)
+  new_block = []
+  for statement in block:
+    if (type(statement) == list) or (type(statement) == tuple):
+      new_block.append(tuple([statement[0]] + [names.get(operand, operand) if is_local(operand) else operand
+                                                for operand in statement[1:]]))
+    else:
+      new_block.append(statement)
+  return new_block
+
+
+def merge_triggers(triggers, merges, ops):
+  """Return one trigger that does what triggers do, one after the other."""
+  (check_interval, delay, rearm) = triggers[0][:3]
+  used_locals = set()
+  blocks = []
+  for trigger in triggers:
+    blocks.append(rename_locals(trigger[3], get_block_locals(trigger[3]), used_locals))
+    blocks.append(rename_locals(trigger[4], get_block_locals(trigger[4]), used_locals))
+  conditions = []
+  consequences = []
+  for i_trigger in xrange(len(triggers)):
+    (conditions_block, consequences_block) = blocks[2 * i_trigger:2 * i_trigger + 2]
+    (conditions_can_fail, consequences_can_fail) = merges[i_trigger]
+    is_last = (i_trigger == len(triggers) - 1)
+    if delay:
+      conditions.extend(conditions_block)
+      statements = consequences_block
+      can_fail = consequences_can_fail
+    else:
+      statements = conditions_block + consequences_block
+      can_fail = conditions_can_fail or consequences_can_fail
+    if can_fail and not is_last:
+      consequences.append(ops.try_begin)
+      consequences.extend(statements)
+      consequences.append(ops.try_end)
+    else:
+      consequences.extend(statements)
+  return (check_interval, delay, rearm, conditions, consequences)
+
+
+def count_merged_locals(triggers):
+  return sum([len(get_block_locals(trigger[3])) + len(get_block_locals(trigger[4])) for trigger in triggers])
+
+
+def coalesce_triggers(triggers, ops, register_events, merged):
+  """Return triggers with runs of mergeable triggers merged, adding the positions of each run to merged."""
+  new_triggers = []
+  i_trigger = 0
+  while i_trigger < len(triggers):
+    trigger = triggers[i_trigger]
+    merge = get_trigger_merge(trigger, ops, register_events)
+    run = [trigger]
+    merges = [merge]
+    if merge is not None:
+      while i_trigger + len(run) < len(triggers):
+        next_trigger = triggers[i_trigger + len(run)]
+        if tuple(next_trigger[:3]) != tuple(trigger[:3]):
+          break
+        next_merge = get_trigger_merge(next_trigger, ops, register_events)
+        if (next_merge is None) or (count_merged_locals(run + [next_trigger]) > max_local_variables):
+          break
+        run.append(next_trigger)
+        merges.append(next_merge)
+    if len(run) > 1:
+      new_triggers.append(merge_triggers(run, merges, ops))
+      merged.append((trigger[0], list(xrange(i_trigger, i_trigger + len(run)))))
+    else:
+      new_triggers.append(trigger)
+    i_trigger += len(run)
+  return new_triggers
+
+
+def coalesce_mission_templates(mission_templates, ops, originals, module_results):
+  """Merge the triggers of mission_templates in place, adding the lists as they were to originals."""
+  import header_triggers
+  register_events = set([getattr(header_triggers, name) for name in register_event_names])
+  seen = set()
+  for mission_template in mission_templates:
+    triggers = mission_template[5]
+    if (type(triggers) != list) or (id(triggers) in seen):
+      continue
+    seen.add(id(triggers))
+    merged = []
+    new_triggers = coalesce_triggers(triggers, ops, register_events, merged)
+    if merged:
+      originals.append((triggers, triggers[:]))
+      triggers[:] = new_triggers
+      for (check_interval, positions) in merged:
+        module_results.append(("coalesce", "mission template", mission_template[0], (check_interval, positions)))
+
+
+def optimize_block(block, pass_names, ops, module_results, kind, name):
+  """Return block after the passes of pass_names, adding what they did to module_results."""
+  if "inline" in pass_names:
+    calls = {}
+    new_block = inline_block(block, get_inline_scripts(ops), ops, calls)
+    if calls:
+      module_results.append(("inline", kind, name, (len(block), len(new_block), calls)))
+    block = new_block
+  if "hoist" in pass_names:
+    counts = [0, 0]
+    block = hoist_block(block, ops, counts)
+    if counts[0]:
+      module_results.append(("hoist", kind, name, tuple(counts)))
+  if "peephole" in pass_names:
+    new_block = peephole_optimize_block(block, ops)
+    if len(new_block) != len(block):
+      module_results.append(("peephole", kind, name, (len(block), len(new_block))))
+    block = new_block
+  if "dispatch" in pass_names:
+    chains = []
+    block = dispatch_block(block, ops, chains)
+    for chain in chains:
+      module_results.append(("dispatch", kind, name, chain))
+  return block
+
+
+def optimize_module_data(pass_names):
+  """Run the optimizer passes on the module data loaded since the last call."""
+  if not pass_names:
+    return
+  ops = None
+  for (module_name, list_name, get_blocks) in block_lists:
+    module = sys.modules.get(module_name)
+    if module is None:
+      continue
+    entry = original_blocks.get(module_name)
+    if (entry is not None) and (entry[0] is module):
+      continue
+    if ops is None:
+      ops = Operations()
+    originals = []
+    module_results = []
+    if ("coalesce" in pass_names) and (module_name == "module_mission_templates"):
+      coalesce_mission_templates(module.mission_templates, ops, originals, module_results)
+    seen = set()
+    for (kind, name, block) in get_blocks(getattr(module, list_name)):
+      if (type(block) != list) or (id(block) in seen):
+        continue
+      seen.add(id(block))
+      new_block = optimize_block(block, pass_names, ops, module_results, kind, name)
+      if new_block is not block:
+        originals.append((block, block[:]))
+        block[:] = new_block
+    original_blocks[module_name] = (module, originals)
+    results[module_name] = module_results
+
+
+def restore_module_data():
+  """Put back the statement blocks as they were loaded."""
+  for module_name in list(original_blocks.keys()):
+    (module, originals) = original_blocks.pop(module_name)
+    if sys.modules.get(module_name) is module:
+      for (block, statements) in reversed(originals):
+        block[:] = statements
+  results.clear()
+
+
+def get_object_name(kind, name):
+  if kind == "script":
+    return "script_" + name
+  return kind + " " + name
+
+
+def get_count_text(count, noun):
+  if count == 1:
+    return "1 " + noun
+  return "%d %ss" % (count, noun)
+
+
+def get_site_name(site):
+  (object_name, num_calls) = site
+  if num_calls == 1:
+    return object_name
+  return "%s x%d" % (object_name, num_calls)
+
+
+def get_check_text(check_interval, event_names):
+  if check_interval == 0:
+    return "every frame"
+  if check_interval > 0:
+    return "every %g s" % check_interval
+  return "on " + event_names.get(check_interval, "%g" % check_interval)
+
+
+def get_event_names():
+  """The ti_* names of the trigger events, by their check interval."""
+  import header_triggers
+  event_names = {}
+  for name in sorted(dir(header_triggers)):
+    value = getattr(header_triggers, name)
+    if name.startswith("ti_") and ((type(value) in integer_types) or (type(value) == float)) and (value < 0):
+      event_names.setdefault(value, name)
+  return event_names
+
+
+def print_report():
+  totals = {}
+  scripts = []
+  chains = []
+  loops = []
+  coalesced = []
+  inlined = {}
+  inline_totals = [0, 0, 0]
+  for (module_name, list_name, get_blocks) in block_lists:
+    for (pass_name, kind, name, details) in results.get(module_name, []):
+      if pass_name == "peephole":
+        (num_before, num_after) = details
+        total = totals.setdefault(kind, [0, 0])
+        total[0] += 1
+        total[1] += num_before - num_after
+        if kind == "script":
+          scripts.append((num_before - num_after, name, num_before))
+      elif pass_name == "dispatch":
+        chains.append((get_object_name(kind, name),) + details)
+      elif pass_name == "hoist":
+        loops.append((get_object_name(kind, name),) + details)
+      elif pass_name == "coalesce":
+        if coalesced and (coalesced[-1][0] == name):
+          coalesced[-1][1].append(details)
+        else:
+          coalesced.append((name, [details]))
+      else:
+        (num_before, num_after, calls) = details
+        inline_totals[0] += 1
+        inline_totals[1] += num_before
+        inline_totals[2] += num_after
+        object_name = get_object_name(kind, name)
+        for script_name in calls:
+          sites = inlined.setdefault(script_name, [])
+          if sites and (sites[-1][0] == object_name):
+            sites[-1][1] += calls[script_name]
+          else:
+            sites.append([object_name, calls[script_name]])
+  if inlined:
+    script_calls = {}
+    for script_name in inlined:
+      script_calls[script_name] = sum([num for (object_name, num) in inlined[script_name]])
+    print("Optimizer: inlined %d calls of %d scripts, %d blocks grew from %d to %d operations (+%d):"
+          % (sum(script_calls.values()), len(inlined), inline_totals[0], inline_totals[1], inline_totals[2],
+             inline_totals[2] - inline_totals[1]))
+    for script_name in sorted(inlined.keys(), key = lambda script_name: (-script_calls[script_name], script_name)):
+      print("  script_%s (%d operations): %s in %s" % (script_name, len(inline_scripts[2][script_name].block),
+                                                     get_count_text(script_calls[script_name], "call"),
+                                                     ", ".join([get_site_name(site) for site in inlined[script_name]])))
+  if loops:
+    print("Optimizer: moved %s out of %s:" % (get_count_text(sum([loop[1] for loop in loops]), "loop invariant operation"),
+                                              get_count_text(sum([loop[2] for loop in loops]), "loop")))
+    for (object_name, num_operations, num_loops) in loops:
+      print("  %s: %s out of %s" % (object_name, get_count_text(num_operations, "operation"), get_count_text(num_loops, "loop")))
+  if coalesced:
+    event_names = get_event_names()
+    num_triggers = 0
+    num_merged = 0
+    # Trigger checks saved every frame, every second and on every event.
+    saved = [0, 0.0, 0]
+    for (name, merges) in coalesced:
+      for (check_interval, positions) in merges:
+        num_triggers += len(positions)
+        num_merged += 1
+        if check_interval == 0:
+          saved[0] += len(positions) - 1
+        elif check_interval > 0:
+          saved[1] += (len(positions) - 1) / float(check_interval)
+        else:
+          saved[2] += len(positions) - 1
+    savings = []
+    if saved[0]:
+      savings.append("%d every frame" % saved[0])
+    if saved[1]:
+      savings.append("%.1f every second" % saved[1])
+    if saved[2]:
+      savings.append("%d per event" % saved[2])
+    print("Optimizer: merged %d mission template triggers into %d, trigger checks saved: %s."
+          % (num_triggers, num_merged, ", ".join(savings)))
+    for (name, merges) in coalesced:
+      print("  %s: %s" % (name, ", ".join(["+".join(["#%d" % position for position in positions]) + " " +
+                                            get_check_text(check_interval, event_names)
+                                            for (check_interval, positions) in merges])))
+  if totals:
+    print("Optimizer: removed " + ", ".join(["%d operations from %d %s blocks" % (totals[kind][1], totals[kind][0], kind)
+                                             for kind in sorted(totals.keys())]) + ".")
+    scripts.sort(key = lambda script: (-script[0], script[1]))
+    for (num_removed, name, num_before) in scripts:
+      print("  script_%s: %d of %d operations removed" % (name, num_removed, num_before))
+  if chains:
+    print("Optimizer: %d else_try chains turned into binary searches, average comparisons before -> after:" % len(chains))
+    for (object_name, variable, num_cases, comparisons_before, comparisons_after) in chains:
+      print("  %s: %d cases of %s, %.1f -> %.1f" % (object_name, num_cases, variable, comparisons_before, comparisons_after))
+  if not (totals or chains or inlined or loops or coalesced):
+    print("Optimizer: nothing to change.")
@@ -0,0 +1,241 @@
+from __future__ import print_function
+
+import json
+import os
+import sys
+import time
+
+try:
+  import resource
+except ImportError:
+  resource = None
+
+try:
+  import tracemalloc
+except ImportError:
+  tracemalloc = None
+
+import build_graph
+
+# Per-exporter metrics for build_module.py --profile.
+#
+# For every exporter that runs, the profile records the wall time, the time
+# spent importing it and the module data, the number of objects it exports,
+# the statements and operands it encoded, the hits and misses of the operand
+# cache and the size of each file it wrote. The slowest statement blocks timed
+# with process_operations.get_encode_timer (scripts and mission template
+# triggers) are kept as well, and so is the peak memory of the build process.
+#
+# The peak memory of the process says little about a single exporter, since
+# the module data is loaded before the first one runs. With
+# build_module.py --profile-memory, tracemalloc traces the allocations of
+# each exporter and the profile records the most it held at once on top of
+# what was allocated when it started. Tracing makes the build many times
+# slower, so the wall times of such a profile are not comparable with others.
+
+# Module data list that each exporter writes out, looked up in the exporter's
+# namespace to count the objects it processed.
+exported_objects = {
+  "process_strings":            "strings",
+  "process_skills":             "skills",
+  "process_music":              "tracks",
+  "process_animations":         "animations",
+  "process_meshes":             "meshes",
+  "process_sounds":             "sounds",
+  "process_skins":              "skins",
+  "process_map_icons":          "map_icons",
+  "process_factions":           "factions",
+  "process_items":              "items",
+  "process_scenes":             "scenes",
+  "process_troops":             "troops",
+  "process_particle_sys":       "particle_systems",
+  "process_scene_props":        "scene_props",
+  "process_tableau_materials":  "tableaus",
+  "process_presentations":      "presentations",
+  "process_party_tmps":         "party_templates",
+  "process_parties":            "parties",
+  "process_quests":             "quests",
+  "process_info_pages":         "info_pages",
+  "process_scripts":            "scripts",
+  "process_mission_tmps":       "mission_templates",
+  "process_game_menus":         "game_menus",
+  "process_simple_triggers":    "simple_triggers",
+  "process_dialogs":            "dialogs",
+  "process_postfx":             "postfx_params",
+}
+
+num_slowest_blocks = 20
+
+# Set by build_module.py --profile-memory, in the worker processes as well.
+trace_memory = 0
+
+
+def get_peak_memory():
+  """Peak resident set size of this process in KB, or None if unknown."""
+  if resource is None:
+    return None
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  if sys.platform == "darwin":
+    peak = peak // 1024
+  return peak
+
+
+def start_tracing_memory():
+  """Start tracing or reset the peak and return the traced bytes, or None."""
+  if (not trace_memory) or (tracemalloc is None):
+    return None
+  if not tracemalloc.is_tracing():
+    tracemalloc.start()
+  if hasattr(tracemalloc, "reset_peak"):
+    tracemalloc.reset_peak()
+  else:
+    # Before Python 3.9 only clearing the traces resets the peak.
+    tracemalloc.clear_traces()
+  return tracemalloc.get_traced_memory()[0]
+
+
+def stop_tracing_memory():
+  if (tracemalloc is not None) and tracemalloc.is_tracing():
+    tracemalloc.stop()
+
+
+def get_step_memory(start_memory):
+  """Peak KB allocated on top of start_memory since start_tracing_memory."""
+  if start_memory is None:
+    return None
+  return max(tracemalloc.get_traced_memory()[1] - start_memory, 0) // 1024
+
+
+class StepProfile(object):
+  """Collects the metrics of one exporter run.
+
+  build_module.run_step calls start() before importing the exporter,
+  imported() once the import is done and finish() after export() returns.
+  """
+
+  def __init__(self, step, export_dir):
+    self.step = step
+    self.export_dir = export_dir
+    self.operations = None
+
+  def start(self):
+    self.start_memory = start_tracing_memory()
+    self.start_time = time.time()
+
+  def imported(self, module):
+    self.import_time = time.time() - self.start_time
+    self.module = module
+    # The exporter encodes with the process_operations it just imported,
+    # which is a new module after build_module.py reloaded module data.
+    self.operations = sys.modules.get("process_operations")
+    if self.operations is not None:
+      self.counts_before = list(self.operations.encoder_counts)
+      del self.operations.encode_times[:]
+      self.operations.time_encoding = 1
+
+  def finish(self):
+    wall_time = time.time() - self.start_time
+    self.result = {
+      "step": self.step,
+      "wall_time": wall_time,
+      "import_time": self.import_time,
+      "objects": None,
+      "statements": 0,
+      "operands": 0,
+      "operand_cache_hits": 0,
+      "operand_cache_misses": 0,
+      "output_bytes": {},
+      "peak_memory_kb": get_step_memory(self.start_memory),
+      "slowest_blocks": [],
+    }
+    if self.step in exported_objects:
+      self.result["objects"] = len(getattr(self.module, exported_objects[self.step]))
+    if self.operations is not None:
+      self.operations.time_encoding = 0
+      self.result["statements"] = self.operations.encoder_counts[0] - self.counts_before[0]
+      self.result["operands"] = self.operations.encoder_counts[1] - self.counts_before[1]
+      self.result["operand_cache_hits"] = self.operations.encoder_counts[2] - self.counts_before[2]
+      self.result["operand_cache_misses"] = self.operations.encoder_counts[3] - self.counts_before[3]
+      # Blocks encoded by process_operations.encode_statement_blocks are timed
+      # in the workers and their writes in the exporter, under the same name.
+      block_times = {}
+      for (kind, name, seconds) in self.operations.encode_times:
+        block_times[(kind, name)] = block_times.get((kind, name), 0) + seconds
+      encode_times = sorted(block_times.items(), key = lambda entry: -entry[1])
+      for ((kind, name), seconds) in encode_times[:num_slowest_blocks]:
+        self.result["slowest_blocks"].append({"kind": kind, "name": name, "seconds": seconds})
+      del self.operations.encode_times[:]
+    for path in build_graph.get_exporter_output_paths(self.step, self.export_dir):
+      try:
+        self.result["output_bytes"][os.path.basename(path)] = os.path.getsize(path)
+      except OSError:
+        pass
+    return self.result
+
+
+def make_report(steps, step_profiles, setup_time, total_time, jobs):
+  report_steps = []
+  for step in steps:
+    if step in step_profiles:
+      report_steps.append(step_profiles[step])
+    else:
+      report_steps.append({"step": step, "reused": True})
+  return {
+    "python": sys.version,
+    "jobs": jobs,
+    "setup_time": setup_time,
+    "total_time": total_time,
+    "peak_memory_kb": get_peak_memory(),
+    "steps": report_steps,
+  }
+
+
+def save_report(report, path):
+  file = open(path, "w")
+  json.dump(report, file, indent = 2, separators = (",", ": "), sort_keys = True)
+  file.write("\n")
+  file.close()
+
+
+def format_memory(kilobytes):
+  if kilobytes is None:
+    return "-"
+  return "%.1f" % (kilobytes / 1024.0)
+
+
+def format_hit_rate(hits, misses):
+  if hits + misses == 0:
+    return "-"
+  return "%.1f" % (100.0 * hits / (hits + misses))
+
+
+def print_summary(report):
+  print("%-34s %8s %8s %8s %10s %10s %7s %10s %8s" % ("Exporter", "Wall s", "Import s", "Objects", "Statements", "Operands", "Hit %",
+                                                     "Bytes", "Step MB"))
+  cache_hits = 0
+  cache_misses = 0
+  for entry in report["steps"]:
+    if entry.get("reused"):
+      print("%-34s %8s" % (entry["step"], "reused"))
+      continue
+    objects = "-"
+    if entry["objects"] is not None:
+      objects = str(entry["objects"])
+    cache_hits += entry["operand_cache_hits"]
+    cache_misses += entry["operand_cache_misses"]
+    print("%-34s %8.3f %8.3f %8s %10d %10d %7s %10d %8s" % (entry["step"], entry["wall_time"], entry["import_time"], objects,
+                                                           entry["statements"], entry["operands"],
+                                                           format_hit_rate(entry["operand_cache_hits"], entry["operand_cache_misses"]),
+                                                           sum(entry["output_bytes"].values()), format_memory(entry["peak_memory_kb"])))
+  if cache_hits + cache_misses:
+    print("Operand cache: %d hits, %d misses, %s%% hit rate" % (cache_hits, cache_misses, format_hit_rate(cache_hits, cache_misses)))
+  print("Total: %.3f s with %d job(s), %.3f s before the first exporter, process peak memory %s MB" % (report["total_time"], report["jobs"], report["setup_time"],
+                                                                                           format_memory(report["peak_memory_kb"])))
+  slowest_blocks = []
+  for entry in report["steps"]:
+    slowest_blocks.extend(entry.get("slowest_blocks", []))
+  if slowest_blocks:
+    slowest_blocks.sort(key = lambda block: -block["seconds"])
+    print("Slowest statement blocks:")
+    for block in slowest_blocks[:num_slowest_blocks]:
+      print("  %8.4f s  %s %s" % (block["seconds"], block["kind"], block["name"]))
@@ -0,0 +1,309 @@
+from __future__ import print_function
+
+import fnmatch
+import hashlib
+import os
+import re
+import sys
+
+import build_graph
+from compat import *
+
+# Release profile of build_module.py (--release).
+#
+# A release build leaves out the scripts, strings and presentations nothing
+# in the module refers to. The exporters then number the remaining objects
+# from 0 as usual, so every file they write, the ID_*.py headers and the
+# quick strings and variables collected while encoding agree on the new ids.
+#
+# An object is kept if it is reachable from a root:
+#   - objects matching a pattern of keep_patterns or of release_keep in
+#     module_info.py: the engine calls game_* scripts and presentations by
+#     name,
+#   - the first num_hardwired_strings strings, which the engine uses by index,
+#   - every "script_", "str_" and "prsnt_" operand anywhere in the other
+#     module data: dialogs, menus, mission templates, triggers, simple
+#     triggers, items, scene props, tableaus ... Their ti_* triggers are
+#     never stripped, so everything they call stays.
+# Scripts and presentations refer to more objects with their own operands.
+#
+# The module also reaches objects by offset: (store_add, ":string",
+# "str_npc1_intro", ":npc") picks one of a run of strings that nothing names
+# directly. Any operand used by an operation that does not simply use the
+# object it names (see direct_operation_names) may be such a base. All
+# objects from a base up to the next base of the same tag are kept, which
+# keeps more than needed but never breaks a table.
+
+# (tag, module, object list) of the lists the release profile strips.
+stripped_lists = [
+  ("script", "module_scripts",       "scripts"),
+  ("str",    "module_strings",       "strings"),
+  ("prsnt",  "module_presentations", "presentations"),
+]
+
+# Headers that define the stripped ids as Python names. Module files that
+# import one of them directly or through a header are scanned for its names,
+# which are numbers by the time the module data is loaded.
+id_headers = {
+  "script": "ID_scripts",
+  "str":    "ID_strings",
+  "prsnt":  "ID_presentations",
+}
+
+keep_patterns = ["script_game_*", "script_wse_*", "prsnt_game_*"]
+
+num_hardwired_strings = 4
+
+# Operations that use the object an operand names and nothing near it.
+direct_operation_names = [
+  "call_script",
+  "start_presentation",
+  "start_background_presentation",
+  "is_presentation_active",
+  "str_store_string",
+  "display_message",
+  "display_log_message",
+  "eq",
+  "neq",
+  "create_text_overlay",
+  "create_button_overlay",
+  "create_game_button_overlay",
+  "create_in_game_button_overlay",
+  "create_listbox_overlay",
+  "create_combo_button_overlay",
+  "create_combo_label_overlay",
+  "overlay_set_text",
+  "overlay_set_tooltip",
+  "overlay_add_item",
+  "tutorial_message",
+  "tutorial_box",
+  "dialog_box",
+  "question_box",
+  "troop_set_name",
+  "troop_set_plural_name",
+  "party_set_name",
+  "party_set_extra_text",
+  "server_add_message_to_log",
+  "add_troop_note_from_sreg",
+  "add_faction_note_from_sreg",
+  "add_party_note_from_sreg",
+  "add_quest_note_from_sreg",
+  "add_info_page_note_from_sreg",
+]
+
+# module name -> (module, objects before strip_module_data), so that a watch
+# build can make a new plan from the module data as it was loaded.
+original_lists = {}
+
+bare_name_pattern = re.compile(r"(?<![\w\"'])(script|str|prsnt)_(\w+)")
+code_pattern = re.compile(r"^(?:[^#\"']|\"[^\"]*\"|'[^']*')*")
+
+
+def get_keep_patterns():
+  import module_info
+  return keep_patterns + list(getattr(module_info, "release_keep", []))
+
+
+def get_direct_operations():
+  import header_operations
+  operations = set()
+  for name in direct_operation_names:
+    if hasattr(header_operations, name):
+      operations.add(getattr(header_operations, name))
+  return operations
+
+
+def get_operation_mask():
+  import header_operations
+  return ~(header_operations.neg | header_operations.this_or_next)
+
+
+def collect_references(value, indices, direct_operations, operation_mask, references, bases, opcode = None):
+  """Add (tag, index) of every stripped id in value to references.
+
+  Ids used by an operation other than a direct one are added to bases too.
+  """
+  value_type = type(value)
+  if value_type == str:
+    underscore_pos = value.find("_")
+    if underscore_pos > 0:
+      tag_indices = indices.get(value[:underscore_pos].lower())
+      if tag_indices is not None:
+        index = tag_indices.get(value[underscore_pos + 1:].lower())
+        if index is not None:
+          reference = (value[:underscore_pos].lower(), index)
+          references.append(reference)
+          if opcode not in direct_operations:
+            bases.append(reference)
+  elif (value_type == list) or (value_type == tuple):
+    statement_opcode = None
+    if value and (type(value[0]) in integer_types):
+      statement_opcode = value[0] & operation_mask
+    for item in value:
+      collect_references(item, indices, direct_operations, operation_mask, references, bases, statement_opcode)
+
+
+def get_imported_id_tags(module_name, reached):
+  """Stripped tags whose ID header module_name imports, directly or not."""
+  if module_name in reached:
+    return reached[module_name]
+  reached[module_name] = set()
+  tags = set()
+  for imported in build_graph.get_direct_imports(module_name):
+    for tag in id_headers:
+      if imported == id_headers[tag]:
+        tags.add(tag)
+    tags.update(get_imported_id_tags(imported, reached))
+  reached[module_name] = tags
+  return tags
+
+
+def find_bare_names(module_name, tags, indices, references):
+  file = open_text(build_graph.get_module_path(module_name), "r")
+  lines = file.readlines()
+  file.close()
+  for line in lines:
+    if bare_name_pattern.search(line) is None:
+      continue
+    for match in bare_name_pattern.finditer(code_pattern.match(line).group(0)):
+      if match.group(1) in tags:
+        index = indices[match.group(1)].get(match.group(2).lower())
+        if index is not None:
+          references.append((match.group(1), index))
+
+
+def get_module_names():
+  module_names = []
+  for file_name in sorted(os.listdir(build_graph.module_system_dir)):
+    if file_name.startswith("module_") and file_name.endswith(".py"):
+      module_names.append(file_name[:-len(".py")])
+  return module_names
+
+
+def make_plan():
+  """Return the objects a release build leaves out.
+
+  The result maps each stripped tag to (number of objects, sorted indices of
+  the objects to drop).
+  """
+  restore_module_data()
+  direct_operations = get_direct_operations()
+  operation_mask = get_operation_mask()
+  module_names = get_module_names()
+  for module_name in module_names:
+    __import__(module_name)
+  lists = {}
+  indices = {}
+  for (tag, module_name, list_name) in stripped_lists:
+    objects = getattr(sys.modules[module_name], list_name)
+    lists[tag] = objects
+    tag_indices = {}
+    for i_object in xrange(len(objects)):
+      tag_indices.setdefault(objects[i_object][0].lower(), i_object)
+    indices[tag] = tag_indices
+
+  # Objects kept whatever refers to them, then everything the rest of the
+  # module data refers to.
+  roots = []
+  root_bases = []
+  patterns = get_keep_patterns()
+  for tag in lists:
+    for (object_id, i_object) in indices[tag].items():
+      for pattern in patterns:
+        if fnmatch.fnmatch(tag + "_" + object_id, pattern.lower()):
+          roots.append((tag, i_object))
+          break
+  roots.extend([("str", i_string) for i_string in xrange(min(num_hardwired_strings, len(lists["str"])))])
+
+  stripped_list_ids = set([id(objects) for objects in lists.values()])
+  seen = set()
+  reached = {}
+  for module_name in module_names:
+    module = sys.modules[module_name]
+    for value in module.__dict__.values():
+      if ((type(value) == list) or (type(value) == tuple)) and (id(value) not in stripped_list_ids) and (id(value) not in seen):
+        seen.add(id(value))
+        collect_references(value, indices, direct_operations, operation_mask, roots, root_bases)
+    tags = get_imported_id_tags(module_name, reached)
+    if tags:
+      bare_names = []
+      find_bare_names(module_name, tags, indices, bare_names)
+      roots.extend(bare_names)
+      root_bases.extend(bare_names)
+
+  kept = set()
+  bases = set(root_bases)
+  stack = roots
+  while stack:
+    while stack:
+      reference = stack.pop()
+      if reference in kept:
+        continue
+      kept.add(reference)
+      (tag, i_object) = reference
+      if tag != "str":
+        object_bases = []
+        collect_references(list(lists[tag][i_object][1:]), indices, direct_operations, operation_mask, stack, object_bases)
+        bases.update(object_bases)
+    # Keep everything from each base up to the next one.
+    for tag in lists:
+      tag_bases = sorted([i_object for (base_tag, i_object) in bases if base_tag == tag])
+      tag_bases.append(len(lists[tag]))
+      for i_base in xrange(len(tag_bases) - 1):
+        for i_object in xrange(tag_bases[i_base], tag_bases[i_base + 1]):
+          if (tag, i_object) not in kept:
+            stack.append((tag, i_object))
+
+  plan = {}
+  for tag in lists:
+    dropped = [i_object for i_object in xrange(len(lists[tag])) if (tag, i_object) not in kept]
+    plan[tag] = (len(lists[tag]), dropped)
+  return plan
+
+
+def get_plan_digest(plan):
+  h = hashlib.md5()
+  for (tag, module_name, list_name) in stripped_lists:
+    (num_objects, dropped) = plan[tag]
+    h.update(to_bytes("%s:%d:%s\n" % (tag, num_objects, ",".join([str(i_object) for i_object in dropped]))))
+  return h.hexdigest()
+
+
+def strip_module_data(plan):
+  """Drop the objects of plan from the loaded module data.
+
+  The lists are changed in place, so every module that imported them sees
+  the release data. A list that no longer has the length the plan was made
+  for has been stripped already.
+  """
+  for (tag, module_name, list_name) in stripped_lists:
+    module = sys.modules.get(module_name)
+    (num_objects, dropped) = plan[tag]
+    if (module is None) or not dropped:
+      continue
+    objects = getattr(module, list_name)
+    if len(objects) != num_objects:
+      continue
+    original_lists[module_name] = (module, objects[:])
+    dropped = set(dropped)
+    objects[:] = [objects[i_object] for i_object in xrange(num_objects) if i_object not in dropped]
+
+
+def restore_module_data():
+  for (tag, module_name, list_name) in stripped_lists:
+    entry = original_lists.pop(module_name, None)
+    if (entry is not None) and (sys.modules.get(module_name) is entry[0]):
+      getattr(entry[0], list_name)[:] = entry[1]
+
+
+def print_plan(plan):
+  counts = []
+  for (tag, module_name, list_name) in stripped_lists:
+    (num_objects, dropped) = plan[tag]
+    counts.append("%d of %d %s" % (len(dropped), num_objects, list_name))
+  print("Release build: leaving out " + ", ".join(counts) + ".")
+  for (tag, module_name, list_name) in stripped_lists:
+    objects = getattr(sys.modules[module_name], list_name)
+    (num_objects, dropped) = plan[tag]
+    if dropped and (len(objects) == num_objects):
+      print("  " + " ".join([tag + "_" + objects[i_object][0] for i_object in dropped]))
@@ -0,0 +1,209 @@
+import __future__
+import marshal
+import os
+import sys
+import types
+
+import build_graph
+from compat import decode_source
+
+# Snapshots of evaluated module_*.py files.
+#
+# Running module_scripts.py, module_dialogs.py and the other large module
+# files only builds nested lists and tuples, which marshal can store and load
+# far faster than Python can execute the source again. After a module file is
+# executed its namespace is saved under snapshot_dir together with the
+# modification time, size and md5 of every file it imports, directly or not
+# (headers, ID files, module_constants.py ...). While none of those files
+# changes, importing the module loads the snapshot instead.
+#
+# Functions, classes and modules in the namespace, which normally come from
+# star imports of the headers, are stored as references to the module that
+# defines them. A module that defines its own functions or holds other
+# objects marshal cannot store is executed every time. The compiler features
+# "from __future__ import" puts in a namespace are left out.
+
+snapshot_dir = os.path.join(build_graph.module_system_dir, "snapshots")
+snapshot_version = 1
+
+skipped_names = ("__builtins__", "__file__", "__name__", "__package__", "__path__", "__loader__", "__spec__", "__cached__")
+
+
+def is_snapshot_module(module_name):
+  return module_name.startswith("module_") and (module_name != "module_info") and os.path.exists(build_graph.get_module_path(module_name))
+
+
+def get_snapshot_path(module_name):
+  return os.path.join(snapshot_dir, module_name + ".dat")
+
+
+def get_dependencies(module_name):
+  """File names of module_name and everything it imports from the module system."""
+  reached = set()
+  stack = [module_name]
+  while stack:
+    name = stack.pop()
+    if name not in reached:
+      reached.add(name)
+      stack.extend(build_graph.get_direct_imports(name))
+  return sorted([name + ".py" for name in reached])
+
+
+def get_dependency_state(module_name):
+  state = []
+  for file_name in get_dependencies(module_name):
+    path = os.path.join(build_graph.module_system_dir, file_name)
+    stat = os.stat(path)
+    state.append((file_name, stat.st_mtime, stat.st_size, build_graph.get_file_hash(path)))
+  return state
+
+
+def is_dependency_state_fresh(state):
+  for (file_name, mtime, size, digest) in state:
+    path = os.path.join(build_graph.module_system_dir, file_name)
+    try:
+      stat = os.stat(path)
+    except OSError:
+      return 0
+    if ((stat.st_mtime != mtime) or (stat.st_size != size)) and (build_graph.get_file_hash(path) != digest):
+      return 0
+  return 1
+
+
+def get_reference(module_name, value):
+  """Return (module, attribute) to look value up by, or None."""
+  if type(value) == types.ModuleType:
+    return (value.__name__, None)
+  defining_module = getattr(value, "__module__", None)
+  attribute = getattr(value, "__name__", None)
+  if (defining_module is None) or (attribute is None) or (defining_module == module_name):
+    return None
+  __import__(defining_module)
+  if getattr(sys.modules[defining_module], attribute, None) is not value:
+    return None
+  return (defining_module, attribute)
+
+
+def save_snapshot(module_name, module, dependency_state):
+  data = {}
+  references = {}
+  for (name, value) in module.__dict__.items():
+    if (name in skipped_names) or isinstance(value, __future__._Feature):
+      continue
+    try:
+      marshal.dumps(value)
+      data[name] = value
+    except ValueError:
+      reference = get_reference(module_name, value)
+      if reference is None:
+        return
+      references[name] = reference
+  if not os.path.isdir(snapshot_dir):
+    try:
+      os.mkdir(snapshot_dir)
+    except OSError:
+      pass
+  # Several build processes may write the same snapshot, so write a private
+  # file and move it into place.
+  path = get_snapshot_path(module_name)
+  temp_path = "%s.%d" % (path, os.getpid())
+  file = open(temp_path, "wb")
+  marshal.dump((snapshot_version, sys.version, dependency_state, references), file)
+  marshal.dump(data, file)
+  file.close()
+  try:
+    os.rename(temp_path, path)
+  except OSError:
+    try:
+      os.remove(path)
+      os.rename(temp_path, path)
+    except OSError:
+      os.remove(temp_path)
+
+
+def load_snapshot(module_name, module):
+  """Fill module from its snapshot. Return 0 if the snapshot is missing or stale."""
+  try:
+    file = open(get_snapshot_path(module_name), "rb")
+  except IOError:
+    return 0
+  try:
+    try:
+      (version, python_version, dependency_state, references) = marshal.load(file)
+      if (version != snapshot_version) or (python_version != sys.version) or not is_dependency_state_fresh(dependency_state):
+        return 0
+      data = marshal.load(file)
+    except (EOFError, ValueError, TypeError):
+      return 0
+  finally:
+    file.close()
+  for (name, (defining_module, attribute)) in references.items():
+    __import__(defining_module)
+    value = sys.modules[defining_module]
+    if attribute is not None:
+      value = getattr(value, attribute)
+    module.__dict__[name] = value
+  module.__dict__.update(data)
+  return 1
+
+
+def load_source(module_name, module):
+  dependency_state = get_dependency_state(module_name)
+  # Compiling the whole source at once is much faster than letting the
+  # importer decode the files with a coding declaration line by line.
+  path = build_graph.get_module_path(module_name)
+  file = open(path, "rb")
+  source = file.read()
+  file.close()
+  exec(compile(decode_source(source), path, "exec"), module.__dict__)
+  save_snapshot(module_name, module, dependency_state)
+
+
+def exec_snapshot_module(module):
+  module.__file__ = build_graph.get_module_path(module.__name__)
+  if not load_snapshot(module.__name__, module):
+    load_source(module.__name__, module)
+
+
+class SnapshotImporter(object):
+  """sys.meta_path hook that imports module_*.py files through snapshots.
+
+  Python 2 calls find_module and load_module, Python 3 find_spec and
+  exec_module.
+  """
+
+  def find_module(self, fullname, path = None):
+    if (path is None) and is_snapshot_module(fullname):
+      return self
+    return None
+
+  def load_module(self, fullname):
+    if fullname in sys.modules:
+      return sys.modules[fullname]
+    module = types.ModuleType(fullname)
+    sys.modules[fullname] = module
+    try:
+      exec_snapshot_module(module)
+    except:
+      del sys.modules[fullname]
+      raise
+    return module
+
+  def find_spec(self, fullname, path = None, target = None):
+    if (path is None) and is_snapshot_module(fullname):
+      import importlib.util
+      return importlib.util.spec_from_loader(fullname, self)
+    return None
+
+  def create_module(self, spec):
+    return None
+
+  def exec_module(self, module):
+    exec_snapshot_module(module)
+
+
+def install():
+  for importer in sys.meta_path:
+    if isinstance(importer, SnapshotImporter):
+      return
+  sys.meta_path.insert(0, SnapshotImporter())
@@ -0,0 +1,412 @@
+from __future__ import print_function
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from optparse import OptionParser
+
+from compat import *
+
+# Builds the module in a scratch copy of the module system and compares
+# every file the build writes with the golden copy in golden_dir, byte for
+# byte: the text files of export_dir (Modules/NativeEnhanced), tag_uses.dat,
+# variables.txt, quick_strings.txt and the ID_*.py headers. Changes to the
+# compiler that are meant to make it faster must leave all of them as they
+# are.
+#
+# The build does not need the game: export_dir of the copy is pointed at a
+# scratch directory next to it. The time of every build is printed and
+# appended to the log file as one line of JSON.
+#
+# --refresh replaces the golden copy with the output of a build of the
+# working tree, after a change that is meant to change the output.
+#
+# The golden copy is kept apart from export_dir, which holds the module the
+# game loads: a check never writes to it, and --refresh only replaces the
+# golden copy. A file of the golden copy that the build no longer writes is
+# reported like a file that differs.
+
+module_system_dir = os.path.dirname(os.path.abspath(__file__))
+
+golden_dir = os.path.join(module_system_dir, "golden")
+golden_export_dir = "export"
+golden_header_dir = "headers"
+
+default_log_file = os.path.join(module_system_dir, "check_golden_output.log")
+
+# Files in export_dir that are not output of the exporters. The manifest
+# records modification times.
+ignored_files = ["build_manifest.txt"]
+
+# Exporters in build order, for batch builds.
+stages = [
+  "process_init",
+  "process_global_variables",
+  "process_strings",
+  "process_skills",
+  "process_music",
+  "process_animations",
+  "process_meshes",
+  "process_sounds",
+  "process_skins",
+  "process_map_icons",
+  "process_factions",
+  "process_items",
+  "process_scenes",
+  "process_troops",
+  "process_particle_sys",
+  "process_scene_props",
+  "process_tableau_materials",
+  "process_presentations",
+  "process_party_tmps",
+  "process_parties",
+  "process_quests",
+  "process_info_pages",
+  "process_scripts",
+  "process_mission_tmps",
+  "process_game_menus",
+  "process_simple_triggers",
+  "process_dialogs",
+  "process_global_variables_unused",
+  "process_postfx",
+]
+
+# Characters of a differing line shown on each side of the first difference.
+context_width = 40
+
+# Bytes of a differing binary file shown from the first difference on.
+binary_context = 16
+
+
+def extract_tree(tree_dir):
+  """Copy the working tree into tree_dir/Module_system, exporting to tree_dir/out."""
+  target = os.path.join(tree_dir, "Module_system")
+  shutil.copytree(module_system_dir, target, ignore = shutil.ignore_patterns("*.pyc", "__pycache__", "snapshots", "build_state.dat",
+                                                                             "golden", os.path.basename(default_log_file)))
+  os.mkdir(os.path.join(tree_dir, "out"))
+  info_path = os.path.join(target, "module_info.py")
+  file = open(info_path, "r")
+  source = file.read()
+  file.close()
+  file = open(info_path, "w")
+  file.write(re.sub(r"(?m)^export_dir *=.*$", 'export_dir = "../out/"', source))
+  file.close()
+  return target
+
+
+def run_process(args, cwd, log):
+  """Run args and return (exit code, seconds)."""
+  start_time = time.time()
+  exit_code = subprocess.call(args, cwd = cwd, stdout = log, stderr = subprocess.STDOUT)
+  return (exit_code, time.time() - start_time)
+
+
+def run_batch(python, target, build_args, log):
+  """Return (step times, total seconds)."""
+  steps = []
+  for stage in stages:
+    (exit_code, seconds) = run_process([python, stage + ".py"] + build_args, target, log)
+    steps.append({"step": stage, "time": seconds})
+    if exit_code != 0:
+      raise RuntimeError("%s failed with exit code %d" % (stage, exit_code))
+  return (steps, sum([step["time"] for step in steps]))
+
+
+def run_driver(python, target, build_args, log):
+  profile_path = os.path.join(target, "golden_profile.json")
+  (exit_code, seconds) = run_process([python, "build_module.py", "--profile", profile_path] + build_args, target, log)
+  if exit_code != 0:
+    raise RuntimeError("build_module.py failed with exit code %d" % exit_code)
+  file = open(profile_path, "r")
+  report = json.load(file)
+  file.close()
+  steps = []
+  for entry in report["steps"]:
+    steps.append({"step": entry["step"], "time": entry["wall_time"]})
+  return (steps, seconds)
+
+
+def build(python, mode, build_args, tree_dir):
+  """Build the working tree in tree_dir and return (steps, total seconds, target)."""
+  target = extract_tree(tree_dir)
+  log = open(os.path.join(tree_dir, "build.log"), "w")
+  try:
+    try:
+      if mode == "driver":
+        (steps, total_time) = run_driver(python, target, build_args, log)
+      else:
+        (steps, total_time) = run_batch(python, target, build_args, log)
+    except RuntimeError as error:
+      raise RuntimeError("%s (see %s)" % (error, log.name))
+  finally:
+    log.close()
+  return (steps, total_time, target)
+
+
+def list_files(directory, pattern = None):
+  if not os.path.isdir(directory):
+    return []
+  file_names = []
+  for file_name in os.listdir(directory):
+    if (file_name in ignored_files) or not os.path.isfile(os.path.join(directory, file_name)):
+      continue
+    if (pattern is None) or pattern.match(file_name):
+      file_names.append(file_name)
+  file_names.sort()
+  return file_names
+
+
+header_pattern = re.compile(r"^ID_\w+\.py$")
+
+
+def get_build_files(target):
+  """(golden subdirectory, file name, path) of every file a build in target wrote."""
+  files = []
+  out_dir = os.path.join(os.path.dirname(target), "out")
+  for file_name in list_files(out_dir):
+    files.append((golden_export_dir, file_name, os.path.join(out_dir, file_name)))
+  for file_name in list_files(target, header_pattern):
+    files.append((golden_header_dir, file_name, os.path.join(target, file_name)))
+  return files
+
+
+def get_golden_files(directory):
+  files = []
+  for subdirectory in [golden_export_dir, golden_header_dir]:
+    for file_name in list_files(os.path.join(directory, subdirectory)):
+      files.append((subdirectory, file_name, os.path.join(directory, subdirectory, file_name)))
+  return files
+
+
+def read_file(path):
+  file = open(path, "rb")
+  data = file.read()
+  file.close()
+  return data
+
+
+def is_binary(data):
+  return b"\0" in data
+
+
+def to_text(data):
+  """Text of data with one character per byte, so that columns are byte offsets."""
+  if PY3:
+    return data.decode("latin-1")
+  return data
+
+
+def show_text(text, start, end):
+  """text[start:end] with ... where it was cut."""
+  shown = text[max(start, 0):end]
+  if start > 0:
+    shown = "..." + shown
+  if end < len(text):
+    shown += "..."
+  return repr(shown)
+
+
+def get_token(line, column):
+  """(number, text) of the space separated token of line at column, or None."""
+  number = 0
+  for match in re.finditer(r"\S+", line):
+    if match.end() > column:
+      if match.start() > column:
+        return None
+      return (number, match.group(0))
+    number += 1
+  return None
+
+
+def describe_binary_difference(golden_data, build_data):
+  offset = 0
+  length = min(len(golden_data), len(build_data))
+  while (offset < length) and (golden_data[offset] == build_data[offset]):
+    offset += 1
+  end = offset + binary_context
+  return [
+    "first difference at byte %d" % offset,
+    "  golden: %s" % " ".join(["%02x" % byte for byte in bytearray(golden_data[offset:end])]),
+    "  build:  %s" % " ".join(["%02x" % byte for byte in bytearray(build_data[offset:end])]),
+  ]
+
+
+def describe_text_difference(golden_data, build_data):
+  golden_lines = to_text(golden_data).split("\n")
+  build_lines = to_text(build_data).split("\n")
+  line_no = 0
+  offset = 0
+  while (line_no < len(golden_lines)) and (line_no < len(build_lines)) and (golden_lines[line_no] == build_lines[line_no]):
+    offset += len(golden_lines[line_no]) + 1
+    line_no += 1
+  golden_line = ""
+  build_line = ""
+  if line_no < len(golden_lines):
+    golden_line = golden_lines[line_no]
+  if line_no < len(build_lines):
+    build_line = build_lines[line_no]
+  column = 0
+  while (column < len(golden_line)) and (column < len(build_line)) and (golden_line[column] == build_line[column]):
+    column += 1
+  different_lines = len([i for i in xrange(min(len(golden_lines), len(build_lines))) if golden_lines[i] != build_lines[i]])
+  different_lines += abs(len(golden_lines) - len(build_lines))
+  lines = [
+    "first difference at line %d, column %d (byte %d); %d of %d lines differ" % (line_no + 1, column + 1, offset + column, different_lines, len(golden_lines)),
+  ]
+  first_token = golden_line.split(" ", 1)[0] or build_line.split(" ", 1)[0]
+  if first_token:
+    lines.append("  line starts with %s" % repr(first_token[:context_width]))
+  lines.append("  golden: %s" % show_text(golden_line, column - context_width, column + context_width))
+  lines.append("  build:  %s" % show_text(build_line, column - context_width, column + context_width))
+  golden_token = get_token(golden_line, column)
+  build_token = get_token(build_line, column)
+  if (golden_token is not None) and (build_token is not None) and (golden_token[0] == build_token[0]):
+    lines.append("  token %d: golden %s, build %s" % (golden_token[0] + 1, golden_token[1], build_token[1]))
+  return lines
+
+
+def compare_outputs(golden, target):
+  """Return (number of files compared, list of (file name, description lines))."""
+  golden_files = {}
+  for (subdirectory, file_name, path) in get_golden_files(golden):
+    golden_files[(subdirectory, file_name)] = path
+  build_files = {}
+  for (subdirectory, file_name, path) in get_build_files(target):
+    build_files[(subdirectory, file_name)] = path
+  mismatches = []
+  for key in sorted(set(golden_files.keys()) | set(build_files.keys())):
+    file_name = key[1]
+    if key not in build_files:
+      mismatches.append((file_name, ["not written by the build"]))
+      continue
+    if key not in golden_files:
+      mismatches.append((file_name, ["not in the golden copy"]))
+      continue
+    golden_data = read_file(golden_files[key])
+    build_data = read_file(build_files[key])
+    if golden_data == build_data:
+      continue
+    lines = ["size: golden %d bytes, build %d bytes" % (len(golden_data), len(build_data))]
+    if is_binary(golden_data) or is_binary(build_data):
+      lines.extend(describe_binary_difference(golden_data, build_data))
+    else:
+      lines.extend(describe_text_difference(golden_data, build_data))
+    mismatches.append((file_name, lines))
+  return (len(golden_files), mismatches)
+
+
+def refresh_golden(golden, target):
+  """Replace the golden copy with the files of the build in target."""
+  for subdirectory in [golden_export_dir, golden_header_dir]:
+    directory = os.path.join(golden, subdirectory)
+    if os.path.isdir(directory):
+      shutil.rmtree(directory)
+    os.makedirs(directory)
+  build_files = get_build_files(target)
+  for (subdirectory, file_name, path) in build_files:
+    shutil.copyfile(path, os.path.join(golden, subdirectory, file_name))
+  return len(build_files)
+
+
+def print_steps(steps, total_time):
+  for step in steps:
+    print("  %-34s %9.3f" % (step["step"], step["time"]))
+  print("  %-34s %9.3f" % ("Total", total_time))
+
+
+def append_log(log_file, record):
+  file = open(log_file, "a")
+  file.write(json.dumps(record, sort_keys = True) + "\n")
+  file.close()
+
+
+def main():
+  parser = OptionParser(usage = "usage: %prog [options]",
+                        description = "Build the working tree into a scratch directory and compare every output file with the "
+                                      "golden copy. Exits with 1 if any file differs.")
+  parser.add_option("--refresh", action = "store_true", dest = "refresh", default = False,
+                    help = "replace the golden copy with the output of one build instead of comparing")
+  parser.add_option("-g", "--golden", dest = "golden", default = golden_dir,
+                    help = "directory of the golden copy [default: %default]")
+  parser.add_option("-m", "--mode", dest = "mode", default = "driver", choices = ["batch", "driver"],
+                    help = "driver runs build_module.py --profile, batch runs every exporter in its own process [default: %default]")
+  parser.add_option("-a", "--build-args", dest = "build_args", default = "",
+                    help = "space separated options passed to build_module.py, or to every exporter in batch mode")
+  parser.add_option("-n", "--repeats", type = "int", dest = "repeats", default = 1,
+                    help = "number of builds to time and compare [default: %default]")
+  parser.add_option("-p", "--python", dest = "python", default = sys.executable,
+                    help = "interpreter to build with [default: %default]")
+  parser.add_option("-l", "--log", dest = "log_file", default = default_log_file, metavar = "FILE",
+                    help = "file the time and result of every build is appended to [default: %default]")
+  parser.add_option("-k", "--keep", action = "store_true", dest = "keep", default = False,
+                    help = "keep the scratch directories and print where they are")
+  (options, args) = parser.parse_args()
+  if args:
+    parser.error("unexpected arguments: " + " ".join(args))
+  build_args = options.build_args.split()
+  repeats = options.repeats
+  if options.refresh:
+    repeats = 1
+  elif not os.path.isdir(options.golden):
+    parser.error("no golden copy in %s; make one with --refresh" % options.golden)
+
+  failed = 0
+  for i in xrange(repeats):
+    tree_dir = tempfile.mkdtemp(prefix = "golden_")
+    try:
+      print("Building (%s %s)..." % (options.mode, " ".join(build_args) or "default options"))
+      sys.stdout.flush()
+      record = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": options.python,
+        "mode": options.mode,
+        "build_args": build_args,
+      }
+      try:
+        (steps, total_time, target) = build(options.python, options.mode, build_args, tree_dir)
+      except RuntimeError as error:
+        print("ERROR: %s" % error)
+        record["result"] = "build failed"
+        append_log(options.log_file, record)
+        options.keep = True
+        return 2
+      print_steps(steps, total_time)
+      record["total_time"] = total_time
+      record["steps"] = steps
+
+      if options.refresh:
+        num_files = refresh_golden(options.golden, target)
+        print("Golden copy in %s refreshed with %d files." % (options.golden, num_files))
+        record["result"] = "refreshed"
+        append_log(options.log_file, record)
+        continue
+
+      (num_files, mismatches) = compare_outputs(options.golden, target)
+      for (file_name, lines) in mismatches:
+        print("MISMATCH %s" % file_name)
+        for line in lines:
+          print("  " + line)
+      if mismatches:
+        print("%d of %d files differ from the golden copy." % (len(mismatches), num_files))
+        record["result"] = "mismatch"
+        record["mismatches"] = [file_name for (file_name, lines) in mismatches]
+        failed = 1
+      else:
+        print("All %d files match the golden copy." % num_files)
+        record["result"] = "match"
+      append_log(options.log_file, record)
+    finally:
+      if options.keep:
+        print("Build kept in %s" % tree_dir)
+      else:
+        shutil.rmtree(tree_dir, True)
+  return failed
+
+
+if __name__ == "__main__":
+  sys.exit(main())
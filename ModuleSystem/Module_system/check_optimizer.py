@@ -0,0 +1,1350 @@
+from __future__ import print_function
+
+import os
+import re
+import sys
+import zlib
+from optparse import OptionParser
+
+from compat import *
+from header_common import *
+from header_operations import *
+from header_triggers import *
+
+import build_optimize
+from build_optimize import get_opcode
+
+# Checks that the passes of build_optimize.py (--optimize) do not change what
+# the statement blocks they rewrite do.
+#
+# A reference interpreter runs a block as it was and as the pass left it,
+# with the same script parameters and the same values in the global
+# variables and registers it did not set, and compares what the game could
+# notice afterwards: whether the block failed, the global variables and
+# registers, the game state that the setters of state_getter_operation_names
+# change, the errors the game would report and every other operation run,
+# with the values of its operands, in order. It knows try blocks, loops,
+# neg and this_or_next, the script parameters, the repeat object of a
+# dialog line, scripts called by name and the arithmetic operations. Other
+# operations that can fail fail depending on their operands, and other
+# operations that change their first operand set it to a value that depends
+# on theirs. Some operations store their results in reg0 without saying so,
+# so every other operation does.
+#
+# Every case of cases is a small block made for one rewrite of one pass, or
+# for a block the pass must leave alone, and runs with num_case_inputs
+# different inputs. A case fails if the pass does not rewrite the block when
+# it should or rewrites it when it should not, or if the blocks do not do
+# the same. coalesce cases are lists of triggers the game checks at the same
+# time.
+#
+# --module runs the passes on the module data the way a build does, and
+# compares every block they changed, and with coalesce the triggers of each
+# mission template, with inputs made of the constants in the block.
+
+module_system_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Script parameters of the inputs of a case: the first one goes from -3 to
+# 12 with the second one at each of case_second_params, the others vary.
+case_second_params = [-3, 2, 7]
+num_case_inputs = 16 * len(case_second_params)
+
+# Inputs of a block of the module data, at most.
+max_module_inputs = 12
+
+# Seeds of the inputs of the triggers of a mission template.
+num_trigger_inputs = 6
+
+# try_for_range loops stop after this many iterations, and the other loops
+# go through at most this many objects.
+max_iterations = 4
+
+# Operations a run may take before it is given up as endless.
+max_steps = 100000
+
+# Scripts called deeper than this are not run.
+max_call_depth = 8
+
+# Operations the interpreter computes: name -> (what they compute, positions
+# of the operands they read, 0 being the destination).
+computed_operations = {
+  "assign":     ("first", [1]),
+  "store_add":  ("add", [1, 2]),
+  "store_sub":  ("sub", [1, 2]),
+  "store_mul":  ("mul", [1, 2]),
+  "store_div":  ("div", [1, 2]),
+  "store_mod":  ("mod", [1, 2]),
+  "store_or":   ("or", [1, 2]),
+  "store_and":  ("and", [1, 2]),
+  "val_add":    ("add", [0, 1]),
+  "val_sub":    ("sub", [0, 1]),
+  "val_mul":    ("mul", [0, 1]),
+  "val_div":    ("div", [0, 1]),
+  "val_mod":    ("mod", [0, 1]),
+  "val_or":     ("or", [0, 1]),
+  "val_and":    ("and", [0, 1]),
+  "val_min":    ("min", [0, 1]),
+  "val_max":    ("max", [0, 1]),
+  "val_lshift": ("lshift", [0, 1]),
+  "val_rshift": ("rshift", [0, 1]),
+  "val_abs":    ("abs", [0]),
+  "val_clamp":  ("clamp", [0, 1, 2]),
+}
+
+# Scripts the cases call, by name.
+case_scripts = {
+  "inline_add": [
+    (store_script_param_1, ":a"),
+    (store_script_param_2, ":b"),
+    (store_add, reg0, ":a", ":b"),
+  ],
+  "inline_double": [
+    (store_script_param_1, ":a"),
+    (store_mul, ":b", ":a", 2),
+    (assign, reg0, ":b"),
+  ],
+  "cf_inline_positive": [
+    (store_script_param_1, ":a"),
+    (gt, ":a", 0),
+  ],
+  "inline_positive": [
+    (store_script_param_1, ":a"),
+    (gt, ":a", 0),
+    (assign, reg0, ":a"),
+  ],
+  "inline_if_positive": [
+    (store_script_param_1, ":a"),
+    (try_begin),
+      (gt, ":a", 0),
+      (assign, ":b", ":a"),
+    (try_end),
+    (assign, reg0, ":b"),
+  ],
+  "inline_third": [
+    (store_script_param, ":c", 3),
+    (assign, reg0, ":c"),
+  ],
+  "inline_set_then_store": [
+    (assign, "$inline_a", 5),
+    (store_script_param_1, ":a"),
+    (assign, reg0, ":a"),
+  ],
+  "inline_swap_registers": [
+    (store_script_param_1, reg1),
+    (store_script_param_2, reg0),
+  ],
+  "inline_swap_globals": [
+    (store_script_param_1, "$inline_b"),
+    (store_script_param_2, "$inline_a"),
+  ],
+  "inline_first": [
+    (store_script_param_1, ":a"),
+    (store_script_param_2, ":b"),
+    (assign, reg0, ":a"),
+  ],
+  "inline_caller": [
+    (store_script_param_1, ":a"),
+    (call_script, "script_inline_double", ":a"),
+  ],
+  "hoist_next": [
+    (val_add, "$hoist_g", 1),
+  ],
+}
+
+peephole_cases = [
+  ("peephole", "operations that leave their destination as it is", "rewrite", [
+    (store_script_param_1, ":x"),
+    (assign, "$peephole_x", ":x"),
+    (val_add, "$peephole_x", 0),
+    (val_sub, "$peephole_x", 0),
+    (val_or, "$peephole_x", 0),
+    (val_mul, "$peephole_x", 1),
+    (val_div, "$peephole_x", 1),
+    (assign, "$peephole_x", "$peephole_x"),
+  ]),
+  ("peephole", "stores whose result the next operation overwrites", "rewrite", [
+    (store_script_param_1, ":x"),
+    (assign, ":y", ":x"),
+    (assign, ":y", 5),
+    (store_add, ":z", ":x", 1),
+    (store_mul, ":z", ":x", 3),
+    (store_sub, reg1, ":y", ":z"),
+  ]),
+  ("peephole", "comparisons of constants that always succeed", "rewrite", [
+    (store_script_param_1, ":x"),
+    (eq, 1, 1),
+    (neq, 1, 2),
+    (gt, 2, 1),
+    (le, 1, 1),
+    (is_between, 3, 1, 5),
+    (assign, reg1, ":x"),
+  ]),
+  ("peephole", "a comparison of constants that always fails ends its try block", "rewrite", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (eq, 1, 0),
+      (assign, reg1, ":x"),
+      (display_message, "@never"),
+    (try_end),
+    (assign, reg2, ":x"),
+  ]),
+  ("peephole", "the else_try branches after a branch that cannot fail", "rewrite", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (gt, ":x", 3),
+      (assign, reg1, 1),
+    (else_try),
+      (assign, reg1, 2),
+    (else_try),
+      (assign, reg1, 3),
+    (try_end),
+  ]),
+  ("peephole", "an empty try block and the try block around a branch that cannot fail", "rewrite", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+    (try_end),
+    (try_begin),
+      (assign, reg1, ":x"),
+    (try_end),
+  ]),
+  ("peephole", "code that never runs but changes a global variable", "keep", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (eq, 1, 0),
+      (val_or, "$peephole_flags", ":x"),
+    (try_end),
+  ]),
+  ("peephole", "code that never runs but assigns a local used after it", "keep", [
+    (try_begin),
+      (eq, 1, 0),
+      (assign, ":y", 1),
+    (try_end),
+    (assign, reg1, ":y"),
+  ]),
+  ("peephole", "a comparison of constants chained with this_or_next", "keep", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (this_or_next|eq, ":x", 2),
+      (eq, 1, 0),
+      (assign, reg1, 1),
+    (try_end),
+  ]),
+  ("peephole", "stores to a local whose reads never run", "rewrite", [
+    (store_script_param_1, ":x"),
+    (store_add, ":y", ":x", 1),
+    (try_begin),
+      (eq, 1, 0),
+      (assign, reg1, ":y"),
+    (try_end),
+    (assign, reg2, 1),
+  ]),
+  ("peephole", "a store to a local the block never reads", "keep", [
+    (store_script_param_1, ":x"),
+    (assign, reg1, 1),
+  ]),
+  ("peephole", "a store whose result the next operation reads", "keep", [
+    (store_script_param_1, ":x"),
+    (assign, ":y", ":x"),
+    (store_add, ":y", ":y", 1),
+    (assign, reg1, ":y"),
+  ]),
+]
+
+dispatch_cases = [
+  ("dispatch", "a chain of cases on a local", "rewrite", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (eq, ":x", 0),
+      (assign, reg1, 10),
+    (else_try),
+      (eq, ":x", 1),
+      (assign, reg1, 11),
+    (else_try),
+      (eq, ":x", 2),
+      (assign, reg1, 12),
+    (else_try),
+      (eq, ":x", 3),
+      (assign, reg1, 13),
+    (else_try),
+      (eq, ":x", 4),
+      (assign, reg1, 14),
+    (else_try),
+      (eq, 5, ":x"),
+      (assign, reg1, 15),
+    (else_try),
+      (eq, ":x", 6),
+      (assign, reg1, 16),
+    (else_try),
+      (eq, ":x", 7),
+      (assign, reg1, 17),
+    (try_end),
+  ]),
+  ("dispatch", "cases followed by a branch for the other values", "rewrite", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (eq, ":x", 0),
+      (assign, reg1, 10),
+    (else_try),
+      (eq, ":x", 1),
+      (assign, reg1, 11),
+    (else_try),
+      (eq, ":x", 2),
+      (assign, reg1, 12),
+    (else_try),
+      (eq, ":x", 3),
+      (assign, reg1, 13),
+    (else_try),
+      (eq, ":x", 8),
+      (assign, reg1, 18),
+    (else_try),
+      (eq, ":x", 9),
+      (assign, reg1, 19),
+    (else_try),
+      (eq, ":x", 10),
+      (assign, reg1, 20),
+    (else_try),
+      (eq, ":x", 11),
+      (assign, reg1, 21),
+    (else_try),
+      (gt, ":x", 5),
+      (assign, reg1, -1),
+    (else_try),
+      (assign, reg1, -2),
+    (try_end),
+  ]),
+  ("dispatch", "a case that can fail before cases that cannot match", "rewrite", [
+    (store_script_param_1, ":x"),
+    (store_script_param_2, ":y"),
+    (try_begin),
+      (eq, ":x", 0),
+      (assign, reg1, 10),
+    (else_try),
+      (eq, ":x", 1),
+      (assign, reg1, 11),
+    (else_try),
+      (eq, ":x", 2),
+      (gt, ":y", 0),
+      (assign, reg1, 12),
+    (else_try),
+      (eq, ":x", 3),
+      (assign, reg1, 13),
+    (else_try),
+      (eq, ":x", 4),
+      (assign, reg1, 14),
+    (else_try),
+      (eq, ":x", 5),
+      (assign, reg1, 15),
+    (else_try),
+      (eq, ":x", 6),
+      (assign, reg1, 16),
+    (else_try),
+      (eq, ":x", 7),
+      (assign, reg1, 17),
+    (try_end),
+  ]),
+  ("dispatch", "a case that can fail before a branch that runs for its value", "keep", [
+    (store_script_param_1, ":x"),
+    (store_script_param_2, ":y"),
+    (try_begin),
+      (eq, ":x", 0),
+      (assign, reg1, 10),
+    (else_try),
+      (eq, ":x", 1),
+      (assign, reg1, 11),
+    (else_try),
+      (eq, ":x", 2),
+      (gt, ":y", 0),
+      (assign, reg1, 12),
+    (else_try),
+      (eq, ":x", 3),
+      (assign, reg1, 13),
+    (else_try),
+      (eq, ":x", 4),
+      (assign, reg1, 14),
+    (else_try),
+      (eq, ":x", 5),
+      (assign, reg1, 15),
+    (else_try),
+      (eq, ":x", 6),
+      (assign, reg1, 16),
+    (else_try),
+      (eq, ":x", 7),
+      (assign, reg1, 17),
+    (else_try),
+      (eq, ":x", 8),
+      (assign, reg1, 18),
+    (else_try),
+      (eq, ":x", 9),
+      (assign, reg1, 19),
+    (else_try),
+      (eq, ":x", 10),
+      (assign, reg1, 20),
+    (else_try),
+      (eq, ":x", 11),
+      (assign, reg1, 21),
+    (else_try),
+      (assign, reg1, -1),
+    (try_end),
+  ]),
+  ("dispatch", "a case that changes the local", "keep", [
+    (store_script_param_1, ":x"),
+    (store_script_param_2, ":y"),
+    (try_begin),
+      (eq, ":x", 0),
+      (assign, reg1, 10),
+    (else_try),
+      (eq, ":x", 1),
+      (assign, ":x", 6),
+      (gt, ":y", 0),
+    (else_try),
+      (eq, ":x", 2),
+      (assign, reg1, 12),
+    (else_try),
+      (eq, ":x", 3),
+      (assign, reg1, 13),
+    (else_try),
+      (eq, ":x", 4),
+      (assign, reg1, 14),
+    (else_try),
+      (eq, ":x", 5),
+      (assign, reg1, 15),
+    (else_try),
+      (eq, ":x", 6),
+      (assign, reg1, 16),
+    (else_try),
+      (eq, ":x", 7),
+      (assign, reg1, 17),
+    (try_end),
+  ]),
+  ("dispatch", "too few cases", "keep", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (eq, ":x", 0),
+      (assign, reg1, 10),
+    (else_try),
+      (eq, ":x", 1),
+      (assign, reg1, 11),
+    (else_try),
+      (eq, ":x", 2),
+      (assign, reg1, 12),
+    (else_try),
+      (eq, ":x", 3),
+      (assign, reg1, 13),
+    (try_end),
+  ]),
+]
+
+inline_cases = [
+  ("inline", "a call of a short script", "rewrite", [
+    (store_script_param_1, ":x"),
+    (call_script, "script_inline_add", ":x", 3),
+    (assign, reg1, reg0),
+  ]),
+  ("inline", "a cf_ script that fails the try block of the caller", "rewrite", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (call_script, "script_cf_inline_positive", ":x"),
+      (assign, reg1, 1),
+    (else_try),
+      (assign, reg1, 2),
+    (try_end),
+  ]),
+  ("inline", "a script with locals of the same names as the caller", "rewrite", [
+    (store_script_param_1, ":a"),
+    (assign, ":b", 7),
+    (call_script, "script_inline_double", ":b"),
+    (store_add, reg1, ":a", ":b"),
+    (val_add, reg1, reg0),
+  ]),
+  ("inline", "arguments that are global variables and registers", "rewrite", [
+    (store_script_param_1, ":x"),
+    (assign, "$inline_a", ":x"),
+    (call_script, "script_inline_add", "$inline_a", reg2),
+  ]),
+  ("inline", "a call with the neg flag", "keep", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (neg|call_script, "script_cf_inline_positive", ":x"),
+      (assign, reg1, 1),
+    (try_end),
+  ]),
+  ("inline", "a call after a this_or_next condition", "keep", [
+    (store_script_param_1, ":x"),
+    (try_begin),
+      (this_or_next|eq, ":x", -2),
+      (call_script, "script_cf_inline_positive", ":x"),
+      (assign, reg1, 1),
+    (try_end),
+  ]),
+  ("inline", "a script that can fail without a cf_ name", "keep", [
+    (store_script_param_1, ":x"),
+    (call_script, "script_inline_positive", ":x"),
+    (assign, reg1, 1),
+  ]),
+  ("inline", "a script that may read a local it did not assign", "keep", [
+    (store_script_param_1, ":x"),
+    (call_script, "script_inline_if_positive", 5),
+    (call_script, "script_inline_if_positive", ":x"),
+  ]),
+  ("inline", "a script that reads more parameters than the call passes", "keep", [
+    (call_script, "script_inline_third", 1, 2),
+  ]),
+  ("inline", "a global variable the script changes before it reads its parameters", "keep", [
+    (store_script_param_1, ":x"),
+    (assign, "$inline_a", ":x"),
+    (call_script, "script_inline_set_then_store", "$inline_a"),
+  ]),
+  ("inline", "registers the script swaps", "keep", [
+    (call_script, "script_inline_swap_registers", reg0, reg1),
+  ]),
+  ("inline", "global variables the script swaps", "keep", [
+    (call_script, "script_inline_swap_globals", "$inline_a", "$inline_b"),
+  ]),
+  ("inline", "a script that calls a script", "keep", [
+    (store_script_param_1, ":x"),
+    (call_script, "script_inline_caller", ":x"),
+  ]),
+  ("inline", "an argument the script ignores that is the only read of a local", "keep", [
+    (store_script_param_1, ":x"),
+    (store_script_param_2, ":y"),
+    (call_script, "script_inline_first", ":x", ":y"),
+  ]),
+]
+
+hoist_cases = [
+  ("hoist", "a pure store of operands the loop does not change", "rewrite", [
+    (store_script_param_1, ":x"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, ":x"),
+      (store_mul, ":step", ":x", 3),
+      (val_add, ":total", ":step"),
+      (val_add, ":total", ":i"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "store_div and store_mod by a constant", "rewrite", [
+    (store_script_param_1, ":x"),
+    (assign, ":total", 0),
+    (try_for_range_backwards, ":i", 0, 3),
+      (store_div, ":half", ":x", 2),
+      (store_mod, ":odd", ":x", 2),
+      (val_add, ":total", ":half"),
+      (val_add, ":total", ":odd"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a pure store in a try_for_agents loop", "rewrite", [
+    (store_script_param_1, ":x"),
+    (try_for_agents, ":agent"),
+      (store_add, ":value", ":x", 1),
+      (agent_set_slot, ":agent", 3, ":value"),
+    (try_end),
+  ]),
+  ("hoist", "a getter in a loop that surely runs it", "rewrite", [
+    (store_script_param_1, ":troop"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (troop_get_slot, ":wealth", ":troop", 5),
+      (val_add, ":total", ":wealth"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a store out of two loops", "rewrite", [
+    (store_script_param_1, ":x"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 2),
+      (try_for_range, ":j", 0, 2),
+        (store_add, ":k", ":x", 7),
+        (val_add, ":total", ":k"),
+      (try_end),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "store_div by a local", "keep", [
+    (store_script_param_1, ":x"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (store_div, ":q", 10, ":x"),
+      (val_add, ":total", ":q"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a getter in a loop that may not run", "keep", [
+    (store_script_param_1, ":x"),
+    (store_script_param_2, ":troop"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, ":x"),
+      (troop_get_slot, ":wealth", ":troop", 5),
+      (val_add, ":total", ":wealth"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a getter in a loop that runs its setter", "keep", [
+    (store_script_param_1, ":troop"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (troop_get_slot, ":wealth", ":troop", 5),
+      (val_add, ":total", ":wealth"),
+      (troop_set_slot, ":troop", 5, ":i"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a local that val_abs changes in the loop", "keep", [
+    (store_script_param_1, ":b"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (store_add, ":a", ":b", 1),
+      (val_add, ":total", ":a"),
+      (val_abs, ":b"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a local that val_or changes in the loop", "keep", [
+    (store_script_param_1, ":m"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (store_mul, ":a", ":m", 2),
+      (val_add, ":total", ":a"),
+      (val_or, ":m", 4),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a global variable in a loop that calls a script", "keep", [
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (store_add, ":a", "$hoist_g", 1),
+      (val_add, ":total", ":a"),
+      (call_script, "script_hoist_next"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a register", "keep", [
+    (store_script_param_1, ":troop"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (store_add, ":a", reg0, 1),
+      (val_add, ":total", ":a"),
+      (spawn_agent, ":troop"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+  ("hoist", "a destination used after the loop", "keep", [
+    (store_script_param_1, ":x"),
+    (assign, ":step", 0),
+    (try_for_range, ":i", 0, ":x"),
+      (store_mul, ":step", ":x", 3),
+    (try_end),
+    (assign, reg1, ":step"),
+  ]),
+  ("hoist", "a store after a this_or_next condition", "keep", [
+    (store_script_param_1, ":x"),
+    (assign, ":total", 0),
+    (try_for_range, ":i", 0, 3),
+      (this_or_next|eq, ":i", 1),
+      (store_add, ":a", ":x", 1),
+      (val_add, ":total", ":a"),
+    (try_end),
+    (assign, reg1, ":total"),
+  ]),
+]
+
+coalesce_cases = [
+  ("coalesce", "triggers without a delay", "rewrite", [
+    (1, 0, 0, [(gt, "$coalesce_a", 0)], [(val_add, "$coalesce_b", 1)]),
+    (1, 0, 0, [], [(val_add, "$coalesce_b", 2), (assign, "$coalesce_c", "$coalesce_b")]),
+    (1, 0, 0, [(eq, "$coalesce_c", 3)], [(display_message, "@three")]),
+  ]),
+  ("coalesce", "triggers with a delay", "rewrite", [
+    (2, 1, 0, [(val_add, "$coalesce_a", 1)], [(assign, "$coalesce_b", "$coalesce_a")]),
+    (2, 1, 0, [(val_mul, "$coalesce_a", 2)], [(display_message, "@done")]),
+  ]),
+  ("coalesce", "triggers whose blocks use locals of the same names", "rewrite", [
+    (0, 0, 0, [(store_add, ":a", "$coalesce_a", 1), (gt, ":a", 2)], [(val_add, ":a", 1), (assign, "$coalesce_b", ":a")]),
+    (0, 0, 0, [], [(val_add, ":a", 5), (assign, "$coalesce_c", ":a")]),
+  ]),
+  ("coalesce", "triggers with a rearm interval and conditions that can fail", "keep", [
+    (1, 0, 3, [(gt, "$coalesce_a", 0)], [(val_add, "$coalesce_b", 1)]),
+    (1, 0, 3, [(gt, "$coalesce_b", 0)], [(val_add, "$coalesce_c", 1)]),
+  ]),
+  ("coalesce", "triggers that set a trigger result", "keep", [
+    (1, 0, 0, [], [(set_trigger_result, 1)]),
+    (1, 0, 0, [], [(set_trigger_result, 2)]),
+  ]),
+  ("coalesce", "triggers of an event that passes values in registers", "keep", [
+    (ti_on_agent_hit, 0, 0, [], [(store_trigger_param_1, ":agent"), (assign, reg0, 5), (agent_set_slot, ":agent", 1, reg0)]),
+    (ti_on_agent_hit, 0, 0, [], [(assign, "$coalesce_a", reg0)]),
+  ]),
+  ("coalesce", "triggers with different check intervals", "keep", [
+    (1, 0, 0, [], [(val_add, "$coalesce_a", 1)]),
+    (2, 0, 0, [], [(val_add, "$coalesce_a", 2)]),
+  ]),
+  ("coalesce", "a trigger whose conditions end with a this_or_next condition", "keep", [
+    (1, 0, 0, [(this_or_next|eq, "$coalesce_a", 1)], [(val_add, "$coalesce_b", 1)]),
+    (1, 0, 0, [(eq, "$coalesce_a", 2)], [(val_add, "$coalesce_b", 2)]),
+  ]),
+]
+
+# (pass, description, "rewrite" or "keep", block or list of triggers)
+cases = peephole_cases + dispatch_cases + inline_cases + hoist_cases + coalesce_cases
+
+
+class BlockFailed(Exception):
+  pass
+
+
+class StepLimit(Exception):
+  pass
+
+
+def get_hash(*values):
+  return zlib.crc32(to_bytes(" ".join([str(value) for value in values]))) & 0xffffffff
+
+
+def get_default_value(seed, variable):
+  """The value of a global variable or register the block did not set."""
+  return get_hash(seed, "default", variable) % 20 - 5
+
+
+def divide(a, b):
+  """a / b rounded towards 0, as the game does."""
+  quotient = abs(a) // abs(b)
+  if (a < 0) != (b < 0):
+    return -quotient
+  return quotient
+
+
+def compute(operation, values):
+  (a, b, c) = (values + [0, 0])[:3]
+  if operation == "first":
+    return a
+  if operation == "add":
+    return a + b
+  if operation == "sub":
+    return a - b
+  if operation == "mul":
+    return a * b
+  if operation == "div":
+    return divide(a, b)
+  if operation == "mod":
+    return a - b * divide(a, b)
+  if operation == "or":
+    return a | b
+  if operation == "and":
+    return a & b
+  if operation == "min":
+    return min(a, b)
+  if operation == "max":
+    return max(a, b)
+  if operation == "lshift":
+    return a << (b % 64)
+  if operation == "rshift":
+    return a >> (b % 64)
+  if operation == "abs":
+    return abs(a)
+  return max(min(a, c - 1), b)
+
+
+def compare(name, values):
+  if len(values) < 2:
+    return 0
+  if name == "eq":
+    return values[0] == values[1]
+  if name == "gt":
+    return values[0] > values[1]
+  if name == "ge":
+    return values[0] >= values[1]
+  return (len(values) > 2) and (values[1] <= values[0] < values[2])
+
+
+def get_param_number(statement):
+  """The number of the script parameter statement stores, or None."""
+  opcode = get_opcode(statement)
+  if opcode == store_script_param_1:
+    return 1
+  if opcode == store_script_param_2:
+    return 2
+  if (opcode == store_script_param) and (len(statement) == 3) and (type(statement[2]) in integer_types) and (statement[2] > 0):
+    return statement[2]
+  return None
+
+
+class Machine(object):
+  """Runs statement blocks and records what the game could notice."""
+
+  def __init__(self, ops, scripts, seed):
+    import header_operations
+    self.ops = ops
+    self.scripts = scripts
+    self.seed = seed
+    self.global_variables = {}
+    self.registers = {}
+    # (getter opcode, object operands) -> value
+    self.state = {}
+    self.errors = set()
+    self.trace = []
+    self.num_random = 0
+    self.num_steps = 0
+    self.depth = 0
+    # id of a block -> (block, nodes)
+    self.parsed_blocks = {}
+    self.computations = {}
+    for name in computed_operations:
+      self.computations[getattr(header_operations, name)] = computed_operations[name]
+    self.setters = {}
+    for getter in ops.getters:
+      for setter in ops.getters[getter]:
+        self.setters[setter] = getter
+    self.store_random_in_range = header_operations.store_random_in_range
+    self.store_repeat_object = header_operations.store_repeat_object
+
+  def get_value(self, local_variables, operand):
+    if type(operand) in string_types:
+      if operand.startswith(":"):
+        return local_variables.get(operand, 0)
+      if operand.startswith("$"):
+        return self.global_variables.get(operand, get_default_value(self.seed, operand))
+      # Identifiers and quick strings.
+      return get_hash(operand) % 1000
+    if (type(operand) in integer_types) and (operand >= build_optimize.constant_limit):
+      return self.registers.get(operand, get_default_value(self.seed, operand))
+    return operand
+
+  def get_values(self, statement, local_variables):
+    if (type(statement) != list) and (type(statement) != tuple):
+      return []
+    return [self.get_value(local_variables, operand) for operand in statement[1:]]
+
+  def set_value(self, local_variables, operand, value):
+    if type(operand) in string_types:
+      if operand.startswith(":"):
+        local_variables[operand] = value
+      elif operand.startswith("$"):
+        self.global_variables[operand] = value
+    elif (type(operand) in integer_types) and (operand >= build_optimize.constant_limit):
+      self.registers[operand] = value
+
+  def run_block(self, block, params):
+    """Run block with the script parameters params; 1 if it succeeded, 0 if it failed."""
+    entry = self.parsed_blocks.get(id(block))
+    if entry is None:
+      entry = (block, build_optimize.parse_block(block, self.ops))
+      self.parsed_blocks[id(block)] = entry
+    try:
+      self.run_nodes(block, entry[1], {}, params)
+    except BlockFailed:
+      return 0
+    return 1
+
+  def run_nodes(self, block, nodes, local_variables, params):
+    """Run nodes of block one after the other, raising BlockFailed if one of them fails."""
+    ops = self.ops
+    i_node = 0
+    while i_node < len(nodes):
+      self.num_steps += 1
+      if self.num_steps > max_steps:
+        raise StepLimit()
+      node = nodes[i_node]
+      i_node += 1
+      if node[0] == "try":
+        for (start, branch) in node[2]:
+          try:
+            self.run_nodes(block, branch, local_variables, params)
+            break
+          except BlockFailed:
+            pass
+      elif node[0] == "loop":
+        # A failure ends the iteration.
+        statement = block[node[1]]
+        for value in self.get_loop_values(statement, local_variables):
+          self.set_value(local_variables, statement[1], value)
+          try:
+            self.run_nodes(block, node[2], local_variables, params)
+          except BlockFailed:
+            pass
+      elif not self.can_fail(block[node[1]]):
+        self.run_operation(block[node[1]], local_variables, params)
+      else:
+        # A this_or_next condition succeeds if it or the next one does, and
+        # the game runs both.
+        statement = block[node[1]]
+        succeeded = self.test(statement, local_variables, params)
+        while (get_opcode(statement) & ops.this_or_next) and (i_node < len(nodes)) and (nodes[i_node][0] == "op"):
+          statement = block[nodes[i_node][1]]
+          i_node += 1
+          if self.test(statement, local_variables, params):
+            succeeded = 1
+        if not succeeded:
+          raise BlockFailed()
+
+  def can_fail(self, statement):
+    opcode = get_opcode(statement)
+    return (opcode & self.ops.flags) or (opcode in self.ops.can_fail) or (opcode == self.ops.call_script)
+
+  def get_loop_values(self, statement, local_variables):
+    ops = self.ops
+    opcode = statement[0]
+    values = self.get_values(statement, local_variables)[1:]
+    if (opcode == try_for_range) or (opcode == try_for_range_backwards):
+      if len(values) < 2:
+        return []
+      (lower, upper) = values[:2]
+      if opcode == try_for_range:
+        return list(xrange(lower, min(upper, lower + max_iterations)))
+      return list(xrange(upper - 1, max(lower, upper - max_iterations) - 1, -1))
+    # The objects the other loops go through.
+    num_objects = get_hash(self.seed, "objects", opcode, *values) % (max_iterations + 1)
+    return [get_hash(self.seed, "object", opcode, i, *values) % 50 for i in xrange(num_objects)]
+
+  def test(self, statement, local_variables, params):
+    """Run statement, which can fail, and return whether it succeeded."""
+    ops = self.ops
+    opcode = get_opcode(statement)
+    negated = opcode & ops.neg
+    opcode &= ops.mask
+    values = self.get_values(statement, local_variables)
+    if opcode == ops.call_script:
+      succeeded = self.call_script(statement, local_variables)
+    elif opcode in ops.comparisons:
+      succeeded = compare(ops.comparisons[opcode], values)
+    elif opcode in ops.can_fail:
+      if opcode in ops.lhs:
+        # The destination is not read.
+        values = values[1:]
+      self.trace.append(("test", opcode) + tuple(values))
+      succeeded = (get_hash(self.seed, "test", opcode, *values) % 3) != 0
+      if opcode in ops.lhs:
+        self.set_value(local_variables, statement[1], get_hash(self.seed, "result", opcode, *values) % 100)
+    else:
+      self.run_operation(statement, local_variables, params)
+      succeeded = 1
+    if negated:
+      return not succeeded
+    return succeeded
+
+  def call_script(self, statement, local_variables):
+    """Run the script statement calls; whether it succeeded."""
+    arguments = self.get_values(statement, local_variables)[1:]
+    name = statement[1]
+    if (type(name) in string_types) and name.startswith("script_"):
+      name = name[len("script_"):]
+    block = self.scripts.get(name)
+    if (block is None) or (self.depth >= max_call_depth):
+      self.trace.append(("call_script", name) + tuple(arguments))
+      return (not str(name).startswith("cf_")) or ((get_hash(self.seed, "script", name, *arguments) % 3) != 0)
+    self.depth += 1
+    try:
+      return self.run_block(block, arguments)
+    finally:
+      self.depth -= 1
+
+  def run_operation(self, statement, local_variables, params):
+    """Run statement, which cannot fail."""
+    ops = self.ops
+    if (type(statement) != list) and (type(statement) != tuple):
+      self.trace.append((statement,))
+      return
+    opcode = statement[0]
+    values = self.get_values(statement, local_variables)
+    param = get_param_number(statement)
+    computation = self.computations.get(opcode)
+    if param is not None:
+      value = 0
+      if param <= len(params):
+        value = params[param - 1]
+      self.set_value(local_variables, statement[1], value)
+    elif (computation is not None) and (len(values) > max(computation[1])):
+      try:
+        value = compute(computation[0], [values[position] for position in computation[1]])
+      except ZeroDivisionError:
+        self.errors.add((opcode,) + tuple(values))
+        value = 0
+      self.set_value(local_variables, statement[1], value)
+    elif (opcode == self.store_random_in_range) and (len(values) == 3):
+      value = values[1]
+      if values[2] > values[1]:
+        value += get_hash(self.seed, "random", self.num_random) % (values[2] - values[1])
+      self.num_random += 1
+      self.set_value(local_variables, statement[1], value)
+    elif (opcode == self.store_repeat_object) and (len(statement) > 1):
+      self.set_value(local_variables, statement[1], get_hash(self.seed, "repeat object") % 50)
+    elif (opcode in ops.getters) and (len(values) > 1):
+      # The game reports an error if the object does not exist.
+      if values[1] < 0:
+        self.errors.add((opcode,) + tuple(values[1:]))
+      key = (opcode,) + tuple(values[1:])
+      self.set_value(local_variables, statement[1], self.state.get(key, get_hash(self.seed, *key) % 100))
+    elif (opcode in self.setters) and (len(values) > 1):
+      if values[0] < 0:
+        self.errors.add((opcode,) + tuple(values))
+      self.state[(self.setters[opcode],) + tuple(values[:-1])] = values[-1]
+    else:
+      if opcode in ops.lhs:
+        values = values[1:]
+      self.trace.append((opcode,) + tuple(values))
+      if (opcode in ops.writes) and (len(statement) > 1):
+        self.set_value(local_variables, statement[1], get_hash(self.seed, "result", opcode, *values) % 100)
+      else:
+        self.registers[reg0] = get_hash(self.seed, "reg0", opcode, *values) % 100
+
+  def get_changes(self, values):
+    return sorted([(variable, values[variable]) for variable in values
+                   if values[variable] != get_default_value(self.seed, variable)])
+
+  def get_outcome(self, succeeded):
+    """What the game could notice after the run."""
+    registers = [(format_operand(register), value) for (register, value) in self.get_changes(self.registers)]
+    return (int(bool(succeeded)), self.trace, self.get_changes(self.global_variables), registers, sorted(self.state.items()),
+            sorted(self.errors))
+
+
+outcome_names = ["result", "other operations", "global variables", "registers", "game state", "errors"]
+
+
+def show_value(value, width = 300):
+  text = repr(value)
+  if len(text) > width:
+    return text[:width] + "..."
+  return text
+
+
+def describe_difference(before, after):
+  """What differs between the outcomes before and after, or None."""
+  for i in xrange(len(outcome_names)):
+    if before[i] == after[i]:
+      continue
+    if type(before[i]) != list:
+      return "%s differs: before %s, after %s" % (outcome_names[i], show_value(before[i]), show_value(after[i]))
+    position = 0
+    while (position < len(before[i])) and (position < len(after[i])) and (before[i][position] == after[i][position]):
+      position += 1
+    return "%s differ at position %d of %d: before %s, after %s" % (
+      outcome_names[i], position + 1, len(before[i]), show_value(before[i][position:position + 3]),
+      show_value(after[i][position:position + 3]))
+  return None
+
+
+def run_triggers(machine, triggers):
+  """Run triggers that the game checks at the same time, in order."""
+  delayed = []
+  for trigger in triggers:
+    if machine.run_block(trigger[3], []):
+      if trigger[1]:
+        delayed.append(trigger)
+      else:
+        machine.run_block(trigger[4], [])
+  for trigger in delayed:
+    machine.run_block(trigger[4], [])
+
+
+def get_operation_names():
+  """Opcode -> the first name header_operations.py does not call deprecated."""
+  import header_operations
+  names = {}
+  file = open_text(os.path.join(module_system_dir, "header_operations.py"))
+  for line in file:
+    match = re.match(r"(\w+)\s*=", line)
+    if (match is None) or ("deprecated" in line):
+      continue
+    value = getattr(header_operations, match.group(1), None)
+    if (type(value) in integer_types) and (value not in names):
+      names[value] = match.group(1)
+  file.close()
+  return names
+
+
+def format_operand(operand):
+  if (type(operand) in integer_types) and ((operand & ~((1 << op_num_value_bits) - 1)) == opmask_register):
+    return "reg%d" % (operand & ((1 << op_num_value_bits) - 1))
+  return repr(operand)
+
+
+def format_block(block, ops, names, indent):
+  lines = []
+  depth = 0
+  for statement in block:
+    opcode = get_opcode(statement)
+    if (opcode == ops.else_try) or (opcode == ops.try_end):
+      depth -= 1
+    # lt, neq and le have the neg flag.
+    name = names.get(opcode & ~ops.this_or_next)
+    if name is None:
+      name = names.get(opcode & ops.mask, str(opcode & ops.mask))
+      if opcode & ops.neg:
+        name = "neg|" + name
+    if opcode & ops.this_or_next:
+      name = "this_or_next|" + name
+    operands = []
+    if (type(statement) == list) or (type(statement) == tuple):
+      operands = [format_operand(operand) for operand in statement[1:]]
+    lines.append(indent + "  " * max(depth, 0) + "(" + ", ".join([name] + operands) + "),")
+    if (opcode == ops.try_begin) or (opcode == ops.else_try) or (opcode in ops.loops):
+      depth += 1
+  return lines
+
+
+def format_data(pass_name, data, ops, names):
+  if pass_name != "coalesce":
+    return format_block(data, ops, names, "    ")
+  lines = []
+  for trigger in data:
+    lines.append("    (%s, %s, %s," % tuple([repr(value) for value in trigger[:3]]))
+    lines.append("     [")
+    lines.extend(format_block(trigger[3], ops, names, "       "))
+    lines.append("     ], [")
+    lines.extend(format_block(trigger[4], ops, names, "       "))
+    lines.append("     ]),")
+  return lines
+
+
+def get_register_events():
+  import header_triggers
+  return set([getattr(header_triggers, name) for name in build_optimize.register_event_names])
+
+
+def apply_pass(pass_name, data, ops):
+  """data after pass_name: a statement block, or a list of triggers for coalesce."""
+  if pass_name == "peephole":
+    return build_optimize.peephole_optimize_block(data, ops)
+  if pass_name == "dispatch":
+    return build_optimize.dispatch_block(data, ops, [])
+  if pass_name == "inline":
+    scripts = {}
+    for name in case_scripts:
+      if len(case_scripts[name]) <= build_optimize.default_inline_max_operations:
+        script = build_optimize.get_inline_script(name, case_scripts[name], ops)
+        if script is not None:
+          scripts[name] = script
+    return build_optimize.inline_block(data, scripts, ops, {})
+  if pass_name == "hoist":
+    return build_optimize.hoist_block(data, ops, [0, 0])
+  return build_optimize.coalesce_triggers(data, ops, get_register_events(), [])
+
+
+def get_case_params(i_input):
+  """Script parameters of input i_input of a case."""
+  return [i_input % 16 - 3, case_second_params[i_input // 16]] + [get_hash(i_input, i) % 16 - 3 for i in xrange(2, 6)]
+
+
+def run_case_data(pass_name, data, ops, seed, params):
+  machine = Machine(ops, case_scripts, seed)
+  if pass_name == "coalesce":
+    run_triggers(machine, data)
+    return machine.get_outcome(1)
+  return machine.get_outcome(machine.run_block(data, params))
+
+
+def check_case(case, ops):
+  """(why case failed or None, data after the pass)."""
+  (pass_name, description, expected, data) = case
+  new_data = apply_pass(pass_name, data, ops)
+  rewritten = list(new_data) != list(data)
+  if rewritten and (expected == "keep"):
+    return ("the pass rewrote it", new_data)
+  if (not rewritten) and (expected == "rewrite"):
+    return ("the pass left it alone", new_data)
+  for i_input in xrange(num_case_inputs):
+    params = get_case_params(i_input)
+    before = run_case_data(pass_name, data, ops, i_input + 1, params)
+    after = run_case_data(pass_name, new_data, ops, i_input + 1, params)
+    difference = describe_difference(before, after)
+    if difference is not None:
+      return ("with parameters %s %s" % (params, difference), new_data)
+  return (None, new_data)
+
+
+def check_cases(pass_names, ops, verbose):
+  """Check the cases of pass_names; the number of cases that failed."""
+  names = get_operation_names()
+  num_checked = 0
+  num_failed = 0
+  for case in cases:
+    (pass_name, description, expected, data) = case
+    if pass_name not in pass_names:
+      continue
+    num_checked += 1
+    (error, new_data) = check_case(case, ops)
+    if error is None:
+      print("ok      %s: %s" % (pass_name, description))
+    else:
+      print("FAILED  %s: %s: %s" % (pass_name, description, error))
+      num_failed += 1
+    if verbose or (error is not None):
+      print("  before:")
+      for line in format_data(pass_name, data, ops, names):
+        print(line)
+      if list(new_data) != list(data):
+        print("  after:")
+        for line in format_data(pass_name, new_data, ops, names):
+          print(line)
+  if num_failed:
+    print("%d of %d cases failed." % (num_failed, num_checked))
+  else:
+    print("All %d cases passed." % num_checked)
+  return num_failed
+
+
+def get_block_inputs(block):
+  """Script parameters to run a block of the module data with, made of the constants in it."""
+  constants = set()
+  for statement in block:
+    if (type(statement) == list) or (type(statement) == tuple):
+      for operand in statement[1:]:
+        if (type(operand) in integer_types) and (0 <= operand < 200):
+          constants.add(operand)
+  constants = sorted(constants) + [-1, 500]
+  inputs = []
+  for i_input in xrange(min(len(constants), max_module_inputs)):
+    inputs.append([constants[(i_input + 5 * i) % len(constants)] for i in xrange(6)])
+  return inputs
+
+
+def run_module_block(machine, block, params):
+  return machine.run_block(block, params)
+
+
+def run_module_triggers(machine, triggers, params):
+  run_triggers(machine, triggers)
+  return 1
+
+
+def compare_runs(run, before, after, inputs, ops):
+  """Compare run(machine, before) with run(machine, after) for the (seed, params) of inputs.
+
+  Returns the difference, None if there is none, or "skipped" if a run did
+  not end.
+  """
+  for (seed, params) in inputs:
+    outcomes = []
+    for (data, scripts) in (before, after):
+      machine = Machine(ops, scripts, seed)
+      try:
+        outcomes.append(machine.get_outcome(run(machine, data, params)))
+      except (StepLimit, RuntimeError):
+        return "skipped"
+    difference = describe_difference(outcomes[0], outcomes[1])
+    if difference is not None:
+      if not params:
+        return "with seed %d %s" % (seed, difference)
+      return "with parameters %s %s" % (params, difference)
+  return None
+
+
+def get_timing_runs(triggers):
+  """The triggers split into runs of consecutive triggers with the same timing."""
+  runs = []
+  for trigger in triggers:
+    if runs and (tuple(runs[-1][-1][:3]) == tuple(trigger[:3])):
+      runs[-1].append(trigger)
+    else:
+      runs.append([trigger])
+  return runs
+
+
+def copy_triggers(triggers):
+  return [tuple([list(value) if type(value) == list else value for value in trigger]) for trigger in triggers]
+
+
+def get_scripts(scripts):
+  blocks = {}
+  for (kind, name, block) in build_optimize.get_script_blocks(scripts):
+    blocks[name] = list(block)
+  return blocks
+
+
+def check_module(pass_names, ops):
+  """Run the passes on the module data and compare what they changed; the number of differences."""
+  before = {}
+  for (module_name, list_name, get_blocks) in build_optimize.block_lists:
+    module = __import__(module_name)
+    before[module_name] = [(kind, name, list(block)) for (kind, name, block) in get_blocks(getattr(module, list_name))]
+  import module_mission_templates
+  import module_scripts
+  triggers_before = [copy_triggers(mission_template[5]) for mission_template in module_mission_templates.mission_templates]
+  scripts_before = get_scripts(module_scripts.scripts)
+  build_optimize.optimize_module_data(pass_names)
+  build_optimize.print_report()
+  scripts_after = get_scripts(module_scripts.scripts)
+
+  num_checked = 0
+  num_skipped = 0
+  num_different = 0
+  for (module_name, list_name, get_blocks) in build_optimize.block_lists:
+    if ("coalesce" in pass_names) and (module_name == "module_mission_templates"):
+      continue
+    module = sys.modules[module_name]
+    after = list(get_blocks(getattr(module, list_name)))
+    for ((kind, name, old_block), (new_kind, new_name, new_block)) in zip(before[module_name], after):
+      if list(new_block) == old_block:
+        continue
+      num_checked += 1
+      try:
+        inputs = [(i_input + 1, params) for (i_input, params) in enumerate(get_block_inputs(old_block))]
+        difference = compare_runs(run_module_block, (old_block, scripts_before), (new_block, scripts_after), inputs, ops)
+      except build_optimize.UnbalancedBlock:
+        difference = "skipped"
+      if difference == "skipped":
+        num_skipped += 1
+      elif difference is not None:
+        print("DIFFERENT %s %s: %s" % (kind, name, difference))
+        num_different += 1
+
+  if "coalesce" in pass_names:
+    mission_templates = module_mission_templates.mission_templates
+    for i_template in xrange(len(mission_templates)):
+      old_runs = get_timing_runs(triggers_before[i_template])
+      new_runs = get_timing_runs(mission_templates[i_template][5])
+      if len(old_runs) != len(new_runs):
+        print("DIFFERENT mission template %s: the triggers are checked at other times" % mission_templates[i_template][0])
+        num_different += 1
+        continue
+      for (old_run, new_run) in zip(old_runs, new_runs):
+        if copy_triggers(new_run) == old_run:
+          continue
+        num_checked += 1
+        inputs = [(seed, []) for seed in xrange(1, num_trigger_inputs + 1)]
+        try:
+          difference = compare_runs(run_module_triggers, (old_run, scripts_before), (new_run, scripts_after), inputs,
+                                    ops)
+        except build_optimize.UnbalancedBlock:
+          difference = "skipped"
+        if difference == "skipped":
+          num_skipped += 1
+        elif difference is not None:
+          print("DIFFERENT mission template %s, triggers with check interval %s: %s" % (mission_templates[i_template][0], old_run[0][0],
+                                                                                     difference))
+          num_different += 1
+
+  print("Compared %d changed blocks and trigger runs of the module data: %d differ, %d skipped as too long." % (num_checked, num_different,
+                                                                                                              num_skipped))
+  return num_different
+
+
+def main():
+  parser = OptionParser(usage = "usage: %prog [options]",
+                        description = "Check that the optimizer passes of build_module.py keep what the statement blocks they rewrite "
+                                      "do. Exits with 1 if a check fails.")
+  parser.add_option("-p", "--passes", dest = "passes", default = "all",
+                    help = "comma-separated passes to check, or all [default: %default]")
+  parser.add_option("-m", "--module", action = "store_true", dest = "module", default = False,
+                    help = "also run the passes on the module data and compare every block they changed")
+  parser.add_option("-v", "--verbose", action = "store_true", dest = "verbose", default = False,
+                    help = "print every case before and after the pass")
+  (options, args) = parser.parse_args()
+  if args:
+    parser.error("unexpected arguments: " + " ".join(args))
+  try:
+    pass_names = build_optimize.parse_passes(options.passes)
+  except ValueError as error:
+    parser.error(str(error))
+  sys.setrecursionlimit(10000)
+  ops = build_optimize.Operations()
+  failed = check_cases(pass_names, ops, options.verbose)
+  if options.module:
+    failed += check_module(pass_names, ops)
+  if failed:
+    return 1
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,126 @@
+import os
+import sys
+
+# Names the module system uses that Python 3 renamed or dropped. header_common
+# and process_common import everything here, so the exporters and the module
+# files that import them run the same under Python 2.7, Python 3 and PyPy.
+#
+# Python 2 keeps its own builtins; only the missing ones are defined.
+#
+# A Python 2 str is a string of bytes: the text of the module files reaches
+# the output files byte for byte, whatever encoding a file declares
+# (module_strings.py is cp1254, others are UTF-8). Under Python 3 the module
+# system files are therefore decoded with one character per byte, and the
+# output files are encoded the same way, which writes the bytes Python 2
+# writes.
+
+__all__ = ["PY3", "xrange", "long", "string_types", "integer_types", "StringIO", "to_bytes", "open_text", "array_to_bytes",
+           "array_from_bytes", "decode_source"]
+
+PY3 = sys.version_info[0] >= 3
+
+if PY3:
+  import builtins
+  from io import StringIO
+  xrange = range
+  long = int
+  string_types = (str,)
+  integer_types = (int,)
+else:
+  import __builtin__ as builtins
+  from cStringIO import StringIO
+  xrange = builtins.xrange
+  long = builtins.long
+  string_types = (str, builtins.unicode)
+  integer_types = (int, builtins.long)
+
+module_system_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Encoding of module system text under Python 3.
+byte_encoding = "latin-1"
+
+
+def to_bytes(s):
+  """s as bytes, for hashing and binary files."""
+  if PY3 and isinstance(s, str):
+    return s.encode("utf-8")
+  return s
+
+
+def open_text(path, mode = "r"):
+  """Open a text file of the module system or of export_dir."""
+  if PY3:
+    return open(path, mode, encoding = byte_encoding)
+  return open(path, mode)
+
+
+def decode_source(data):
+  """The source of a module system file, read as bytes, ready for compile()."""
+  if PY3:
+    return data.decode(byte_encoding)
+  return data
+
+
+def array_to_bytes(values):
+  if PY3:
+    return values.tobytes()
+  return values.tostring()
+
+
+def array_from_bytes(values, data):
+  """Append the items stored in data to the array values."""
+  if PY3:
+    values.frombytes(to_bytes(data))
+  else:
+    values.fromstring(data)
+
+
+if PY3:
+  import importlib.abc
+  import importlib.util
+
+  class ByteSourceLoader(importlib.abc.SourceLoader):
+    """Loads a module system file through decode_source.
+
+    Its compiled code is not cached: the regular importer would read the
+    cache back for strings it decodes differently.
+    """
+
+    def __init__(self, path):
+      self.path = path
+
+    def get_filename(self, fullname):
+      return self.path
+
+    def get_data(self, path):
+      file = open(path, "rb")
+      data = file.read()
+      file.close()
+      return data
+
+    def source_to_code(self, data, path):
+      return compile(decode_source(data), path, "exec", dont_inherit = True)
+
+  class ByteSourceFinder(object):
+    """sys.meta_path hook for the module system files that are not ASCII."""
+
+    def find_spec(self, fullname, path = None, target = None):
+      if path is not None:
+        return None
+      file_path = os.path.join(module_system_dir, fullname + ".py")
+      try:
+        file = open(file_path, "rb")
+      except IOError:
+        return None
+      data = file.read()
+      file.close()
+      try:
+        data.decode("ascii")
+        return None
+      except UnicodeDecodeError:
+        pass
+      return importlib.util.spec_from_file_location(fullname, file_path, loader = ByteSourceLoader(file_path))
+
+  # compat is imported again after build_module.py unloads the module data.
+  if not [finder for finder in sys.meta_path if type(finder).__name__ == "ByteSourceFinder"]:
+    sys.meta_path.insert(0, ByteSourceFinder())
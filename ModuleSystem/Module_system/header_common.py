@@ -4,6 +4,10 @@
 # DO NOT EDIT THIS FILE!
 ###################################################
 
+from __future__ import print_function
+
+from compat import *
+
 #client events
 multiplayer_event_set_item_selection                          = 0
 multiplayer_event_set_bot_selection                           = 1
@@ -411,16 +415,39 @@ def reg(reg_no):
     cause_error()
   return opmask_register | reg_no
 
-def find_object(objects,object_id):
-  result = -1
-  num_objects = len(objects)
-  i_object = 0
-  object_id_lowercase = object_id.lower()
-  while (i_object < num_objects) and (result == -1):
-    object = objects[i_object]
-    if (object[0].lower() == object_id_lowercase):
-      result = i_object
-    i_object += 1
+# Case-insensitive id -> position index of every object list searched so far,
+# keyed by id() of the list. An index is rebuilt only if its list changes size.
+object_indices = {}
+
+def get_object_index(objects, tag = ""):
+  entry = object_indices.get(id(objects))
+  if (entry is not None) and (entry[0] is objects) and (entry[1] == len(objects)):
+    return entry[2]
+  index = {}
+  for i_object in xrange(len(objects)):
+    object_id_lowercase = objects[i_object][0].lower()
+    if object_id_lowercase in index:
+      if tag:
+        print("WARNING: Duplicate object id: %s_%s (#%d and #%d)" % (tag, object_id_lowercase, index[object_id_lowercase], i_object))
+      else:
+        print("WARNING: Duplicate object id: %s (#%d and #%d)" % (object_id_lowercase, index[object_id_lowercase], i_object))
+    else:
+      index[object_id_lowercase] = i_object
+  object_indices[id(objects)] = (objects, len(objects), index)
+  return index
+
+def find_object(objects,object_id,tag = ""):
+  return get_object_index(objects, tag).get(object_id.lower(), -1)
+
+def find_object_exact(objects,object_id,tag = ""):
+  result = get_object_index(objects, tag).get(object_id.lower(), -1)
+  if (result >= 0) and (objects[result][0] != object_id):
+    # Only ids that differ in case from an earlier object end up here.
+    result = -1
+    for i_object in xrange(len(objects)):
+      if (objects[i_object][0] == object_id):
+        result = i_object
+        break
   return result
 
 s0  =  0
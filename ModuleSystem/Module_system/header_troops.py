@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 from header_common import *
 
 ###################################################
@@ -258,25 +260,16 @@ def wp_firearm(x):
 
 
 def find_troop(troops, troop_id):
-    result = -1
-    num_troops = len(troops)
-    i_troop = 0
-    while (i_troop < num_troops) and (result == -1):
-        troop = troops[i_troop]
-        if (troop[0] == troop_id):
-            result = i_troop
-        else:
-            i_troop += 1
-    return result
+    return find_object_exact(troops, troop_id, "trp")
 
 
 def upgrade(troops, troop1_id, troop2_id):
     troop1_no = find_troop(troops, troop1_id)
     troop2_no = find_troop(troops, troop2_id)
     if (troop1_no == -1):
-        print "Error with upgrade def: Unable to find troop1-id: " + troop1_id
+        print("Error with upgrade def: Unable to find troop1-id: " + troop1_id)
     elif (troop2_no == -1):
-        print "Error with upgrade def: Unable to find troop2-id: " + troop2_id
+        print("Error with upgrade def: Unable to find troop2-id: " + troop2_id)
     else:
         cur_troop = troops[troop1_no]
         cur_troop_length = len(cur_troop)
@@ -295,11 +288,11 @@ def upgrade2(troops, troop1_id, troop2_id, troop3_id):
     troop2_no = find_troop(troops, troop2_id)
     troop3_no = find_troop(troops, troop3_id)
     if (troop1_no == -1):
-        print "Error with upgrade2 def: Unable to find troop1-id: " + troop1_id
+        print("Error with upgrade2 def: Unable to find troop1-id: " + troop1_id)
     elif (troop2_no == -1):
-        print "Error with upgrade2 def: Unable to find troop2-id: " + troop2_id
+        print("Error with upgrade2 def: Unable to find troop2-id: " + troop2_id)
     elif (troop3_no == -1):
-        print "Error with upgrade2 def: Unable to find troop3-id: " + troop3_id
+        print("Error with upgrade2 def: Unable to find troop3-id: " + troop3_id)
     else:
         cur_troop = troops[troop1_no]
         cur_troop_length = len(cur_troop)
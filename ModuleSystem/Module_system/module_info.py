@@ -4,3 +4,11 @@
 # export_dir = "../WOTS/Modules/Native/"
 export_dir = "../../Modules/NativeEnhanced/"
 # export_dir = "C:/Program Files (x86)/Mount&Blade Warband/Modules/Native/"
+
+# Scripts, strings and presentations a release build (build_module.py --release)
+# has to keep even though nothing in the module refers to them, as patterns:
+# release_keep = ["script_my_engine_hook", "prsnt_debug_*"]
+
+# Largest scripts, in operations, that the inline optimizer pass
+# (build_module.py --optimize inline) copies into the blocks calling them:
+# inline_max_operations = 6
@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 from header_common import *
 from module_info import *
@@ -6,6 +8,7 @@ from process_common import *
 
 def compile_action_sets(actions):
   action_codes = []
+  action_indices = []
   for action in actions:
     index = -1
     for i_action_code in xrange(len(action_codes)):
@@ -13,20 +16,19 @@ def compile_action_sets(actions):
         index = i_action_code
         break
     if index == -1:
-      pos = len(action_codes)
+      index = len(action_codes)
       action_codes.append(action[0])
-      action[0] = pos
-    else:
-      action[0] = index
-  return action_codes
+    action_indices.append(index)
+  return (action_codes, action_indices)
 
-def write_actions(action_set,num_action_codes,action_codes,file_name):
-  file = open(export_dir + file_name,"w")
+def write_actions(action_set,action_indices,num_action_codes,action_codes,file_name):
+  file = open_output(export_dir + file_name)
   file.write("%d\n"%num_action_codes)
   for i_action_code in xrange(num_action_codes):
     action_found = 0
-    for action in action_set:
-      if action[0] == i_action_code:
+    for i_action in xrange(len(action_set)):
+      action = action_set[i_action]
+      if action_indices[i_action] == i_action_code:
         file.write(" %s %d %d "%(action_codes[i_action_code],action[1], action[2])) #print flags
         file.write(" %d\n"%(len(action)-3))
         for elem in action[3:]:
@@ -47,15 +49,20 @@ def write_actions(action_set,num_action_codes,action_codes,file_name):
         break
     if not action_found:
       file.write(" none 0 0\n") #oops
+  file.close()
 
 def save_python_header(action_codes):
-  ofile = open("./ID_animations.py","w")
+  ofile = open_output("./ID_animations.py")
   for i_anim in xrange(len(action_codes)):
     ofile.write("anim_%s = %d\n"%(action_codes[i_anim],i_anim))
   ofile.write("\n\n")
   ofile.close()
 
-print "Exporting animations..."
-action_codes = compile_action_sets(animations)
-save_python_header(action_codes)
-write_actions(animations,len(action_codes),action_codes,"actions.txt")
+def export(tables = None):
+  print("Exporting animations...")
+  (action_codes, action_indices) = compile_action_sets(animations)
+  save_python_header(action_codes)
+  write_actions(animations,action_indices,len(action_codes),action_codes,"actions.txt")
+
+if __name__ == "__main__":
+  export()
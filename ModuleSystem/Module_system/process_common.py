@@ -1,30 +1,183 @@
+import hashlib
+import os
 import string
 import types
 
+from compat import *
+
 def convert_to_identifier(s0):
-  s1 = string.replace(s0," ","_")
-  s2 = string.replace(s1,"'","_")
-  s3 = string.replace(s2,"`","_")
-  s4 = string.replace(s3,"(","_")
-  s5 = string.replace(s4,")","_")
-  s6 = string.replace(s5,"-","_")
-  s7 = string.replace(s6,",","")
-  s8 = string.replace(s7,"|","")
-  s9 = string.replace(s8,"\t","_") #Tab
-  s10 = string.lower(s9)
+  s1 = s0.replace(" ","_")
+  s2 = s1.replace("'","_")
+  s3 = s2.replace("`","_")
+  s4 = s3.replace("(","_")
+  s5 = s4.replace(")","_")
+  s6 = s5.replace("-","_")
+  s7 = s6.replace(",","")
+  s8 = s7.replace("|","")
+  s9 = s8.replace("\t","_") #Tab
+  s10 = s9.lower()
   return s10
 
 def convert_to_identifier_with_no_lowercase(s0):
-  s1 = string.replace(s0," ","_")
-  s2 = string.replace(s1,"'","_")
-  s3 = string.replace(s2,"`","_")
-  s4 = string.replace(s3,"(","_")
-  s5 = string.replace(s4,")","_")
-  s6 = string.replace(s5,"-","_")
-  s7 = string.replace(s6,",","")
-  s8 = string.replace(s7,"|","")
-  s9 = string.replace(s8,"\t","_") #Tab
+  s1 = s0.replace(" ","_")
+  s2 = s1.replace("'","_")
+  s3 = s2.replace("`","_")
+  s4 = s3.replace("(","_")
+  s5 = s4.replace(")","_")
+  s6 = s5.replace("-","_")
+  s7 = s6.replace(",","")
+  s8 = s7.replace("|","")
+  s9 = s8.replace("\t","_") #Tab
   return s9
 
 def replace_spaces(s0):
-  return string.replace(string.replace(s0,"\t","_")," ","_")
+  return s0.replace("\t","_").replace(" ","_")
+
+
+# Output files.
+#
+# Exporters write through open_output instead of open(path, "w"). The data
+# goes to a temporary file next to path, and close() moves it over path only
+# if its md5 differs from the file already there. A file that did not change
+# keeps its modification time, and a step that crashes leaves the previous
+# file in place: build_module.py discards the files a failed exporter left
+# open, which removes their temporary files. build_module.py then lists the md5 and size of every output
+# in the output_manifest_name file in export_dir, so that deployment can
+# ship only the files that changed. The md5 recorded there for a file whose
+# size and modification time still match is used instead of reading the file.
+
+output_manifest_name = "build_manifest.txt"
+
+# manifest path -> (modification time, {file name: (md5, size, mtime)})
+output_manifests = {}
+
+def get_md5(path):
+  h = hashlib.md5()
+  file = open(path, "rb")
+  data = file.read(65536)
+  while data:
+    h.update(data)
+    data = file.read(65536)
+  file.close()
+  return h.hexdigest()
+
+# Flag of MoveFileEx to replace an existing file.
+MOVEFILE_REPLACE_EXISTING = 0x1
+
+def replace_file(temp_path, path):
+  """Move temp_path over path in one step, so that path is never missing."""
+  if hasattr(os, "replace"):
+    os.replace(temp_path, path)
+  elif os.name == "nt":
+    # Python 2 on Windows: os.rename does not rename over an existing file.
+    import ctypes
+    if not ctypes.windll.kernel32.MoveFileExA(temp_path, path, MOVEFILE_REPLACE_EXISTING):
+      raise ctypes.WinError()
+  else:
+    os.rename(temp_path, path)
+
+def load_output_manifest(directory):
+  """{file name: (md5, size, mtime)} of the manifest in directory."""
+  path = os.path.join(directory, output_manifest_name)
+  try:
+    mtime = os.stat(path).st_mtime
+  except OSError:
+    return {}
+  if (path in output_manifests) and (output_manifests[path][0] == mtime):
+    return output_manifests[path][1]
+  entries = {}
+  file = open_text(path, "r")
+  for line in file.readlines():
+    fields = line.split(None, 3)
+    if len(fields) == 4:
+      entries[fields[3].rstrip("\r\n")] = (fields[0], int(fields[1]), float(fields[2]))
+  file.close()
+  output_manifests[path] = (mtime, entries)
+  return entries
+
+def is_output_unchanged(path, digest, size):
+  try:
+    stat = os.stat(path)
+  except OSError:
+    return 0
+  if stat.st_size != size:
+    return 0
+  entry = load_output_manifest(os.path.dirname(path)).get(os.path.basename(path))
+  if (entry is not None) and (entry[1] == stat.st_size) and (entry[2] == stat.st_mtime):
+    return entry[0] == digest
+  return get_md5(path) == digest
+
+# OutputFiles that were opened but not closed or discarded yet.
+open_outputs = []
+
+class OutputFile(object):
+  """File returned by open_output."""
+
+  def __init__(self, path, mode = "w"):
+    self.path = path
+    self.temp_path = "%s.%d.tmp" % (path, os.getpid())
+    if "b" in mode:
+      self.file = open(self.temp_path, mode)
+    else:
+      self.file = open_text(self.temp_path, mode)
+    self.write = self.file.write
+    open_outputs.append(self)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    if exc_type is None:
+      self.close()
+    else:
+      self.discard()
+
+  def discard(self):
+    """Close the file and remove it, leaving path as it was."""
+    if self in open_outputs:
+      open_outputs.remove(self)
+    self.file.close()
+    try:
+      os.remove(self.temp_path)
+    except OSError:
+      pass
+
+  def close(self):
+    if self in open_outputs:
+      open_outputs.remove(self)
+    self.file.close()
+    size = os.path.getsize(self.temp_path)
+    if is_output_unchanged(self.path, get_md5(self.temp_path), size):
+      os.remove(self.temp_path)
+    else:
+      replace_file(self.temp_path, self.path)
+
+def open_output(path, mode = "w"):
+  """Open path for writing, replacing it on close() only if it changed."""
+  return OutputFile(path, mode)
+
+def discard_open_outputs():
+  """Discard the output files that are still open, after an exporter failed."""
+  for output in list(open_outputs):
+    output.discard()
+
+def save_output_manifest(directory, file_names):
+  """Write the md5, size and modification time of file_names in directory."""
+  old_entries = load_output_manifest(directory)
+  lines = []
+  for file_name in sorted(file_names):
+    path = os.path.join(directory, file_name)
+    try:
+      stat = os.stat(path)
+    except OSError:
+      continue
+    entry = old_entries.get(file_name)
+    if (entry is not None) and (entry[1] == stat.st_size) and (entry[2] == stat.st_mtime):
+      digest = entry[0]
+    else:
+      digest = get_md5(path)
+    lines.append("%s %d %r %s\n" % (digest, stat.st_size, stat.st_mtime, file_name))
+  path = os.path.join(directory, output_manifest_name)
+  file = open_output(path)
+  file.write("".join(lines))
+  file.close()
@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 import types
 
@@ -22,7 +24,7 @@ sentence_voice_over_pos = 6
 #-------------------------------------------------------
 
 def save_dialog_states(dialog_states):
-  file = open(export_dir + "dialog_states.txt","w")
+  file = open_output(export_dir + "dialog_states.txt")
   for dialog_state in dialog_states:
     file.write("%s\n"%dialog_state)
   file.close()
@@ -43,15 +45,23 @@ def save_dialog_states(dialog_states):
 #      compile_statement(condition,cookies_list)
 #  return cookies_list
 
-def save_triggers(variable_list,variable_uses,triggers,tag_uses,quick_strings):
-  file = open(export_dir + "triggers.txt","w")
+def get_trigger_blocks(triggers):
+  blocks = []
+  for trigger in triggers:
+    blocks.append((0, 1, trigger[trigger_conditions_pos], None))
+    blocks.append((0, 1, trigger[trigger_consequences_pos], None))
+  return blocks
+
+def save_triggers(variable_list,triggers,tag_uses,quick_strings,encode_jobs = 1):
+  writer = StatementBlockWriter(get_trigger_blocks(triggers), variable_list, tag_uses, quick_strings, encode_jobs)
+  file = open_output(export_dir + "triggers.txt")
   file.write("triggersfile version 1\n")
   file.write("%d\n"%len(triggers))
   for i in xrange(len(triggers)):
     trigger = triggers[i]
     file.write("%f %f %f "%(trigger[trigger_check_pos],trigger[trigger_delay_pos],trigger[trigger_rearm_pos]))
-    save_statement_block(file,0,1,trigger[trigger_conditions_pos]  , variable_list, variable_uses,tag_uses,quick_strings)
-    save_statement_block(file,0,1,trigger[trigger_consequences_pos], variable_list, variable_uses,tag_uses,quick_strings)
+    writer.save(file,0,1,trigger[trigger_conditions_pos]  , variable_list,tag_uses,quick_strings)
+    writer.save(file,0,1,trigger[trigger_consequences_pos], variable_list,tag_uses,quick_strings)
 #    for condition in trigger[trigger_conditions_pos]:
 #      save_operation(file,condition,variable_list)
 #    file.write(" %d "%(len(trigger[trigger_consequences_pos])))
@@ -62,48 +72,101 @@ def save_triggers(variable_list,variable_uses,triggers,tag_uses,quick_strings):
 
 
 #=================================================================
-def compile_sentence_tokens(sentences):
-  input_tokens = []
+# States the engine starts or ends conversations in, with fixed numbers.
+engine_dialog_states = ["start","party_encounter","prisoner_liberated","enemy_defeated","party_relieved","event_triggered","close_window","trade","exchange_members", "trade_prisoners","buy_mercenaries","view_char","training","member_chat","prisoner_chat"]
+
+class DialogStateTable(object):
+  """Dialog states in index order and the sentences that use each of them.
+
+  indices maps a state to its position in states. input_sentences[i] holds
+  the numbers of the sentences said in state i, output_sentences[i] those of
+  the sentences that lead to it, both in sentence order.
+  """
+
+  def __init__(self):
+    self.states = []
+    self.indices = {}
+    self.input_sentences = []
+    self.output_sentences = []
+    for state in engine_dialog_states:
+      self.add_state(state)
+
+  def __len__(self):
+    return len(self.states)
+
+  def add_state(self, state):
+    state_no = self.indices.get(state)
+    if state_no is None:
+      state_no = len(self.states)
+      self.states.append(state)
+      self.indices[state] = state_no
+      self.input_sentences.append([])
+      self.output_sentences.append([])
+    return state_no
+
+  def find_state(self, state):
+    return self.indices.get(state, -1)
+
+  def add_output(self, state, sentence_no):
+    state_no = self.add_state(state)
+    self.output_sentences[state_no].append(sentence_no)
+    return state_no
+
+  def add_input(self, state, sentence_no):
+    """Return the number of state, or -1 if no sentence leads to it."""
+    state_no = self.find_state(state)
+    if state_no >= 0:
+      self.input_sentences[state_no].append(sentence_no)
+    return state_no
+
+  def get_input_sentences(self, state):
+    state_no = self.find_state(state)
+    if state_no < 0:
+      return []
+    return self.input_sentences[state_no]
+
+  def get_output_sentences(self, state):
+    state_no = self.find_state(state)
+    if state_no < 0:
+      return []
+    return self.output_sentences[state_no]
+
+  def is_dead_end(self, state_no):
+    """Whether sentences lead to state_no but none is said in it."""
+    return (state_no >= len(engine_dialog_states)) and not self.input_sentences[state_no]
+
+def compile_dialog_states(sentences):
+  """Number the dialog states of sentences.
+
+  Returns (state table, input state of each sentence, output state of each
+  sentence). States are numbered in the order sentences lead to them, after
+  the engine states. An input state no sentence leads to is -1.
+  """
+  states = DialogStateTable()
   output_tokens = []
-  dialog_states = ["start","party_encounter","prisoner_liberated","enemy_defeated","party_relieved","event_triggered","close_window","trade","exchange_members", "trade_prisoners","buy_mercenaries","view_char","training","member_chat","prisoner_chat"]
-  dialog_state_usages = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-  for sentence in sentences:
-    output_token_id = -1
-    output_token = sentence[opt_token_pos]
-    found = 0
-    for i_t in xrange(len(dialog_states)):
-      if output_token == dialog_states[i_t]:
-        output_token_id = i_t
-        found = 1
-        break
-    if not found:
-      dialog_states.append(output_token)
-      dialog_state_usages.append(0)
-      output_token_id = len(dialog_states) - 1
-    output_tokens.append(output_token_id)
-  for sentence in sentences:
-    input_token_id = -1
-    input_token = sentence[ipt_token_pos]
-    found = 0
-    for i_t in xrange(len(dialog_states)):
-      if input_token == dialog_states[i_t]:
-        input_token_id = i_t
-        dialog_state_usages[i_t] = dialog_state_usages[i_t] + 1
-        found = 1
-        break
-    if not found:
-      print sentence[ipt_token_pos]
-      print sentence[text_pos]
-      print sentence[opt_token_pos]
-      print "**********************************************************************************"
-      print "ERROR: INPUT TOKEN NOT FOUND:" + input_token
-      print "**********************************************************************************"
-      print "**********************************************************************************"
-    input_tokens.append(input_token_id)
-  save_dialog_states(dialog_states)
-  for i_t in xrange(len(dialog_states)):
-    if dialog_state_usages[i_t] == 0:
-      print "ERROR: Output token not found: " + dialog_states[i_t]
+  for i_sentence in xrange(len(sentences)):
+    output_tokens.append(states.add_output(sentences[i_sentence][opt_token_pos], i_sentence))
+  input_tokens = []
+  for i_sentence in xrange(len(sentences)):
+    input_tokens.append(states.add_input(sentences[i_sentence][ipt_token_pos], i_sentence))
+  return (states, input_tokens, output_tokens)
+
+def compile_sentence_tokens(sentences):
+  (states, input_tokens, output_tokens) = compile_dialog_states(sentences)
+  for i_sentence in xrange(len(sentences)):
+    if input_tokens[i_sentence] < 0:
+      sentence = sentences[i_sentence]
+      print(sentence[ipt_token_pos])
+      print(sentence[text_pos])
+      print(sentence[opt_token_pos])
+      print("**********************************************************************************")
+      print("ERROR: INPUT TOKEN NOT FOUND:" + sentence[ipt_token_pos])
+      print("**********************************************************************************")
+      print("**********************************************************************************")
+  save_dialog_states(states.states)
+  for i_t in xrange(len(states)):
+    if states.is_dead_end(i_t):
+      print("ERROR: Output token not found: " + states.states[i_t])
   return (input_tokens, output_tokens)
 
 def create_auto_id(sentence,auto_ids):
@@ -115,11 +178,11 @@ def create_auto_id(sentence,auto_ids):
       i  = lt
     auto_id = "dlga_" + text[0:i]
     done = 0
-    if auto_ids.has_key(auto_id) and (auto_ids[auto_id] == text):
+    if auto_id in auto_ids and (auto_ids[auto_id] == text):
       done = 1
     while (i <= lt) and not done:
       auto_id = "dlga_" + text[0:i]
-      if auto_ids.has_key(auto_id):
+      if auto_id in auto_ids:
         if auto_ids[auto_id] == text:
           done = 1
         else:
@@ -130,77 +193,93 @@ def create_auto_id(sentence,auto_ids):
     if not done:
       number = 1
       new_auto_id = auto_id + str(number)
-      while auto_ids.has_key(new_auto_id):
+      while new_auto_id in auto_ids:
         number += 1
         new_auto_id = auto_id + str(number)
       auto_id = new_auto_id
       auto_ids[auto_id] = text
     return auto_id
   
-def create_auto_id2(sentence,auto_ids):
+def create_auto_id2(sentence,auto_ids,auto_id_numbers = None):
+    # auto_id_numbers holds the last number given to each "dlga_<input>:<output>"
+    # id. Numbered ids are never removed, so the search for a free one can
+    # start after it.
     text = sentence[text_pos]
     token_ipt = convert_to_identifier(sentence[ipt_token_pos])
     token_opt = convert_to_identifier(sentence[opt_token_pos])
-    done = 0
     auto_id = "dlga_" + token_ipt + ":" + token_opt
-    done = 0
-    if not auto_ids.has_key(auto_id):
-      done = 1
-    else:
-      if auto_ids.has_key(auto_id) and (auto_ids[auto_id] == text):
-        done = 1
-    if not done:
-      number = 1
+    if auto_ids.get(auto_id, text) != text:
+      if auto_id_numbers is None:
+        number = 1
+      else:
+        number = auto_id_numbers.get(auto_id, 0) + 1
       new_auto_id = auto_id + "." + str(number)
-      while auto_ids.has_key(new_auto_id):
+      while new_auto_id in auto_ids:
         number += 1
         new_auto_id = auto_id + "." + str(number)
+      if auto_id_numbers is not None:
+        auto_id_numbers[auto_id] = number
       auto_id = new_auto_id
     auto_ids[auto_id] = text
     return auto_id
  
-def save_sentences(variable_list,variable_uses,sentences,tag_uses,quick_strings,input_states,output_states):
-  file = open(export_dir + "conversation.txt","w")
+def get_sentence_blocks(sentences):
+  blocks = []
+  for sentence in sentences:
+    blocks.append((0, 1, sentence[sentence_conditions_pos], None))
+    blocks.append((0, 1, sentence[sentence_consequences_pos], None))
+  return blocks
+
+def save_sentences(variable_list,sentences,tag_uses,quick_strings,input_states,output_states,encode_jobs = 1):
+  # A malformed line is reported below, so it leaves all lines to the serial
+  # encoder.
+  try:
+    blocks = get_sentence_blocks(sentences)
+  except:
+    encode_jobs = 1
+    blocks = []
+  writer = StatementBlockWriter(blocks, variable_list, tag_uses, quick_strings, encode_jobs)
+  file = open_output(export_dir + "conversation.txt")
   file.write("dialogsfile version 2\n")
   file.write("%d\n"%len(sentences))
   # Create an empty dictionary
   auto_ids = {}
+  auto_id_numbers = {}
   for i in xrange(len(sentences)):
     sentence = sentences[i]
+    writer.seek(2 * i)
     try:
-      dialog_id = create_auto_id2(sentence,auto_ids)
+      dialog_id = create_auto_id2(sentence,auto_ids,auto_id_numbers)
       file.write("%s %d %d "%(dialog_id,sentence[speaker_pos],input_states[i]))
-      save_statement_block(file, 0, 1, sentence[sentence_conditions_pos], variable_list,variable_uses,tag_uses,quick_strings)
+      writer.save(file, 0, 1, sentence[sentence_conditions_pos], variable_list,tag_uses,quick_strings)
 
-      file.write("%s "%(string.replace(sentence[text_pos]," ","_")))
+      file.write("%s "%(sentence[text_pos].replace(" ","_")))
       if (len(sentence[text_pos]) == 0):
         file.write("NO_TEXT ")
       file.write(" %d "%(output_states[i]))
-      save_statement_block(file, 0, 1, sentence[sentence_consequences_pos], variable_list,variable_uses,tag_uses,quick_strings)
+      writer.save(file, 0, 1, sentence[sentence_consequences_pos], variable_list,tag_uses,quick_strings)
       if (len(sentence) > sentence_voice_over_pos):
         file.write("%s "%sentence[sentence_voice_over_pos])
       else:
         file.write("NO_VOICEOVER ")
       file.write("\n")
     except:
-      print "Error in dialog line:"
-      print sentence
+      print("Error in dialog line:")
+      print(sentence)
   file.close()
 
 # Registered cookies is a list which enables the order of cookies to remain fixed across changes.
 # In order to remove cookies not used anymore, edit the cookies_registery.py and remove all entries.
 
-print "exporting triggers..."
-variable_uses = []
-variables = load_variables(export_dir,variable_uses)
-tag_uses = load_tag_uses(export_dir)
-quick_strings = load_quick_strings(export_dir)
-#compile_variables(variables)
-save_triggers(variables,variable_uses,triggers,tag_uses,quick_strings)
-print "exporting dialogs..."
-(input_states,output_states) = compile_sentence_tokens(dialogs)
-save_sentences(variables,variable_uses,dialogs,tag_uses,quick_strings,input_states,output_states)
-save_variables(export_dir,variables,variable_uses)
-save_tag_uses(export_dir, tag_uses)
-save_quick_strings(export_dir,quick_strings)
-#print "finished."
+def export(tables):
+  print("exporting triggers...")
+  #compile_variables(variables)
+  save_triggers(tables.variables,triggers,tables.tag_uses,tables.quick_strings,tables.encode_jobs)
+  print("exporting dialogs...")
+  (input_states,output_states) = compile_sentence_tokens(dialogs)
+  save_sentences(tables.variables,dialogs,tables.tag_uses,tables.quick_strings,input_states,output_states,tables.encode_jobs)
+
+if __name__ == "__main__":
+  tables = BuildTables(export_dir)
+  export(tables)
+  tables.save()
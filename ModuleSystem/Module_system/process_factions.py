@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 from module_info import *
 from module_factions import *
 
@@ -24,14 +26,14 @@ def compile_relations():
         if factions[j_f][faction_name_pos] == rel_name:
           other_pos = j_f
       if other_pos == -1:
-        print "ERROR faction not found: "+ rel_name
+        print("ERROR faction not found: "+ rel_name)
       else:
         relations[other_pos][i_faction] = rel[1]
         relations[i_faction][other_pos] = rel[1]
   return relations
 
 def save_factions(relations):
-  file = open(export_dir + "factions.txt","w")
+  file = open_output(export_dir + "factions.txt")
   file.write("factionsfile version 1\n")
   file.write("%d\n"%len(factions))
   for i_faction in xrange(len(factions)):
@@ -58,14 +60,17 @@ def two_to_pow(x):
   return result
 
 def save_python_header():
-  file = open("./ID_factions.py","w")
+  file = open_output("./ID_factions.py")
   for i_faction in xrange(len(factions)):
     file.write("fac_%s = %d\n"%(factions[i_faction][0],i_faction))
   file.write("\n\n")
   file.close()
 
-print "Exporting faction data..."
-save_python_header()
-relations = compile_relations()
-save_factions(relations)
-  
+def export(tables = None):
+  print("Exporting faction data...")
+  save_python_header()
+  relations = compile_relations()
+  save_factions(relations)
+
+if __name__ == "__main__":
+  export()
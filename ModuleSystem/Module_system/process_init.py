@@ -1,37 +1,51 @@
+from __future__ import print_function
+
 from module_info import *
 from process_operations import *
 import os
 
-print "Initializing..."
+def remove_table_files():
+  try:
+    os.remove(export_dir + 'tag_uses.dat')
+  except:
+    a = []
+  try:
+    os.remove(export_dir + 'quick_strings.txt')
+  except:
+    a = []
+  try:
+    os.remove(export_dir + 'variables.txt')
+  except:
+    a = []
+  try:
+    os.remove(export_dir + 'variable_uses.txt')
+  except:
+    a = []
+
+def export(tables):
+  print("Initializing...")
+  # The tables start over in memory. Their files are only replaced when they
+  # are saved, and only if their contents changed.
+  tables.reset()
 
-try:
-  os.remove(export_dir + 'tag_uses.txt')
-except:
-  a = []
-try:
-  os.remove(export_dir + 'quick_strings.txt')
-except:
-  a = []
-try:
-  os.remove(export_dir + 'variables.txt')
-except:
-  a = []
-try:
-  os.remove(export_dir + 'variable_uses.txt')
-except:
-  a = []
+  variables = []
+  variable_uses = []
+  try:
+    file = open_text("variables.txt","r")
+    var_list = file.readlines()
+    file.close()
+    for v in var_list:
+      vv = v.strip()
+      if vv:
+        variables.append(vv)
+        variable_uses.append(int(1))
+    tables.set_variables(VariableTable(variables, variable_uses))
+  except:
+    print("variables.txt not found. Creating new variables.txt file")
 
-variables = []
-variable_uses = []
-try:
-  file = open("variables.txt","r")
-  var_list = file.readlines()
-  file.close()
-  for v in var_list:
-    vv = string.strip(v)
-    if vv:
-      variables.append(vv)
-      variable_uses.append(int(1))
-  save_variables(export_dir, variables, variable_uses)
-except:
-  print "variables.txt not found. Creating new variables.txt file"
+if __name__ == "__main__":
+  # The exporters run after this one read the tables from export_dir.
+  remove_table_files()
+  tables = BuildTables(export_dir)
+  export(tables)
+  tables.save()
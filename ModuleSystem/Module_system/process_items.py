@@ -1,27 +1,32 @@
+from __future__ import print_function
+
 import string
 
-from process_common import *
+from module_info import *
 from module_items import *
 
+from process_common import *
+from process_operations import *
+
 def get_item_code(item):
   prefix = "it_"
   code = prefix + item[0]
   return code
 
 def save_python_header():
-  file = open("./ID_items.py","w")
+  file = open_output("./ID_items.py")
   for i_item in xrange(len(items)):
     file.write("itm_%s = %d\n"%(convert_to_identifier(items[i_item][0]),i_item))
   file.close()
 
-def write_items(variable_list,variable_uses,tag_uses,quick_strings):
+def write_items(variable_list,tag_uses,quick_strings):
   itemkinds_file_name = export_dir + "item_kinds1.txt"
-  ofile = open(itemkinds_file_name,"w")
+  ofile = open_output(itemkinds_file_name)
   ofile.write("itemsfile version 3\n")
   ofile.write("%d\n"%len(items))
   for item in items:
     if (item[3] & itp_merchandise) > 0:
-      id_no = find_object(items,convert_to_identifier(item[0]))
+      id_no = find_object(items,convert_to_identifier(item[0]),"itm")
       add_tag_use(tag_uses,tag_item,id_no)
     ofile.write(" itm_%s %s %s %d "%(convert_to_identifier(item[0]),replace_spaces(item[1]),replace_spaces(item[1]),len(item[2])))
     item_variations = item[2]
@@ -52,25 +57,17 @@ def write_items(variable_list,variable_uses,tag_uses,quick_strings):
     trigger_list = []
     if (len(item) > 8):
       trigger_list = item[8]
-    save_simple_triggers(ofile,trigger_list, variable_list,variable_uses,tag_uses,quick_strings)
+    save_simple_triggers(ofile,trigger_list, variable_list,tag_uses,quick_strings)
 
 
   ofile.close()
 
-print "Exporting item data..."
-save_python_header()
-
-from module_info import *
-
-from process_common import *
-from process_operations import *
+def export(tables):
+  print("Exporting item data...")
+  save_python_header()
+  write_items(tables.variables,tables.tag_uses,tables.quick_strings)
 
-variable_uses = []
-variables = load_variables(export_dir,variable_uses)
-tag_uses = load_tag_uses(export_dir)
-quick_strings = load_quick_strings(export_dir)
-write_items(variables,variable_uses,tag_uses,quick_strings)
-save_variables(export_dir,variables,variable_uses)
-save_tag_uses(export_dir,tag_uses)
-save_quick_strings(export_dir,quick_strings)
-#print "Finished with Items."
+if __name__ == "__main__":
+  tables = BuildTables(export_dir)
+  export(tables)
+  tables.save()
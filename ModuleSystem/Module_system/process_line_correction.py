@@ -1,8 +1,10 @@
-file = open("module_scripts.py","r")
+from compat import *
+
+file = open_text("module_scripts.py","r")
 lines = file.readlines()
 file.close()
 
-file = open("module_scripts.py","w")
+file = open_text("module_scripts.py","w")
 
 level = 0
 for line in lines:
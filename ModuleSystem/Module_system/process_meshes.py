@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 from header_common import *
 from module_info import *
@@ -6,7 +8,7 @@ from module_meshes import *
 from process_common import *
 
 def save_meshes():
-  ofile = open(export_dir + "meshes.txt","w")
+  ofile = open_output(export_dir + "meshes.txt")
   ofile.write("%d\n"%len(meshes))
   for i_mesh in xrange(len(meshes)):
     mesh = meshes[i_mesh]
@@ -14,12 +16,16 @@ def save_meshes():
   ofile.close()
 
 def save_python_header():
-  ofile = open("./ID_meshes.py","w")
+  ofile = open_output("./ID_meshes.py")
   for i_mesh in xrange(len(meshes)):
     ofile.write("mesh_%s = %d\n"%(meshes[i_mesh][0],i_mesh))
   ofile.write("\n\n")
   ofile.close()
 
-print "Exporting meshes..."
-save_python_header()
-save_meshes()
+def export(tables = None):
+  print("Exporting meshes...")
+  save_python_header()
+  save_meshes()
+
+if __name__ == "__main__":
+  export()
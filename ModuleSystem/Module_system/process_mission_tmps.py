@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 import types
 
@@ -14,19 +16,32 @@ mission_template_desc_pos = 3
 mission_template_groups_pos =4
 mission_template_triggers_pos = 5
 
-def save_triggers(file,template_name,triggers,variable_list,variable_uses,tag_uses,quick_strings):
+def get_trigger_blocks(mission_templates):
+  blocks = []
+  for mission_template in mission_templates:
+    template_name = convert_to_identifier(mission_template[mission_template_name_pos])
+    triggers = mission_template[mission_template_triggers_pos]
+    for i in xrange(len(triggers)):
+      label = ("mission template trigger", "%s #%d" % (template_name, i))
+      blocks.append((0, 1, triggers[i][trigger_conditions_pos], label))
+      blocks.append((0, 1, triggers[i][trigger_consequences_pos], label))
+  return blocks
+
+def save_triggers(file,template_name,triggers,variable_list,tag_uses,quick_strings,writer):
   file.write("%d\n"%len(triggers))
   for i in xrange(len(triggers)):
     trigger = triggers[i]
     file.write("%f %f %f "%(trigger[trigger_check_pos],trigger[trigger_delay_pos],trigger[trigger_rearm_pos]))
-    save_statement_block(file, 0, 1, trigger[trigger_conditions_pos]  , variable_list,variable_uses,tag_uses,quick_strings)
-    save_statement_block(file, 0, 1, trigger[trigger_consequences_pos], variable_list,variable_uses,tag_uses,quick_strings)
+    start_time = get_encode_timer()
+    writer.save(file, 0, 1, trigger[trigger_conditions_pos]  , variable_list,tag_uses,quick_strings)
+    writer.save(file, 0, 1, trigger[trigger_consequences_pos], variable_list,tag_uses,quick_strings)
+    record_encode_time("mission template trigger", "%s #%d" % (template_name, i), start_time)
     file.write("\n")
   file.write("\n")
 
-def save_mission_template_group(file,entry):
+def save_mission_template_group(file,entry,tag_uses):
   if (len(entry[5]) > 8):
-    print "ERROR: Too many item_overrides!"
+    print("ERROR: Too many item_overrides!")
     error()
   file.write("%d %d %d %d %d %d  "%(entry[0],entry[1],entry[2],entry[3],entry[4], len(entry[5])))
   for item_override in entry[5]:
@@ -34,37 +49,37 @@ def save_mission_template_group(file,entry):
     file.write("%d "%(item_override))
   file.write("\n")
     
-def save_mission_templates(variables,variable_uses,tag_uses,quick_strings):
-  file = open(export_dir + "mission_templates.txt","w")
+def save_mission_templates(variables,tag_uses,quick_strings,encode_jobs = 1):
+  writer = StatementBlockWriter(get_trigger_blocks(mission_templates), variables, tag_uses, quick_strings, encode_jobs)
+  file = open_output(export_dir + "mission_templates.txt")
   file.write("missionsfile version 1\n")
   file.write(" %d\n"%(len(mission_templates)))
   for mission_template in mission_templates:
     file.write("mst_%s %s %d "%(convert_to_identifier(mission_template[mission_template_name_pos]),convert_to_identifier(mission_template[mission_template_name_pos]),mission_template[mission_template_flags_pos]))
     file.write(" %d\n"%(mission_template[mission_template_types_pos]))
-    file.write("%s \n"%(string.replace(mission_template[mission_template_desc_pos]," ","_")))
+    file.write("%s \n"%(mission_template[mission_template_desc_pos].replace(" ","_")))
     file.write("\n%d "%len(mission_template[mission_template_groups_pos]))
     for group in mission_template[mission_template_groups_pos]:
-      save_mission_template_group(file,group)
-    save_triggers(file,convert_to_identifier(mission_template[mission_template_name_pos]), mission_template[mission_template_triggers_pos],variables,variable_uses,tag_uses,quick_strings)
+      save_mission_template_group(file,group,tag_uses)
+    save_triggers(file,convert_to_identifier(mission_template[mission_template_name_pos]), mission_template[mission_template_triggers_pos],variables,tag_uses,quick_strings,writer)
     file.write("\n")
   file.close()
 
 def save_python_header():
-  file = open("./ID_mission_templates.py","w")
+  file = open_output("./ID_mission_templates.py")
   for i_mission_template in xrange(len(mission_templates)):
     file.write("mst_%s = %d\n"%(mission_templates[i_mission_template][0],i_mission_template))
   file.close()
 
-print "Exporting mission_template data..."
-save_python_header()
-variable_uses = []
-variables = load_variables(export_dir, variable_uses)
-tag_uses = load_tag_uses(export_dir)
-quick_strings = load_quick_strings(export_dir)
-save_mission_templates(variables,variable_uses,tag_uses,quick_strings)
-save_variables(export_dir,variables,variable_uses)
-save_tag_uses(export_dir,tag_uses)
-save_quick_strings(export_dir,quick_strings)
+def export(tables):
+  print("Exporting mission_template data...")
+  save_python_header()
+  save_mission_templates(tables.variables,tables.tag_uses,tables.quick_strings,tables.encode_jobs)
+
+if __name__ == "__main__":
+  tables = BuildTables(export_dir)
+  export(tables)
+  tables.save()
 
 #print "Finished."
   
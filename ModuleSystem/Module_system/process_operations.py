@@ -1,107 +1,91 @@
+from __future__ import print_function
+
+import hashlib
 import string
+import struct
+import sys
+import time
+import traceback
 import types
 
+from array import array
+
 from process_common import *
 from header_common import *
 from header_operations import *
 
-from module_strings import *
-from module_skills import *
-from module_music import *
-from module_meshes import *
-from module_sounds import *
-from module_items import *
-from module_troops import *
-from module_factions import *
-from module_quests import *
-from module_party_templates import *
-from module_parties import *
-from module_scenes import *
-from module_scripts import *
-from module_mission_templates import *
-from module_game_menus import *
-from module_particle_systems import *
-from module_scene_props import *
-from module_scene_props import *
-from module_presentations import *
-from module_map_icons import *
-from module_tableau_materials import *
-from module_animations import *
-
+# Object lists that identifiers like "itm_sword" resolve against, by tag:
+# (tag type, module, list). A module is imported the first time an id of its
+# list is resolved, so an exporter loads only the module data it refers to.
+object_lists = {
+  "str":     (tag_string,       "module_strings",           "strings"),
+  "itm":     (tag_item,         "module_items",             "items"),
+  "trp":     (tag_troop,        "module_troops",            "troops"),
+  "fac":     (tag_faction,      "module_factions",          "factions"),
+  "qst":     (tag_quest,        "module_quests",            "quests"),
+  "pt":      (tag_party_tpl,    "module_party_templates",   "party_templates"),
+  "p":       (tag_party,        "module_parties",           "parties"),
+  "scn":     (tag_scene,        "module_scenes",            "scenes"),
+  "mt":      (tag_mission_tpl,  "module_mission_templates", "mission_templates"),
+  "mnu":     (tag_menu,         "module_game_menus",        "game_menus"),
+  "script":  (tag_script,       "module_scripts",           "scripts"),
+  "psys":    (tag_particle_sys, "module_particle_systems",  "particle_systems"),
+  "spr":     (tag_scene_prop,   "module_scene_props",       "scene_props"),
+  "prsnt":   (tag_presentation, "module_presentations",     "presentations"),
+  "snd":     (tag_sound,        "module_sounds",            "sounds"),
+  "icon":    (tag_map_icon,     "module_map_icons",         "map_icons"),
+  "skl":     (tag_skill,        "module_skills",            "skills"),
+  "track":   (tag_track,        "module_music",             "tracks"),
+  "mesh":    (tag_mesh,         "module_meshes",            "meshes"),
+  "anim":    (tag_animation,    "module_animations",        "animations"),
+  "tableau": (tag_tableau,      "module_tableau_materials", "tableaus"),
+}
+
+# tag type -> tag of object_lists.
+object_list_tags = dict([(object_lists[tag][0], tag) for tag in object_lists])
+
+# tag -> (tag type, object list) of the lists loaded so far.
+object_tags = {}
+
+def get_object_tag(tag):
+  """Return (tag type, object list) of tag, or None if it has no list."""
+  entry = object_tags.get(tag)
+  if (entry is None) and (tag in object_lists):
+    (tag_type, module_name, list_name) = object_lists[tag]
+    __import__(module_name)
+    entry = (tag_type, getattr(sys.modules[module_name], list_name))
+    object_tags[tag] = entry
+  return entry
+
+def load_object_tags():
+  """Load every object list and return object_tags."""
+  for tag in object_lists:
+    get_object_tag(tag)
+  return object_tags
+
+def get_object_modules():
+  modules = [module_name for (tag_type, module_name, list_name) in object_lists.values()]
+  modules.sort()
+  return modules
 
 def get_id_value(tag, identifier, tag_uses):
   tag_type = -1
   id_no = -1
-  if (tag == "str"):
-    id_no = find_object(strings,identifier)
-    tag_type = tag_string
-  elif (tag == "itm"):
-    id_no = find_object(items,identifier)
-    tag_type = tag_item
-  elif (tag == "trp"):
-    id_no = find_object(troops,identifier)
-    tag_type = tag_troop
-  elif (tag == "fac"):
-    id_no = find_object(factions,identifier)
-    tag_type = tag_faction
-  elif (tag == "qst"):
-    id_no = find_object(quests,identifier)
-    tag_type = tag_quest
-  elif (tag == "pt"):
-    id_no = find_object(party_templates,identifier)
-    tag_type = tag_party_tpl
-  elif (tag == "p"):
-    id_no = find_object(parties,identifier)
-    tag_type = tag_party
-  elif (tag == "scn"):
-    id_no = find_object(scenes,identifier)
-    tag_type = tag_scene
-  elif (tag == "mt"):
-    id_no = find_object(mission_templates,identifier)
-    tag_type = tag_mission_tpl
-  elif (tag == "mnu"):
-    id_no = find_object(game_menus,identifier)
-    tag_type = tag_menu
-  elif (tag == "script"):
-    id_no = find_object(scripts,identifier)
-    tag_type = tag_script
-  elif (tag == "psys"):
-    id_no = find_object(particle_systems,identifier)
-    tag_type = tag_particle_sys
-  elif (tag == "spr"):
-    id_no = find_object(scene_props,identifier)
-    tag_type = tag_scene_prop
-  elif (tag == "prsnt"):
-    id_no = find_object(presentations,identifier)
-    tag_type = tag_presentation
-  elif (tag == "snd"):
-    id_no = find_object(sounds,identifier)
-    tag_type = tag_sound
-  elif (tag == "icon"):
-    id_no = find_object(map_icons,identifier)
-    tag_type = tag_map_icon
-  elif (tag == "skl"):
-    id_no = find_object(skills,identifier)
-    tag_type = tag_skill
-  elif (tag == "track"):
-    id_no = find_object(tracks,identifier)
-    tag_type = tag_track
-  elif (tag == "mesh"):
-    id_no = find_object(meshes,identifier)
-    tag_type = tag_mesh
-  elif (tag == "anim"):
-    id_no = find_object(animations,identifier)
-    tag_type = tag_animation
-  elif (tag == "tableau"):
-    id_no = find_object(tableaus,identifier)
-    tag_type = tag_tableau
+  entry = object_tags.get(tag)
+  if (entry is None) and (tag in object_lists):
+    entry = get_object_tag(tag)
+  if entry is not None:
+    (tag_type, objects) = entry
+    if (chunk_object_tags is not None) and (tag not in chunk_object_tags):
+      index_chunk_objects(tag, objects)
+    id_no = find_object(objects,identifier,tag)
 
   if (tag_type > -1 and id_no > -1):
     add_tag_use(tag_uses,tag_type,id_no)
   return (tag_type, id_no)
   
 def get_identifier_value(str, tag_uses):
-  underscore_pos = string.find(str, "_")
+  underscore_pos = str.find("_")
   result = -1
   if (underscore_pos > 0):
     tag_str = str[0:underscore_pos]
@@ -109,116 +93,415 @@ def get_identifier_value(str, tag_uses):
     (tag_type, id_no) = get_id_value(tag_str,id_str,tag_uses)
     if (tag_type > 0):
       if (id_no < 0):
-        print "Error: Unable to find object:" + str
+        print("Error: Unable to find object:" + str)
       else:
         result = id_no | (tag_type << op_num_value_bits)
     else:
-      print "Error: Unrecognized tag:" +tag_str + "in object:" + str
+      print("Error: Unrecognized tag:" +tag_str + "in object:" + str)
   else:
-    print "Error: Invalid object:" +str + ".Variables should start with $ sign and references should start with a tag"
+    print("Error: Invalid object:" +str + ".Variables should start with $ sign and references should start with a tag")
   return result
 
+class QuickStringTable(object):
+  """Quick strings in index order, as [qstr_ id, text] pairs.
+
+  key_indices maps each id to its last position, which is the entry the old
+  linear search returned. text_indices is the reverse map from a text to the
+  position it is stored at. The auto-id allocator only ever adds new ids and
+  stores each text once, so a text found there is the entry the prefix
+  search would stop at. Tables loaded with repeated ids or texts skip that
+  shortcut and always take the prefix search.
+  """
+
+  def __init__(self, quick_strings = None):
+    self.entries = []
+    self.key_indices = {}
+    self.text_indices = {}
+    self.use_text_indices = 1
+    if quick_strings:
+      for quick_string in quick_strings:
+        self.append(quick_string[0], quick_string[1])
+
+  def __len__(self):
+    return len(self.entries)
+
+  def __getitem__(self, index):
+    return self.entries[index]
+
+  def append(self, key, text):
+    index = len(self.entries)
+    if (key in self.key_indices) or (text in self.text_indices):
+      self.use_text_indices = 0
+    else:
+      self.text_indices[text] = index
+    self.key_indices[key] = index
+    self.entries.append([key, text])
+    return index
+
+  def find_key(self, key):
+    return self.key_indices.get(key, -1)
+
+  def insert_with_auto_id(self, sentence):
+    text = convert_to_identifier_with_no_lowercase(sentence)
+    sentence = replace_spaces(sentence)
+    if self.use_text_indices:
+      index = self.text_indices.get(sentence, -1)
+      if index >= 0:
+        return index
+    i = 20
+    lt = len(text)
+    if (i > lt):
+      i  = lt
+    while (i <= lt):
+      auto_id = "qstr_" + text[0:i]
+      index = self.find_key(auto_id)
+      if index < 0:
+        return self.append(auto_id, sentence)
+      if self.entries[index][1] == sentence:
+        return index
+      i += 1
+    # Every prefix of the id is taken by a different text: number it.
+    auto_id = "qstr_" + text
+    number = 1
+    index = self.find_key(auto_id + str(number))
+    while index >= 0:
+      if self.entries[index][1] == sentence:
+        return index
+      number += 1
+      index = self.find_key(auto_id + str(number))
+    return self.append(auto_id + str(number), sentence)
+
+def new_quick_strings():
+  print("Creating new quick_strings.txt file...")
+  return QuickStringTable()
+
 def load_quick_strings(export_dir):
-  quick_strings = []
+  quick_strings = QuickStringTable()
   try:
-    file = open(export_dir + "quick_strings.txt", "r")
+    file = open_text(export_dir + "quick_strings.txt", "r")
     str_list = file.readlines()
     file.close()
     for s in str_list:
-      s = string.strip(s)
+      s = s.strip()
       if s:
         ssplit = s.split(' ')
         if len(ssplit) == 2:
-          quick_strings.append(ssplit)
+          quick_strings.append(ssplit[0], ssplit[1])
   except:
-    print "Creating new quick_strings.txt file..."
+    print("Creating new quick_strings.txt file...")
   return quick_strings
 
 def save_quick_strings(export_dir, quick_strings):
-  file = open(export_dir + "quick_strings.txt", "w")
+  file = open_output(export_dir + "quick_strings.txt")
   file.write("%d\n"%len(quick_strings))
   for i in xrange(len(quick_strings)):
     file.write("%s %s\n"%(quick_strings[i][0],replace_spaces(quick_strings[i][1])))
   file.close()
 
-def load_variables(export_dir,variable_uses):
+class VariableTable(object):
+  """Variable names in index order, with a use count for each of them.
+
+  indices maps a name to its first position in names, which is the index the
+  old linear searches returned, so compiled operands and variables.txt keep
+  the same numbering.
+  """
+
+  def __init__(self, names = None, uses = None):
+    self.names = names or []
+    self.uses = uses or []
+    self.indices = {}
+    for i in xrange(len(self.names) - 1, -1, -1):
+      self.indices[self.names[i]] = i
+
+  def __len__(self):
+    return len(self.names)
+
+  def append(self, name, uses):
+    index = len(self.names)
+    if name not in self.indices:
+      self.indices[name] = index
+    self.names.append(name)
+    self.uses.append(uses)
+    return index
+
+  def add_variable(self, variable_string):
+    index = self.indices.get(variable_string, -1)
+    if index >= 0:
+      self.uses[index] = self.uses[index] - 1
+    else:
+      self.append(variable_string, -1)
+
+  def get_variable(self, variable_string):
+    result = self.indices.get(variable_string[1:], -1)
+    if result >= 0:
+      self.uses[result] = self.uses[result] + 1
+    elif (variable_string[0] == '$'):
+      result = self.append(variable_string, 0)
+      print("WARNING: Usage of unassigned global variable: " + variable_string)
+    else:
+      print("ERROR: Usage of unassigned local variable: " + variable_string)
+    return result
+
+  def check_variable_not_defined(self, variable_string):
+    if variable_string in self.indices:
+      print("WARNING: Variable name used for both local and global contexts:" + variable_string)
+
+def new_variables():
+  print("variables.txt not found. Creating new variables.txt file")
+  print("variable_uses.txt not found. Creating new variable_uses.txt file")
+  return VariableTable()
+
+def load_variables(export_dir):
   variables = []
+  variable_uses = []
   try:
-    file = open(export_dir + "variables.txt","r")
+    file = open_text(export_dir + "variables.txt","r")
     var_list = file.readlines()
     file.close()
     for v in var_list:
-      vv = string.strip(v)
+      vv = v.strip()
       if vv:
         variables.append(vv)
   except:
-    print "variables.txt not found. Creating new variables.txt file"
+    print("variables.txt not found. Creating new variables.txt file")
 
   try:
-    file = open(export_dir + "variable_uses.txt","r")
+    file = open_text(export_dir + "variable_uses.txt","r")
     var_list = file.readlines()
     file.close()
     for v in  var_list:
-      vv = string.strip(v)
+      vv = v.strip()
       if vv:
         variable_uses.append(int(vv))
   except:
-    print "variable_uses.txt not found. Creating new variable_uses.txt file"
+    print("variable_uses.txt not found. Creating new variable_uses.txt file")
 
-  return variables
+  return VariableTable(variables, variable_uses)
 
-def save_variables(export_dir,variables_list,variable_uses):
-  file = open(export_dir + "variables.txt","w")
-  for i in xrange(len(variables_list)):
-    file.write("%s\n"%variables_list[i])
+def save_variables(export_dir,variables):
+  file = open_output(export_dir + "variables.txt")
+  for i in xrange(len(variables.names)):
+    file.write("%s\n"%variables.names[i])
   file.close()
-  file = open(export_dir + "variable_uses.txt","w")
-  for i in xrange(len(variables_list)):
-    file.write("%d\n"%variable_uses[i])
+  file = open_output(export_dir + "variable_uses.txt")
+  for i in xrange(len(variables.names)):
+    file.write("%d\n"%variables.uses[i])
   file.close()
 
+class TagUseTable(object):
+  """How often each object is referred to, as one array("I") per tag.
+
+  The array of a tag gets a counter for every object of its list in the
+  module data when it is first read, so counting a use is a single
+  increment and the module data of a tag is only loaded if it is used.
+  tag_uses[tag_no][object_no] is the count of an object.
+  """
+
+  def __init__(self):
+    self.counters = [array("I") for i in xrange(tags_end)]
+    self.sized = [0] * tags_end
+
+  def __len__(self):
+    return len(self.counters)
+
+  def __getitem__(self, tag_no):
+    counters = self.counters[tag_no]
+    if not self.sized[tag_no]:
+      self.sized[tag_no] = 1
+      if tag_no in object_list_tags:
+        num_objects = len(get_object_tag(object_list_tags[tag_no])[1])
+        if len(counters) < num_objects:
+          counters.extend(array("I", [0]) * (num_objects - len(counters)))
+    return counters
+
 def ensure_tag_use(tag_uses, tag_no, object_no):
   if len(tag_uses[tag_no]) <= object_no:
-    num_to_add = object_no + 1 - len(tag_uses[tag_no])
-    for j in xrange(num_to_add):
-      tag_uses[tag_no].append(0)
+    tag_uses[tag_no].extend([0] * (object_no + 1 - len(tag_uses[tag_no])))
 
 def add_tag_use(tag_uses, tag_no, object_no):
-  #TODO: Uncomment to make build_module_check_tags work
-#  ensure_tag_use(tag_uses, tag_no, object_no)
-#  tag_uses[tag_no][object_no] = tag_uses[tag_no][object_no] + 1
-  pass
-    
+  if object_no < 0:
+    return
+  try:
+    tag_uses[tag_no][object_no] += 1
+  except IndexError:
+    ensure_tag_use(tag_uses, tag_no, object_no)
+    tag_uses[tag_no][object_no] += 1
+
+# tag_uses.dat starts with tag_uses_header: tag_uses_version, the byte order
+# (0 little, 1 big endian), the size of a counter and the number of tags.
+# The counters of each tag follow as their number and the bytes of the
+# array.
+tag_uses_version = 2
+tag_uses_header = struct.Struct("<IBBH")
+tag_uses_length = struct.Struct("<I")
+
+def new_tag_uses():
+  print("Creating new tag_uses.dat file...")
+  return TagUseTable()
+
 def load_tag_uses(export_dir):
-  tag_uses = []
-  for i in xrange(tags_end):
-    sub_tag_uses = []
-    tag_uses.append(sub_tag_uses)
-    
+  tag_uses = TagUseTable()
   try:
-    file = open(export_dir + "tag_uses.txt","r")
-    var_list = file.readlines()
-    file.close()
-    for v in  var_list:
-      vv = string.strip(v).split(';')
-      if vv:
-        for v2 in vv:
-          vvv = v2.split(' ')
-          if len(vvv) >= 3:
-            ensure_tag_use(tag_uses,int(vvv[0]),int(vvv[1]))
-            tag_uses[int(vvv[0])][int(vvv[1])] = int(vvv[2])
+    file = open(export_dir + "tag_uses.dat", "rb")
+    try:
+      data = file.read()
+    finally:
+      file.close()
+    (version, big_endian, item_size, num_tags) = tag_uses_header.unpack_from(data, 0)
+    if (version != tag_uses_version) or (item_size != tag_uses.counters[0].itemsize) or (num_tags != len(tag_uses)):
+      raise ValueError
+    pos = tag_uses_header.size
+    for tag_no in xrange(num_tags):
+      (num_counters,) = tag_uses_length.unpack_from(data, pos)
+      pos += tag_uses_length.size
+      counters = array("I")
+      array_from_bytes(counters, data[pos:pos + num_counters * item_size])
+      pos += num_counters * item_size
+      if len(counters) != num_counters:
+        raise ValueError
+      if big_endian != (sys.byteorder == "big"):
+        counters.byteswap()
+      # Objects added since the file was written start at zero once the
+      # array is read and padded to the length of its object list.
+      tag_uses.counters[tag_no] = counters
   except:
-    print "Creating new tag_uses.txt file..."
+    print("Creating new tag_uses.dat file...")
+    tag_uses = TagUseTable()
   return tag_uses
 
 def save_tag_uses(export_dir,tag_uses):
-  file = open(export_dir + "tag_uses.txt","w")
-  for i in xrange(len(tag_uses)):
-    for j in xrange(len(tag_uses[i])):
-      file.write("%d %d %d;" % (i, j, tag_uses[i][j]))
-    file.write("\n")
+  file = open_output(export_dir + "tag_uses.dat", "wb")
+  file.write(tag_uses_header.pack(tag_uses_version, int(sys.byteorder == "big"), tag_uses.counters[0].itemsize, len(tag_uses)))
+  for counters in tag_uses:
+    file.write(tag_uses_length.pack(len(counters)))
+    file.write(array_to_bytes(counters))
   file.close()
 
+class BuildTables(object):
+  """Variable, tag-use and quick-string tables shared by the exporters.
+
+  Each table is read from export_dir the first time an exporter asks for it
+  and stays in memory afterwards, so build_module.py can hand the same tables
+  to every step. save() writes back only the tables that were used.
+  encode_jobs is the number of processes the exporters encode statement
+  blocks on.
+  """
+
+  def __init__(self, export_dir, encode_jobs = 1):
+    self.export_dir = export_dir
+    self.encode_jobs = encode_jobs
+    self.used = 0
+    self.clear()
+
+  def clear(self):
+    self._variables = None
+    self._tag_uses = None
+    self._quick_strings = None
+    self.new_tables = 0
+
+  def reset(self):
+    """Start the tables over as if their files in export_dir were deleted."""
+    self.clear()
+    self.new_tables = 1
+
+  def set_variables(self, variables):
+    self._variables = variables
+
+  def get_variables(self):
+    self.used = 1
+    if self._variables is None:
+      if self.new_tables:
+        self._variables = new_variables()
+      else:
+        self._variables = load_variables(self.export_dir)
+    return self._variables
+
+  def get_tag_uses(self):
+    self.used = 1
+    if self._tag_uses is None:
+      if self.new_tables:
+        self._tag_uses = new_tag_uses()
+      else:
+        self._tag_uses = load_tag_uses(self.export_dir)
+    return self._tag_uses
+
+  def get_quick_strings(self):
+    self.used = 1
+    if self._quick_strings is None:
+      if self.new_tables:
+        self._quick_strings = new_quick_strings()
+      else:
+        self._quick_strings = load_quick_strings(self.export_dir)
+    return self._quick_strings
+
+  variables = property(get_variables)
+  tag_uses = property(get_tag_uses)
+  quick_strings = property(get_quick_strings)
+
+  def save(self):
+    if self._variables is not None:
+      save_variables(self.export_dir, self._variables)
+    if self._tag_uses is not None:
+      save_tag_uses(self.export_dir, self._tag_uses)
+    if self._quick_strings is not None:
+      save_quick_strings(self.export_dir, self._quick_strings)
+
+  # The methods below let build_module.py skip an exporter in an incremental
+  # build and still leave the tables as if the exporter had run.
+
+  def get_state_hash(self):
+    """Hash of everything that decides the indices an exporter assigns."""
+    h = hashlib.md5()
+    for name in self.variables.names:
+      h.update(to_bytes(name + "\n"))
+    h.update(b"\n")
+    for quick_string in self.quick_strings.entries:
+      h.update(to_bytes(quick_string[0] + " " + quick_string[1] + "\n"))
+    return h.hexdigest()
+
+  def snapshot(self):
+    return (len(self.variables), list(self.variables.uses), len(self.quick_strings), [counters[:] for counters in self.tag_uses])
+
+  def get_changes(self, snapshot):
+    (num_variables, variable_uses, num_quick_strings, tag_uses) = snapshot
+    variables = self.variables
+    new_variables = []
+    for i in xrange(num_variables, len(variables)):
+      new_variables.append((variables.names[i], variables.uses[i]))
+    variable_use_changes = []
+    for i in xrange(num_variables):
+      if variables.uses[i] != variable_uses[i]:
+        variable_use_changes.append((i, variables.uses[i] - variable_uses[i]))
+    new_quick_strings = []
+    for quick_string in self.quick_strings.entries[num_quick_strings:]:
+      new_quick_strings.append((quick_string[0], quick_string[1]))
+    tag_use_changes = []
+    for i in xrange(len(self.tag_uses)):
+      counters = self.tag_uses[i]
+      if counters == tag_uses[i]:
+        continue
+      for j in xrange(len(counters)):
+        old_count = 0
+        if j < len(tag_uses[i]):
+          old_count = tag_uses[i][j]
+        if counters[j] != old_count:
+          tag_use_changes.append((i, j, counters[j] - old_count))
+    return (new_variables, variable_use_changes, new_quick_strings, tag_use_changes)
+
+  def apply_changes(self, changes):
+    (new_variables, variable_use_changes, new_quick_strings, tag_use_changes) = changes
+    variables = self.variables
+    for (name, uses) in new_variables:
+      variables.append(name, uses)
+    for (i, change) in variable_use_changes:
+      variables.uses[i] = variables.uses[i] + change
+    for (key, text) in new_quick_strings:
+      self.quick_strings.append(key, text)
+    tag_uses = self.tag_uses
+    for (i, j, change) in tag_use_changes:
+      ensure_tag_use(tag_uses, i, j)
+      tag_uses[i][j] = tag_uses[i][j] + change
+
 def add_cookie(cookies_list,cookie_string):
   found = 0
   result = -1
@@ -241,189 +524,199 @@ def get_cookie(cookies_list,cookie_string):
       result = i_t
       break
   if not found:
-    print "ERROR: input token not found:" + cookie_string
+    print("ERROR: input token not found:" + cookie_string)
     cookies_list.append(cookie_string)
     result = len(cookies_list) - 1
   return result
 
 
-def check_varible_not_defined(variable_string,variables_list):
-  for i_t in xrange(len(variables_list)):
-    if variable_string == variables_list[i_t]:
-      print "WARNING: Variable name used for both local and global contexts:" + variable_string
-      break
-
-#def add_get_variable(variable_string,variables_list):
-#  found = 0
-#  result = -1
-#  for i_t in xrange(len(variables_list)):
-#    if variable_string == variables_list[i_t]:
-#      found = 1
-#      result = i_t
-#      break
-#  if not found:
-#    variables_list.append(variable_string)
-#    result = len(variables_list) - 1
-#  return result
-    
-def add_variable(variable_string,variables_list,variable_uses):
-  found = 0
-  for i_t in xrange(len(variables_list)):
-    if variable_string == variables_list[i_t]:
-      found = 1
-      variable_uses[i_t] = variable_uses[i_t] - 1
-      break
-  if not found:
-    variables_list.append(variable_string)
-    variable_uses.append(-1)
-
-def get_variable(variable_string,variables_list,variable_uses):
-  found = 0
-  result = -1
-  var_string = variable_string[1:]
-  for i_t in xrange(len(variables_list)):
-    if var_string == variables_list[i_t]:
-      found = 1
-      result = i_t
-      variable_uses[result] = variable_uses[result] + 1
-      break
-  if not found:
-    if (variable_string[0] == '$'):
-      variables_list.append(variable_string)
-      variable_uses.append(0)
-      result = len(variables_list) - 1
-      print "WARNING: Usage of unassigned global variable: " + variable_string
-    else:
-      print "ERROR: Usage of unassigned local variable: " + variable_string
-  return result
+# Set versions of the operation lists in header_operations, checked once per
+# compiled statement.
+lhs_operation_set = frozenset(lhs_operations)
+global_lhs_operation_set = lhs_operation_set | frozenset(global_lhs_operations)
+can_fail_operation_set = frozenset(can_fail_operations)
 
 def is_lhs_operation(op_code):
-  found = 0
-  if op_code in lhs_operations:
+  if op_code in lhs_operation_set:
       return 1
   return 0
 
 def is_lhs_operation_for_global_vars(op_code):
-  found = 0
-  if op_code in lhs_operations:
-      return 1
-  if op_code in global_lhs_operations:
+  if op_code in global_lhs_operation_set:
       return 1
   return 0
 
 def is_can_fail_operation(op_code):
-  found = 0
-  if op_code in can_fail_operations:
+  if op_code in can_fail_operation_set:
       return 1
   return 0
 
-def search_quick_string_keys(key, quick_strings):
-  index = -1
-  for i in xrange(len(quick_strings)):
-    if quick_strings[i][0] == key:
-      index = i
-  return index
-
-def insert_quick_string_with_auto_id(sentence,quick_strings):
-  index = 0
-  text = convert_to_identifier_with_no_lowercase(sentence)
-  sentence = replace_spaces(sentence)
-  done = 0
-  i = 20
-  lt = len(text)
-  if (i > lt):
-    i  = lt
-  auto_id = "qstr_" + text[0:i]
-  done = 0
-  index = search_quick_string_keys(auto_id, quick_strings)
-  if index >= 0 and (quick_strings[index][1] == sentence):
-    done = 1
-  while (i <= lt) and not done:
-    auto_id = "qstr_" + text[0:i]
-    index = search_quick_string_keys(auto_id, quick_strings)
-    if index >= 0:
-      if quick_strings[index][1] == sentence:
-        done = 1
-      else:
-        i += 1
-    else:      
-      done = 1
-      index = len(quick_strings)
-      quick_strings.append([auto_id, sentence])
-  if not done:
-    number = 1
-    new_auto_id = auto_id + str(number)
-    while quick_strings.has_key(new_auto_id):
-      number += 1
-      new_auto_id = auto_id + str(number)
-    auto_id = new_auto_id
-    index = len(quick_strings)
-    quick_strings.append([auto_id, sentence])
-  return index
-
+# Encoded values of the global variable, quick string and identifier operands
+# seen so far, for the tables in operand_cache_tables. The same operands come
+# up tens of thousands of times in a build. A cached global variable still
+# counts a use and a cached identifier a tag use, so the tables end up as if
+# every operand had been looked up. The entries are (kind, value, a, b):
+#   (0, value, variable index, None) for "$" global variables,
+#   (1, value, None, None) for "@" quick strings,
+#   (2, value, tag use counters of the tag, object index) for identifiers.
+operand_cache = {}
+operand_cache_tables = (None, None, None)
+operand_value_mask = (1 << op_num_value_bits) - 1
+
+def get_operand_cache(global_vars, tag_uses, quick_strings):
+  """Return the operand cache of these tables, starting it over for new ones."""
+  global operand_cache, operand_cache_tables
+  (cached_vars, cached_tag_uses, cached_quick_strings) = operand_cache_tables
+  if (cached_vars is not global_vars) or (cached_tag_uses is not tag_uses) or (cached_quick_strings is not quick_strings):
+    operand_cache = {}
+    operand_cache_tables = (global_vars, tag_uses, quick_strings)
+  return operand_cache
+
+def process_uncached_param(param, global_vars, local_vars, tag_uses, quick_strings, cache):
+  """Encode a global variable, quick string or identifier that is not in cache yet."""
+  encoder_counts[3] += 1
+  num_variables = len(global_vars)
+  result = process_param(param, global_vars, local_vars, tag_uses, quick_strings)
+  # Lookups a worker of encode_statement_blocks left for later are not
+  # cached, and neither are errors, which are reported every time. An
+  # unassigned global variable is added again, under a new index, each time
+  # it is used.
+  if (type(result) in integer_types) and (result >= 0):
+    if param[0] == '$':
+      if len(global_vars) == num_variables:
+        cache[param] = (0, result, result & ~opmask_variable, None)
+    elif param[0] == '@':
+      if getattr(quick_strings, "use_text_indices", 1):
+        cache[param] = (1, result, None, None)
+    else:
+      cache[param] = (2, result, tag_uses[result >> op_num_value_bits], result & operand_value_mask)
+  return result
 
-def process_param(param,global_vars_list,global_var_uses, local_vars_list, local_var_uses, tag_uses, quick_strings):
+def process_param(param,global_vars, local_vars, tag_uses, quick_strings):
   result = 0
-  if (type(param) == types.StringType):
+  if (type(param) == str):
     if (param[0] == '$'):
-      check_varible_not_defined(param[1:], local_vars_list)
-      result = get_variable(param, global_vars_list,global_var_uses)
+      local_vars.check_variable_not_defined(param[1:])
+      result = global_vars.get_variable(param)
       result |= opmask_variable
     elif (param[0] == ':'):
-      check_varible_not_defined(param[1:], global_vars_list)
-      result = get_variable(param, local_vars_list,local_var_uses)
+      global_vars.check_variable_not_defined(param[1:])
+      result = local_vars.get_variable(param)
       result |= opmask_local_variable
     elif (param[0] == '@'):
-      result = insert_quick_string_with_auto_id(param[1:], quick_strings)
+      result = quick_strings.insert_with_auto_id(param[1:])
       result |= opmask_quick_string
     else:
       result = get_identifier_value(param.lower(), tag_uses)
       if (result < 0):
-        print "ERROR: Illegal Identifier:" + param
+        print("ERROR: Illegal Identifier:" + param)
   else:
     result = param
   return result
 
-def save_statement(ofile,opcode,no_variables,statement,variable_list,variable_uses,local_vars_list,local_var_uses,tag_uses,quick_strings):
+# Statements and operands encoded so far, and hits and misses of the operand
+# cache, read by build_profile.py.
+encoder_counts = [0, 0, 0, 0]
+
+# (kind, name, seconds) for each statement block timed with
+# get_encode_timer and record_encode_time. Timing is only on while
+# build_profile.py profiles a step.
+encode_times = []
+time_encoding = 0
+
+def get_encode_timer():
+  if time_encoding:
+    return time.time()
+  return None
+
+def record_encode_time(kind, name, start_time):
+  if start_time is not None:
+    encode_times.append((kind, name, time.time() - start_time))
+
+statement_formats = []
+
+def get_statement_format(num_tokens):
+  while len(statement_formats) <= num_tokens:
+    statement_formats.append("%d " * len(statement_formats))
+  return statement_formats[num_tokens]
+
+def encode_statement(output,opcode,no_variables,statement,variables,local_vars,tag_uses,quick_strings,cache = None):
   if no_variables == 0:
     lenstatement = len(statement) - 1
     if (is_lhs_operation(opcode) == 1):
       if (lenstatement > 0):
         param = statement[1]
-        if (type(param) == types.StringType):
+        if (type(param) == str):
           if (param[0] == ':'):
-            add_variable(param[1:], local_vars_list, local_var_uses)
+            local_vars.add_variable(param[1:])
   else:
     lenstatement = 0
-  ofile.write("%d %d "%(opcode, lenstatement))
-  for i in xrange(lenstatement):
-    operand = process_param(statement[i + 1],variable_list,variable_uses,local_vars_list,local_var_uses,tag_uses,quick_strings)
-    ofile.write("%d "%operand)
+  encoder_counts[1] += lenstatement
+  operands = [opcode, lenstatement]
+  if cache is None:
+    for i in xrange(lenstatement):
+      operands.append(process_param(statement[i + 1],variables,local_vars,tag_uses,quick_strings))
+  else:
+    hits = 0
+    for i in xrange(lenstatement):
+      param = statement[i + 1]
+      if type(param) != str:
+        operands.append(param)
+        continue
+      entry = cache.get(param)
+      if entry is None:
+        if param[0] == ':':
+          operands.append(process_param(param,variables,local_vars,tag_uses,quick_strings))
+        else:
+          operands.append(process_uncached_param(param,variables,local_vars,tag_uses,quick_strings,cache))
+        continue
+      (kind, value, a, b) = entry
+      if kind == 2:
+        a[b] += 1
+      elif kind == 0:
+        if param[1:] in local_vars.indices:
+          local_vars.check_variable_not_defined(param[1:])
+        variables.uses[a] += 1
+      operands.append(value)
+      hits += 1
+    encoder_counts[2] += hits
+  try:
+    output.append(get_statement_format(len(operands)) % tuple(operands))
+  except TypeError:
+    # Operands written as 1-tuples, e.g. (5,), which "%d " also accepts, or
+    # operands a worker of encode_statement_blocks could not resolve yet.
+    for operand in operands:
+      if isinstance(operand, DeferredOperand):
+        output.append(operand)
+      else:
+        output.append("%d "%operand)
 
-def compile_global_vars_in_statement(statement,variable_list, variable_uses):
+def compile_global_vars_in_statement(statement,variables):
   opcode = 0
-  if ((type(statement) != types.ListType) and (type(statement) != types.TupleType)):
+  if ((type(statement) != list) and (type(statement) != tuple)):
     opcode = statement
   else:
     opcode = statement[0]
     if (is_lhs_operation_for_global_vars(opcode) == 1):
       if (len(statement) > 1):
         param = statement[1]
-        if (type(param) == types.StringType):
+        if (type(param) == str):
           if (statement[1][0] == '$'):
-            add_variable(statement[1][1:], variable_list, variable_uses)
-
-def save_statement_block(ofile,statement_name,can_fail_statement,statement_block,variable_list, variable_uses,tag_uses,quick_strings):
-  local_vars = []
-  local_var_uses = []
-  ofile.write(" %d "%(len(statement_block)))
+            variables.add_variable(statement[1][1:])
+
+def encode_statement_block(output,statement_name,can_fail_statement,statement_block,variables,tag_uses,quick_strings):
+  """Append the tokens of a compiled statement block to the list output."""
+  local_vars = VariableTable()
+  cache = get_operand_cache(variables, tag_uses, quick_strings)
+  output.append(" %d "%(len(statement_block)))
+  encoder_counts[0] += len(statement_block)
   store_script_param_1_uses = 0
   store_script_param_2_uses = 0
   current_depth = 0
   can_fail = 0
   for i in xrange(len(statement_block)):
     statement = statement_block[i]
-    if ((type(statement) != types.ListType) and (type(statement) != types.TupleType)):
+    if ((type(statement) != list) and (type(statement) != tuple)):
       opcode = statement
       no_variables = 1
     else:
@@ -445,29 +738,278 @@ def save_statement_block(ofile,statement_name,can_fail_statement,statement_block
           and (is_can_fail_operation(opcode)
                or ((opcode == call_script) and (statement[1].startswith("cf_", 7))))
           and (not statement_name.startswith("cf_"))):
-      print "WARNING: Script can fail at operation #" + str(i) + ". Use cf_ at the beginning of its name: " + statement_name
-    save_statement(ofile,opcode,no_variables,statement,variable_list,variable_uses,local_vars, local_var_uses,tag_uses,quick_strings)
+      print("WARNING: Script can fail at operation #" + str(i) + ". Use cf_ at the beginning of its name: " + statement_name)
+    encode_statement(output,opcode,no_variables,statement,variables,local_vars,tag_uses,quick_strings,cache)
   if (store_script_param_1_uses > 1):
-    print "WARNING: store_script_param_1 is used more than once:" + statement_name
+    print("WARNING: store_script_param_1 is used more than once:" + statement_name)
   if (store_script_param_2_uses > 1):
-    print "WARNING: store_script_param_2 is used more than once:" + statement_name
+    print("WARNING: store_script_param_2 is used more than once:" + statement_name)
   i = 0
   while (i < len(local_vars)):
-    if (local_var_uses[i] == 0 and not(local_vars[i].startswith("unused"))):
-      print "WARNING: Local variable never used: " + local_vars[i] + ", at: " + str(statement_name)
+    if (local_vars.uses[i] == 0 and not(local_vars.names[i].startswith("unused"))):
+      print("WARNING: Local variable never used: " + local_vars.names[i] + ", at: " + str(statement_name))
     i = i + 1
   if (len(local_vars) > 128):
-	  print "WARNING: Script uses more than 128 local wariables: " + str(statement_name) + "variables count:" + str(len(local_vars))
+    print("WARNING: Script uses more than 128 local wariables: " + str(statement_name) + "variables count:" + str(len(local_vars)))
+
+def save_statement_block(ofile,statement_name,can_fail_statement,statement_block,variables,tag_uses,quick_strings):
+  output = []
+  encode_statement_block(output,statement_name,can_fail_statement,statement_block,variables,tag_uses,quick_strings)
+  ofile.write("".join(output))
+
+# Encoding statement blocks in worker processes.
+#
+# encode_statement_blocks splits a list of statement blocks into chunks and
+# encodes them on a multiprocessing pool. Each worker starts with a copy of
+# the variable and quick-string tables. Operands found there are encoded
+# directly. A global variable or quick string the tables do not have yet is
+# left as a DeferredOperand and the lookup is recorded instead. The parent
+# then merges the chunks in source order: it repeats the recorded lookups on
+# the real tables, which assigns the same indices a serial run would, fills
+# in the deferred operands and adds up the use counts.
+#
+# What encoding a block prints is kept with the block and printed when the
+# exporter saves it, where a serial run would print it. A lookup of a global
+# variable records how much the block had printed before it, so that the
+# warning the parent prints when it repeats the lookup lands at the same
+# place. So does the first use of each object list in a chunk: the worker
+# indexes the list quietly and the parent indexes its own copy at that point,
+# which prints the duplicate ids once, as a serial run does.
+
+class DeferredOperand(object):
+  """Operand of a recorded lookup, with the opmask bits or-ed into it."""
+
+  def __init__(self, lookup, mask = 0):
+    self.lookup = lookup
+    self.mask = mask
+
+  def __or__(self, mask):
+    return DeferredOperand(self.lookup, self.mask | mask)
+
+class ChunkVariableTable(VariableTable):
+  """Global variables of a worker, which records lookups it cannot answer."""
+
+  def get_variable(self, variable_string):
+    result = self.indices.get(variable_string[1:], -1)
+    if result >= 0:
+      self.uses[result] = self.uses[result] + 1
+      return result
+    self.lookups.append((0, variable_string, sys.stdout.tell()))
+    return DeferredOperand(len(self.lookups) - 1)
+
+class ChunkQuickStringTable(object):
+  """Quick strings of a worker, which records texts it has not seen."""
+
+  def __init__(self, text_indices, lookups):
+    self.text_indices = text_indices
+    self.lookups = lookups
+
+  def insert_with_auto_id(self, sentence):
+    index = self.text_indices.get(replace_spaces(sentence), -1)
+    if index >= 0:
+      return index
+    self.lookups.append((1, sentence, None))
+    return DeferredOperand(len(self.lookups) - 1)
+
+chunk_blocks = None
+chunk_variables = None
+chunk_quick_string_texts = None
+chunk_object_tags = None
+
+def init_chunk_worker(blocks, variable_names, quick_string_texts, timing):
+  global chunk_blocks, chunk_variables, chunk_quick_string_texts, time_encoding
+  chunk_blocks = blocks
+  chunk_variables = ChunkVariableTable(variable_names, [0] * len(variable_names))
+  chunk_quick_string_texts = quick_string_texts
+  time_encoding = timing
+
+def index_chunk_objects(tag, objects):
+  """Index the object list of tag in a worker, leaving the warnings to the parent."""
+  chunk_object_tags.add(tag)
+  chunk_variables.lookups.append((2, tag, sys.stdout.tell()))
+  stdout = sys.stdout
+  sys.stdout = StringIO()
+  try:
+    get_object_index(objects, tag)
+  finally:
+    sys.stdout = stdout
+
+def join_tokens(output):
+  """Join the runs of encoded text between the deferred operands of output."""
+  tokens = []
+  text = []
+  for token in output:
+    if isinstance(token, DeferredOperand):
+      tokens.append("".join(text))
+      tokens.append(token)
+      text = []
+    else:
+      text.append(token)
+  tokens.append("".join(text))
+  return tokens
+
+def encode_chunk(chunk):
+  """Encode the blocks from chunk[0] up to chunk[1] in a worker."""
+  global chunk_object_tags
+  lookups = []
+  chunk_object_tags = set()
+  chunk_variables.uses = [0] * len(chunk_variables.names)
+  chunk_variables.lookups = lookups
+  quick_strings = ChunkQuickStringTable(chunk_quick_string_texts, lookups)
+  tag_uses = TagUseTable()
+  counts_before = list(encoder_counts)
+  del encode_times[:]
+  outputs = []
+  stdout = sys.stdout
+  try:
+    try:
+      for (statement_name, can_fail_statement, statement_block, label) in chunk_blocks[chunk[0]:chunk[1]]:
+        output = []
+        sys.stdout = StringIO()
+        start_time = get_encode_timer()
+        encode_statement_block(output, statement_name, can_fail_statement, statement_block, chunk_variables, tag_uses, quick_strings)
+        if label is not None:
+          record_encode_time(label[0], label[1], start_time)
+        outputs.append((join_tokens(output), len(lookups), sys.stdout.getvalue()))
+    except:
+      return None
+  finally:
+    sys.stdout = stdout
+  variable_uses = []
+  for i in xrange(len(chunk_variables.uses)):
+    if chunk_variables.uses[i] != 0:
+      variable_uses.append((i, chunk_variables.uses[i]))
+  tag_use_counts = []
+  for i in xrange(len(tag_uses)):
+    for j in xrange(len(tag_uses[i])):
+      if tag_uses[i][j] != 0:
+        tag_use_counts.append((i, j, tag_uses[i][j]))
+  counts = [encoder_counts[i] - counts_before[i] for i in xrange(len(encoder_counts))]
+  return (outputs, lookups, variable_uses, tag_use_counts, counts, list(encode_times))
+
+def merge_encoded_chunk(result, encoded_blocks, variables, tag_uses, quick_strings):
+  """Append (encoded text, printed text) of each block of result to encoded_blocks."""
+  (outputs, lookups, variable_uses, tag_use_counts, counts, times) = result
+  values = []
+  printed_blocks = []
+  stdout = sys.stdout
+  try:
+    for (output, end_lookup, printed) in outputs:
+      sys.stdout = StringIO()
+      position = 0
+      for (kind, argument, printed_before) in lookups[len(values):end_lookup]:
+        if printed_before is not None:
+          sys.stdout.write(printed[position:printed_before])
+          position = printed_before
+        if kind == 0:
+          values.append(variables.get_variable(argument))
+        elif kind == 1:
+          values.append(quick_strings.insert_with_auto_id(argument))
+        else:
+          get_object_index(get_object_tag(argument)[1], argument)
+          values.append(None)
+      sys.stdout.write(printed[position:])
+      printed_blocks.append(sys.stdout.getvalue())
+  finally:
+    sys.stdout = stdout
+  for (i, uses) in variable_uses:
+    variables.uses[i] = variables.uses[i] + uses
+  for (i, j, count) in tag_use_counts:
+    ensure_tag_use(tag_uses, i, j)
+    tag_uses[i][j] = tag_uses[i][j] + count
+  for i in xrange(len(counts)):
+    encoder_counts[i] += counts[i]
+  encode_times.extend(times)
+  for j in xrange(len(outputs)):
+    output = outputs[j][0]
+    for i in xrange(len(output)):
+      token = output[i]
+      if isinstance(token, DeferredOperand):
+        output[i] = "%d " % (values[token.lookup] | token.mask)
+    encoded_blocks.append(("".join(output), printed_blocks[j]))
+
+def split_into_chunks(blocks, num_chunks):
+  """Split blocks into about num_chunks (start, end) ranges with similar statement counts."""
+  total = 0
+  for block in blocks:
+    total += len(block[2])
+  chunk_size = max(1, total // num_chunks)
+  chunks = []
+  start = 0
+  size = 0
+  for i in xrange(len(blocks)):
+    size += len(blocks[i][2])
+    if size >= chunk_size:
+      chunks.append((start, i + 1))
+      start = i + 1
+      size = 0
+  if start < len(blocks):
+    chunks.append((start, len(blocks)))
+  return chunks
+
+def encode_statement_blocks(blocks, variables, tag_uses, quick_strings, jobs):
+  """Encode blocks on jobs worker processes, or return None to encode serially.
+
+  blocks is a list of (statement_name, can_fail, block, label) entries in the
+  order a serial run encodes them, where label is the (kind, name) to time
+  the block under or None. The result holds the encoded text of each block
+  with what encoding it printed, and the tables end up as if the blocks had
+  been encoded one by one. If a worker fails, nothing is merged and the
+  caller encodes serially, which reports the error the usual way.
+  """
+  if (jobs <= 1) or (len(blocks) < 2) or not quick_strings.use_text_indices:
+    return None
+  import multiprocessing
+  if multiprocessing.current_process().daemon:
+    return None
+  chunks = split_into_chunks(blocks, jobs * 4)
+  pool = multiprocessing.Pool(jobs, init_chunk_worker, (blocks, variables.names, quick_strings.text_indices, time_encoding))
+  try:
+    results = pool.map(encode_chunk, chunks)
+  finally:
+    pool.close()
+    pool.join()
+  if None in results:
+    return None
+  encoded_blocks = []
+  for result in results:
+    merge_encoded_chunk(result, encoded_blocks, variables, tag_uses, quick_strings)
+  return encoded_blocks
+
+class StatementBlockWriter(object):
+  """Writes statement blocks, encoded by encode_statement_blocks if it can.
+
+  Exporters list their blocks up front and then call save() for the same
+  blocks in the same order, where they would call save_statement_block.
+  """
+
+  def __init__(self, blocks, variables, tag_uses, quick_strings, jobs = 1):
+    self.encoded_blocks = encode_statement_blocks(blocks, variables, tag_uses, quick_strings, jobs)
+    self.next_block = 0
+
+  def seek(self, block_no):
+    """Make save() write block block_no next, after blocks were skipped."""
+    self.next_block = block_no
+
+  def save(self, ofile, statement_name, can_fail_statement, statement_block, variables, tag_uses, quick_strings):
+    if self.encoded_blocks is None:
+      save_statement_block(ofile, statement_name, can_fail_statement, statement_block, variables, tag_uses, quick_strings)
+    else:
+      (text, printed) = self.encoded_blocks[self.next_block]
+      sys.stdout.write(printed)
+      ofile.write(text)
+      self.next_block += 1
 
-def compile_global_vars(statement_block,variable_list, variable_uses):
+def compile_global_vars(statement_block,variables):
   for statement in statement_block:
-    compile_global_vars_in_statement(statement, variable_list, variable_uses)
+    compile_global_vars_in_statement(statement, variables)
 
 
-def save_simple_triggers(ofile,triggers,variable_list, variable_uses,tag_uses,quick_strings):
-  ofile.write("%d\n"%len(triggers))
+def save_simple_triggers(ofile,triggers,variables,tag_uses,quick_strings):
+  output = ["%d\n"%len(triggers)]
   for trigger in triggers:
-    ofile.write("%f "%(trigger[0]))
-    save_statement_block(ofile,0,1,trigger[1]  , variable_list, variable_uses,tag_uses,quick_strings)
-    ofile.write("\n")
-  ofile.write("\n")
+    output.append("%f "%(trigger[0]))
+    encode_statement_block(output,0,1,trigger[1]  , variables,tag_uses,quick_strings)
+    output.append("\n")
+  output.append("\n")
+  ofile.write("".join(output))
@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 from module_info import *
 from module_particle_systems import *
 from process_common import *
@@ -26,7 +28,7 @@ def save_psys_keys(ofile, keys1, keys2):
     ofile.write("%f %f   %f %f\n"%(keys1[0], keys1[1], keys2[0], keys2[1]))
 
 def save_particle_systems():
-  ofile = open(export_dir + "particle_systems.txt","w")
+  ofile = open_output(export_dir + "particle_systems.txt")
   ofile.write("particle_systemsfile version 1\n")
   ofile.write("%d\n"%len(particle_systems))
   for psys in particle_systems:
@@ -52,11 +54,15 @@ def save_particle_systems():
   ofile.close()
 
 def save_python_header():
-  ofile = open("./ID_particle_systems.py","w")
+  ofile = open_output("./ID_particle_systems.py")
   for i_particle_system in xrange(len(particle_systems)):
     ofile.write("psys_%s = %d\n"%(particle_systems[i_particle_system][0],i_particle_system))
   ofile.close()
 
-print "Exporting particle data..."
-save_particle_systems()
-save_python_header()
+def export(tables = None):
+  print("Exporting particle data...")
+  save_particle_systems()
+  save_python_header()
+
+if __name__ == "__main__":
+  export()
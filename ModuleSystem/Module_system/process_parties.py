@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import types
 from header_game_menus import *
 from module_info import *
@@ -8,8 +10,8 @@ from process_operations import *
 from process_common import *
 
 
-def save_parties(parties):
-  file = open(export_dir + "parties.txt","w")
+def save_parties(parties,tag_uses):
+  file = open_output(export_dir + "parties.txt")
   file.write("partiesfile version 1\n")
   file.write("%d %d\n"%(len(parties), len(parties)))
   for i_party in xrange(len(parties)):
@@ -22,10 +24,10 @@ def save_parties(parties):
     file.write("p_%s %s %d "%(convert_to_identifier(party[0]),replace_spaces(party[1]),party[2]))
     menu_no = 0
     menu_param = party[3]
-    if (type(menu_param) == types.StringType):
-      menu_no = find_object(game_menus,menu_param)
+    if (type(menu_param) == str):
+      menu_no = find_object(game_menus,menu_param,"mnu")
       if (menu_no < 0):
-        print "Error: Unable to find menu-id :" + menu_param
+        print("Error: Unable to find menu-id :" + menu_param)
     else:
       menu_no = menu_param
     file.write("%d "%(menu_no))
@@ -33,10 +35,10 @@ def save_parties(parties):
     file.write("%d %d %d %d %d "%(party[4], party[5], party[6], party[6],party[7]))
     ai_behavior_object = 0
     ai_param = party[8]
-    if (type(ai_param) == types.StringType):
-      ai_behavior_object = find_object(parties,ai_param)
+    if (type(ai_param) == str):
+      ai_behavior_object = find_object(parties,ai_param,"p")
       if (ai_behavior_object < 0):
-        print "Error: Unable to find party-id :" + ai_param
+        print("Error: Unable to find party-id :" + ai_param)
     else:
       ai_behavior_object = ai_param
     file.write("%d %d "%(ai_behavior_object,ai_behavior_object))
@@ -57,17 +59,22 @@ def save_parties(parties):
   file.close()
 
 def save_python_header(parties):
-  file = open("./ID_parties.py","w")
+  file = open_output("./ID_parties.py")
   for i_party in xrange(len(parties)):
     file.write("p_%s = %d\n"%(convert_to_identifier(parties[i_party][0]),i_party))
   file.close()
 
 
-print "Exporting parties"
-tag_uses = load_tag_uses(export_dir)
-save_python_header(parties)
-save_parties(parties)
-save_tag_uses(export_dir, tag_uses)
+def export(tables):
+  print("Exporting parties")
+  save_python_header(parties)
+  save_parties(parties,tables.tag_uses)
+
+if __name__ == "__main__":
+  tables = BuildTables(export_dir)
+  export(tables)
+  tables.save()
+
 #print "Generating C header..."
 #save_c_header()
 #print "Generating Python header..."
@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 from module_info import *
 from module_party_templates import *
 #from process_operations import *
@@ -17,7 +19,7 @@ def save_party_template_troop(file,troop):
     file.write("-1 ")
     
 def save_party_templates():
-  file = open(export_dir + "party_templates.txt","w")
+  file = open_output(export_dir + "party_templates.txt")
   file.write("partytemplatesfile version 1\n")
   file.write("%d\n"%(len(party_templates)))
   for party_template in party_templates:
@@ -25,7 +27,7 @@ def save_party_templates():
     file.write("pt_%s %s %d %d %d %d "%(convert_to_identifier(party_template[0]),replace_spaces(party_template[1]),party_template[2],party_template[3], party_template[4], party_template[5]))
     members = party_template[6]
     if (len(members) > 6):
-      print "Error! NUMBER OF TEMPLATE MEMBERS EXCEEDS 6 " + party_template[0]
+      print("Error! NUMBER OF TEMPLATE MEMBERS EXCEEDS 6 " + party_template[0])
       members = members[0:6]
     for party_template_member in members:
       save_party_template_troop(file,party_template_member)
@@ -35,13 +37,17 @@ def save_party_templates():
   file.close()
 
 def save_python_header():
-  file = open("./ID_party_templates.py","w")
+  file = open_output("./ID_party_templates.py")
   for i_party_template in xrange(len(party_templates)):
     file.write("pt_%s = %d\n"%(convert_to_identifier(party_templates[i_party_template][0]),i_party_template))
   file.close()
 
-print "Exporting party_template data..."
-#tag_uses = load_tag_uses(export_dir)
-save_python_header()
-save_party_templates()
-#save_tag_uses(export_dir, tag_uses)
+def export(tables = None):
+  print("Exporting party_template data...")
+  #tag_uses = load_tag_uses(export_dir)
+  save_python_header()
+  save_party_templates()
+  #save_tag_uses(export_dir, tag_uses)
+
+if __name__ == "__main__":
+  export()
@@ -1,16 +1,20 @@
+from __future__ import print_function
+
 from header_common import *
 from module_info import *
 from module_postfx import *
 
+from process_common import *
+
 def write_python_header(postfx_params_list):
-  file = open("./ID_postfx_params.py","w")
+  file = open_output("./ID_postfx_params.py")
   for i_postfx_param in xrange(len(postfx_params_list)):
     file.write("pfx_%s = %d\n"%(postfx_params_list[i_postfx_param][0],i_postfx_param))
   file.write("\n\n")
   file.close()
 
 def write_postfx_params(postfx_params_list):
-  ofile = open(export_dir + "postfx.txt","w")
+  ofile = open_output(export_dir + "postfx.txt")
   ofile.write("postfx_paramsfile version 1\n")
   ofile.write("%d\n"%len(postfx_params_list))
   for postfx_param in postfx_params_list:
@@ -23,6 +27,10 @@ def write_postfx_params(postfx_params_list):
     ofile.write("  %f %f %f %f\n"%(params_list3[0], params_list3[1], params_list3[2], params_list3[3]))
   ofile.close()
 
-print "Exporting postfx_params..."
-write_postfx_params(postfx_params)
-write_python_header(postfx_params)
+def export(tables = None):
+  print("Exporting postfx_params...")
+  write_postfx_params(postfx_params)
+  write_python_header(postfx_params)
+
+if __name__ == "__main__":
+  export()
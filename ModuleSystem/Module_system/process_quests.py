@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 
 from module_info import *
@@ -6,18 +8,18 @@ from module_quests import *
 from process_common import *
 
 def save_quests():
-  ofile = open(export_dir + "quests.txt","w")
+  ofile = open_output(export_dir + "quests.txt")
   ofile.write("questsfile version 1\n")
   ofile.write("%d\n"%(len(quests)))
   for i_quest in xrange(len(quests)):
     quest = quests[i_quest]
-    ofile.write("qst_%s %s %d "%(quest[0],(string.replace(quest[1]," ","_")),quest[2]))
-    ofile.write("%s "%(string.replace(quest[3]," ","_")))
+    ofile.write("qst_%s %s %d "%(quest[0],(quest[1].replace(" ","_")),quest[2]))
+    ofile.write("%s "%(quest[3].replace(" ","_")))
     ofile.write("\n")
   ofile.close()
 
 def save_python_header():
-  ofile = open("./ID_quests.py","w")
+  ofile = open_output("./ID_quests.py")
   for i_quest in xrange(len(quests)):
     ofile.write("qst_%s = %d\n"%(quests[i_quest][0],i_quest))
   for i_quest in xrange(len(quests)):
@@ -26,7 +28,10 @@ def save_python_header():
   ofile.close()
 
 
-print "Exporting quest data..."
-save_quests()
-save_python_header()
-  
+def export(tables = None):
+  print("Exporting quest data...")
+  save_quests()
+  save_python_header()
+
+if __name__ == "__main__":
+  export()
@@ -1,4 +1,7 @@
+from __future__ import print_function
+
 import string
+import types
 
 from module_info import *
 from module_scripts import *
@@ -6,38 +9,50 @@ from module_scripts import *
 from process_common import *
 from process_operations import *
 
-def save_scripts(variable_list,variable_uses,scripts,tag_uses,quick_strings):
-  file = open(export_dir + "scripts.txt","w")
+def get_script_blocks(scripts):
+  blocks = []
+  for func in scripts:
+    if (type(func[1]) == list):
+      statement_block = func[1]
+    else:
+      statement_block = func[2]
+    blocks.append((convert_to_identifier(func[0]), 0, statement_block, ("script", convert_to_identifier(func[0]))))
+  return blocks
+
+def save_scripts(variable_list,scripts,tag_uses,quick_strings,encode_jobs = 1):
+  writer = StatementBlockWriter(get_script_blocks(scripts), variable_list, tag_uses, quick_strings, encode_jobs)
+  file = open_output(export_dir + "scripts.txt")
   file.write("scriptsfile version 1\n")
   file.write("%d\n"%len(scripts))
   temp_list = []
   list_type = type(temp_list)
   for i_script in xrange(len(scripts)):
     func = scripts[i_script]
+    start_time = get_encode_timer()
     if (type(func[1]) == list_type):
       file.write("%s -1\n"%(convert_to_identifier(func[0])))
-      save_statement_block(file,convert_to_identifier(func[0]), 0,func[1], variable_list,variable_uses,tag_uses,quick_strings)
+      writer.save(file,convert_to_identifier(func[0]), 0,func[1], variable_list,tag_uses,quick_strings)
     else:
       file.write("%s %f\n"%(convert_to_identifier(func[0]), func[1]))
-      save_statement_block(file,convert_to_identifier(func[0]), 0,func[2], variable_list,variable_uses,tag_uses,quick_strings)
+      writer.save(file,convert_to_identifier(func[0]), 0,func[2], variable_list,tag_uses,quick_strings)
+    record_encode_time("script", convert_to_identifier(func[0]), start_time)
     file.write("\n")
   file.close()
 
 def save_python_header():
-  file = open("./ID_scripts.py","w")
+  file = open_output("./ID_scripts.py")
   for i_script in xrange(len(scripts)):
     file.write("script_%s = %d\n"%(convert_to_identifier(scripts[i_script][0]),i_script))
   file.write("\n\n")
   file.close()
 
 
-print "Exporting scripts..."
-save_python_header()
-variable_uses = []
-variables = load_variables(export_dir, variable_uses)
-tag_uses = load_tag_uses(export_dir)
-quick_strings = load_quick_strings(export_dir)
-save_scripts(variables,variable_uses,scripts,tag_uses,quick_strings)
-save_variables(export_dir,variables,variable_uses)
-save_tag_uses(export_dir, tag_uses)
-save_quick_strings(export_dir,quick_strings)
+def export(tables):
+  print("Exporting scripts...")
+  save_python_header()
+  save_scripts(tables.variables,scripts,tables.tag_uses,tables.quick_strings,tables.encode_jobs)
+
+if __name__ == "__main__":
+  tables = BuildTables(export_dir)
+  export(tables)
+  tables.save()
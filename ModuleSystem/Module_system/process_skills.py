@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 from header_common import *
 from module_info import *
@@ -12,21 +14,25 @@ skill_desc_pos = 4
 
 
 def save_skills():
-  ofile = open(export_dir + "skills.txt","w")
+  ofile = open_output(export_dir + "skills.txt")
   ofile.write("%d\n"%(len(skills)))
   for i_skill in xrange(len(skills)):
     skill = skills[i_skill]
     ofile.write("skl_%s %s "%(skill[0], replace_spaces(skill[1])))
-    ofile.write("%d %d %s\n"%(skill[skill_attribute_pos],skill[skill_max_level_pos],(string.replace(skill[skill_desc_pos]," ","_"))))
+    ofile.write("%d %d %s\n"%(skill[skill_attribute_pos],skill[skill_max_level_pos],(skill[skill_desc_pos].replace(" ","_"))))
   ofile.close()
 
 def save_python_header():
-  ofile = open("./ID_skills.py","w")
+  ofile = open_output("./ID_skills.py")
   for i_skill in xrange(len(skills)):
     ofile.write("skl_%s = %d\n"%(skills[i_skill][0],i_skill))
   ofile.write("\n\n")
   ofile.close()
 
-print "Exporting skills..."
-save_python_header()
-save_skills()
+def export(tables = None):
+  print("Exporting skills...")
+  save_python_header()
+  save_skills()
+
+if __name__ == "__main__":
+  export()
@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 from process_common import *
 from module_info import *
@@ -11,7 +13,7 @@ num_voice_types = 2
 
 
 def replace_spaces(s0):
-  return string.replace(s0," ","_")
+  return s0.replace(" ","_")
 
 
 def write_face_tex(ofile,tex_set):
@@ -42,7 +44,7 @@ def write_voices(ofile, voices):
   ofile.write("\n")
     
 def export_skins(skins):
-  ofile = open(export_dir + "skins.txt","w")
+  ofile = open_output(export_dir + "skins.txt")
   ofile.write("skins_file version 1\n")
   if len(skins) > 16:
     skins = skins[0:15]
@@ -101,5 +103,9 @@ def export_skins(skins):
     ofile.write("\n")
   ofile.close()
 
-print "Exporting skins..."
-export_skins(skins)
+def export(tables = None):
+  print("Exporting skins...")
+  export_skins(skins)
+
+if __name__ == "__main__":
+  export()
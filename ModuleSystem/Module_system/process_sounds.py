@@ -1,16 +1,20 @@
+from __future__ import print_function
+
 from header_common import *
 from module_info import *
 from module_sounds import *
 
+from process_common import *
+
 def write_python_header(sounds):
-  file = open("./ID_sounds.py","w")
+  file = open_output("./ID_sounds.py")
   for i_sound in xrange(len(sounds)):
     file.write("snd_%s = %d\n"%(sounds[i_sound][0],i_sound))
   file.write("\n\n")
   file.close()
 
 def write_sounds(sound_samples, sounds):
-  ofile = open(export_dir + "sounds.txt","w")
+  ofile = open_output(export_dir + "sounds.txt")
   ofile.write("soundsfile version 3\n")
   ofile.write("%d\n"%len(sound_samples))
   for sound_sample in sound_samples:
@@ -26,9 +30,11 @@ def write_sounds(sound_samples, sounds):
 
 def compile_sounds(sounds):
   all_sounds = []
+  compiled_sounds = []
   for sound in sounds:
     sound_files = sound[2]
     sound_flags = sound[1]
+    compiled_files = []
     for i_sound_file in xrange(len(sound_files)):
       sound_file = sound_files[i_sound_file]
       if (type(sound_file) != type([])):
@@ -43,10 +49,15 @@ def compile_sounds(sounds):
       if not found:
         all_sounds.append((sound_file[0], sound_flags))
         sound_no = len(all_sounds) - 1
-      sound_files[i_sound_file] = [sound_no, sound_file[1]]
-  return all_sounds
+      compiled_files.append([sound_no, sound_file[1]])
+    compiled_sounds.append((sound[0], sound[1], compiled_files))
+  return (all_sounds, compiled_sounds)
+
+def export(tables = None):
+  print("Exporting sounds...")
+  (sound_samples, compiled_sounds) = compile_sounds(sounds)
+  write_sounds(sound_samples, compiled_sounds)
+  write_python_header(sounds)
 
-print "Exporting sounds..."
-sound_samples = compile_sounds(sounds)
-write_sounds(sound_samples, sounds)
-write_python_header(sounds)
+if __name__ == "__main__":
+  export()
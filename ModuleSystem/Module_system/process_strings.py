@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 from header_common import *
 from module_info import *
@@ -6,7 +8,7 @@ from module_strings import *
 from process_common import *
 
 def save_strings(strings):
-  ofile = open(export_dir + "strings.txt","w")
+  ofile = open_output(export_dir + "strings.txt")
   ofile.write("stringsfile version 1\n")
   ofile.write("%d\n"%len(strings))
   for i_string in xrange(len(strings)):
@@ -15,13 +17,16 @@ def save_strings(strings):
   ofile.close()
 
 def save_python_header():
-  ofile = open("./ID_strings.py","w")
+  ofile = open_output("./ID_strings.py")
   for i_string in xrange(len(strings)):
     ofile.write("str_%s = %d\n"%(convert_to_identifier(strings[i_string][0]),i_string))
   ofile.write("\n\n")
   ofile.close()
 
-print "Exporting strings..."
-save_python_header()
-save_strings(strings)
-  
+def export(tables = None):
+  print("Exporting strings...")
+  save_python_header()
+  save_strings(strings)
+
+if __name__ == "__main__":
+  export()
@@ -1,3 +1,5 @@
+from __future__ import print_function
+
 import string
 
 from module_info import *
@@ -10,7 +12,7 @@ from process_common import *
 num_face_numeric_keys = 4
 
 def save_troops():
-  file = open(export_dir + "troops.txt","w")
+  file = open_output(export_dir + "troops.txt")
   file.write("troopsfile version 2\n")
   file.write("%d "%len(troops))
   for troop in troops:
@@ -27,7 +29,7 @@ def save_troops():
       troop[15:15] = [0]
     if (troop[4] > 0):
 #      add_tag_use(tag_uses,tag_scene,troop[4] & tsf_site_id_mask)
-      id_no = find_object(troops,convert_to_identifier(troop[0]))
+      id_no = find_object(troops,convert_to_identifier(troop[0]),"trp")
 #      if (id_no >= 0):  add_tag_use(tag_uses,tag_troop,id_no)
 #    if (troop[6] > 0):  add_tag_use(tag_uses,tag_faction,troop[6])
 
@@ -96,16 +98,21 @@ def two_to_pow(x):
   return result
 
 def save_python_header():
-  file = open("./ID_troops.py","w")
+  file = open_output("./ID_troops.py")
   for i_troop in xrange(len(troops)):
     file.write("trp_%s = %d\n"%(convert_to_identifier(troops[i_troop][0]),i_troop))
   file.close()
 
-print "Exporting troops data"
-#tag_uses = load_tag_uses(export_dir)
-save_python_header()
-save_troops()
-#save_tag_uses(export_dir, tag_uses)
+def export(tables = None):
+  print("Exporting troops data")
+  #tag_uses = load_tag_uses(export_dir)
+  save_python_header()
+  save_troops()
+  #save_tag_uses(export_dir, tag_uses)
+
+if __name__ == "__main__":
+  export()
+
 #print "Generating C header..."
 #save_c_header()
 #print "Generating Python header..."